@@ -108,3 +108,5 @@ DEFAULT_CHUNK_SIZE = 1000000
 ColumnCapitalization = Literal["upper", "lower", "original"]
 DEFAULT_SCHEMA = "tmp_transfers"
 IAM_ROLE_ACTIVATION_WAIT_TIME = 60
+# Key of ``DataFrame.attrs`` holding the partition of the source table a dataframe was read from
+PARTITION_ATTRIBUTE = "partition"
@@ -3,14 +3,12 @@ from __future__ import annotations
 import importlib
 from typing import Type, cast
 
-from airflow.hooks.base import BaseHook
-
 from universal_transfer_operator.constants import TransferMode
 from universal_transfer_operator.data_providers.base import DataProviders
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
-from universal_transfer_operator.utils import get_class_name
+from universal_transfer_operator.utils import get_class_name, get_connection
 
 DATASET_CONN_ID_TO_DATAPROVIDER_MAPPING = {
     ("s3", File): "universal_transfer_operator.data_providers.filesystem.aws.s3",
@@ -48,7 +46,7 @@ def get_dataprovider_class(dataset: Table | File) -> type[DataProviders]:
     """
     conn_type = None
     if dataset.conn_id:
-        conn_type = BaseHook.get_connection(dataset.conn_id).conn_type
+        conn_type = get_connection(dataset.conn_id).conn_type
     module_path = DATASET_CONN_ID_TO_DATAPROVIDER_MAPPING[(conn_type, type(dataset))]
     module = importlib.import_module(module_path)
     class_name = get_class_name(module_ref=module, suffix="DataProvider")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
+import shutil
+import tempfile
 from abc import ABC
 from pathlib import Path
-from typing import Generic, Iterator, TypeVar
+from typing import IO, Any, Callable, Generic, Iterator, TypeVar
 
 import attr
 import pandas as pd
@@ -13,6 +15,7 @@ from universal_transfer_operator.constants import Location
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
+from universal_transfer_operator.settings import STREAM_COPY_BLOCK_SIZE, STREAM_SPILL_TO_DISK_THRESHOLD
 from universal_transfer_operator.utils import get_dataset_connection_type
 
 DatasetType = TypeVar("DatasetType", File, Table)
@@ -20,9 +23,64 @@ DatasetType = TypeVar("DatasetType", File, Table)
 
 @attr.define
 class DataStream:
-    remote_obj_buffer: io.IOBase
+    """
+    Content of a file read from the source dataset.
+
+    The content is not loaded in memory: the stream is opened with ``opener`` the first time ``remote_obj_buffer``
+    is accessed and is meant to be consumed in blocks, e.g. with ``copy_to()``.
+
+    :param actual_filename: Path of the file read
+    :param actual_file: File dataset the file belongs to
+    :param remote_obj_buffer: Already opened file-like object with the content of the file
+    :param opener: Callable opening the file and returning a file-like object, used when remote_obj_buffer is not passed
+    """
+
     actual_filename: Path
     actual_file: File
+    _remote_obj_buffer: IO[Any] | None = None
+    opener: Callable[[], IO[Any]] | None = None
+
+    @property
+    def remote_obj_buffer(self) -> IO[Any]:
+        """File-like object with the content of the file, opened on first access"""
+        if self._remote_obj_buffer is None:
+            if self.opener is None:
+                raise ValueError(f"No buffer or opener passed for {self.actual_filename}")
+            self._remote_obj_buffer = self.opener()
+        return self._remote_obj_buffer
+
+    def copy_to(self, destination: IO, block_size: int = STREAM_COPY_BLOCK_SIZE) -> None:
+        """
+        Copy the content of the file to ``destination`` in blocks, so that memory usage doesn't depend on file size.
+
+        :param destination: File-like object to write to
+        :param block_size: Size of the blocks read from the source and written to the destination
+        """
+        try:
+            shutil.copyfileobj(self.remote_obj_buffer, destination, block_size)
+        finally:
+            self.close()
+
+    def as_seekable(self, max_size: int = STREAM_SPILL_TO_DISK_THRESHOLD) -> IO:
+        """
+        Return a seekable file-like object with the content of the file, for consumers that need random access.
+        Files bigger than ``max_size`` bytes are spilled to a temporary file on disk instead of being kept in memory.
+
+        :param max_size: Max size of the file kept in memory
+        """
+        if self.remote_obj_buffer.seekable():
+            return self.remote_obj_buffer
+        mode = "w+" if isinstance(self.remote_obj_buffer, io.TextIOBase) else "w+b"
+        spooled_file = tempfile.SpooledTemporaryFile(max_size=max_size, mode=mode)  # skipcq: PTC-W6004
+        self.copy_to(spooled_file)
+        spooled_file.seek(0)
+        return spooled_file
+
+    def close(self) -> None:
+        """Close the file-like object if it was opened by the opener"""
+        if self.opener is not None and self._remote_obj_buffer is not None:
+            self._remote_obj_buffer.close()
+            self._remote_obj_buffer = None
 
 
 class DataProviders(ABC, Generic[DatasetType]):
@@ -76,6 +134,16 @@ class DataProviders(ABC, Generic[DatasetType]):
         """
         raise NotImplementedError
 
+    def __enter__(self) -> DataProviders:
+        """
+        Start a transfer to the dataset: the items written until the exit, e.g. the chunks of a table, make up the
+        dataset instead of replacing each other.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:  # skipcq: PTC-W0049
+        """Complete the transfer to the dataset"""
+
     @property
     def openlineage_dataset_namespace(self) -> str:
         """
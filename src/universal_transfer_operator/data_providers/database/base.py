@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlalchemy.engine.cursor import CursorResult
 
 import logging
+import threading
 import warnings
 
 from airflow.hooks.dbapi import DbApiHook
@@ -18,21 +20,28 @@ from sqlalchemy.sql.schema import Table as SqlaTable
 
 from universal_transfer_operator.constants import (
     DEFAULT_CHUNK_SIZE,
+    PARTITION_ATTRIBUTE,
     LoadExistStrategy,
     Location,
     TransferMode,
 )
 from universal_transfer_operator.data_providers.base import DataProviders, DataStream
-from universal_transfer_operator.data_providers.filesystem import resolve_file_path_pattern
+from universal_transfer_operator.data_providers.database.partitioning import (
+    partition_predicates,
+    split_range,
+)
+from universal_transfer_operator.data_providers.filesystem import iter_file_path_pattern
 from universal_transfer_operator.datasets.dataframe.pandas import PandasDataframe
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Metadata, Table
 from universal_transfer_operator.settings import (
     LOAD_TABLE_AUTODETECT_ROWS_COUNT,
     SCHEMA,
+    SQL_POOL_PRE_PING,
+    SQL_POOL_SIZE,
 )
 from universal_transfer_operator.universal_transfer_operator import TransferIntegrationOptions
-from universal_transfer_operator.utils import get_dataset_connection_type
+from universal_transfer_operator.utils import get_cached, get_dataset_connection_type, interleave
 
 
 class DatabaseDataProvider(DataProviders[Table]):
@@ -69,6 +78,9 @@ class DatabaseDataProvider(DataProviders[Table]):
         super().__init__(
             dataset=self.dataset, transfer_mode=self.transfer_mode, transfer_params=self.transfer_params
         )
+        self._transfer_in_progress = False
+        self._dataframes_written = False
+        self._first_write_lock = threading.Lock()
 
     def __repr__(self):
         return f'{self.__class__.__name__}(conn_id="{self.dataset.conn_id})'
@@ -84,13 +96,38 @@ class DatabaseDataProvider(DataProviders[Table]):
 
     @property
     def connection(self) -> sqlalchemy.engine.base.Connection:
-        """Return a Sqlalchemy connection object for the given database."""
+        """
+        Return a Sqlalchemy connection object for the given database, checked out of the engine pool. The caller
+        is responsible for closing it, to return it to the pool.
+        """
         return self.sqlalchemy_engine.connect()
 
     @property
     def sqlalchemy_engine(self) -> sqlalchemy.engine.base.Engine:
-        """Return Sqlalchemy engine."""
-        return self.hook.get_sqlalchemy_engine()  # type: ignore[no-any-return]
+        """
+        Return Sqlalchemy engine. The engine and its connection pool are shared by all the data providers of the
+        connection until the end of the transfer.
+        """
+        return get_cached(self.get_cache_key("engine"), self.create_sqlalchemy_engine)
+
+    def create_sqlalchemy_engine(self) -> sqlalchemy.engine.base.Engine:
+        """Create the Sqlalchemy engine of the connection, see ``sqlalchemy_engine``."""
+        return self.hook.get_sqlalchemy_engine(engine_kwargs=self.engine_kwargs)  # type: ignore[no-any-return]
+
+    @property
+    def engine_kwargs(self) -> dict[str, Any]:  # skipcq: PYL-R0201
+        """Arguments of the Sqlalchemy engine configuring its connection pool."""
+        return {"pool_size": SQL_POOL_SIZE, "pool_pre_ping": SQL_POOL_PRE_PING}
+
+    def get_cache_key(self, name: str) -> tuple:
+        """
+        Key of the hooks and engines cached for the connection of the dataset. It includes the database and schema
+        of the table, since some hooks connect to them by default.
+
+        :param name: Name of the cached object, e.g. ``hook`` or ``engine``
+        """
+        metadata = self.dataset.metadata or Metadata()
+        return name, self.__class__.__name__, self.dataset.conn_id, metadata.database, metadata.schema
 
     @property
     def transport_params(self) -> dict | None:  # skipcq: PYL-R0201
@@ -137,14 +174,15 @@ class DatabaseDataProvider(DataProviders[Table]):
 
         # We need to autocommit=True to make sure the query runs. This is done exclusively for SnowflakeDatabase's
         # truncate method to reflect changes.
-        if isinstance(sql, str):
-            result = self.connection.execute(
-                sqlalchemy.text(sql).execution_options(autocommit=True), parameters
-            )
-        else:
-            result = self.connection.execute(sql, parameters)
-        if handler:
-            return handler(result)
+        with self.sqlalchemy_engine.connect() as connection:
+            if isinstance(sql, str):
+                result = connection.execute(
+                    sqlalchemy.text(sql).execution_options(autocommit=True), parameters
+                )
+            else:
+                result = connection.execute(sql, parameters)
+            if handler:
+                return handler(result)
         return None
 
     def columns_exist(self, table: Table, columns: list[str]) -> bool:
@@ -182,7 +220,8 @@ class DatabaseDataProvider(DataProviders[Table]):
         """
         table_qualified_name = self.get_table_qualified_name(table)
         inspector = sqlalchemy.inspect(self.sqlalchemy_engine)
-        return bool(inspector.dialect.has_table(self.connection, table_qualified_name))
+        with self.sqlalchemy_engine.connect() as connection:
+            return bool(inspector.dialect.has_table(connection, table_qualified_name))
 
     def check_if_transfer_supported(self, source_dataset: Table) -> bool:
         """
@@ -193,31 +232,151 @@ class DatabaseDataProvider(DataProviders[Table]):
         source_connection_type = get_dataset_connection_type(source_dataset)
         return Location(source_connection_type) in self.transfer_mapping
 
-    def read(self) -> Iterator[pd.DataFrame]:
-        """Convert a Table into a Pandas DataFrame"""
+    def read(self) -> Iterator[pd.DataFrame | Table]:
+        """
+        Convert a Table into Pandas DataFrames, of ``transfer_params.chunk_size`` rows each if set or a single one
+        otherwise. The table is read by concurrent queries when ``transfer_params.partition_column`` is set.
+        In native mode, the table itself is returned, to be transferred by the destination without being read.
+        """
         if self.transfer_mode == TransferMode.NATIVE:
-            raise ValueError("No native path for `database` to destination")
+            yield self.dataset
+            return
+        chunk_size = getattr(self.transfer_params, "chunk_size", None)
+        partition_column = getattr(self.transfer_params, "partition_column", None)
+        if partition_column:
+            yield from self.export_table_to_pandas_dataframe_partitions(
+                column=partition_column,
+                partitions=self.transfer_params.partitions,
+                bounds=self.transfer_params.partition_bounds,
+                chunk_size=chunk_size,
+            )
+        elif chunk_size:
+            yield from self.export_table_to_pandas_dataframe_chunks(chunk_size=chunk_size)
         else:
             yield self.export_table_to_pandas_dataframe()
 
-    def write(self, source_ref: DataStream | pd.DataFrame) -> str:
+    def write(self, source_ref: DataStream | pd.DataFrame | pa.Table | Table) -> str:
         """
         Write the data from local reference location or dataframe to the database dataset or filesystem dataset.
 
-        :param source_ref: Stream of data to be loaded into output table or a pandas dataframe.
+        :param source_ref: Stream of data to be loaded into output table, a pandas dataframe, an Arrow table or a
+            table of the same connection in native mode.
         """
+        if isinstance(source_ref, Table):
+            return self.transfer_table_natively(
+                source_table=source_ref, target_table=self.dataset, if_exists=self.if_exists
+            )
         # `source_ref` can be a dataframe for all the filetypes we can create a dataframe for like -
         # CSV, JSON, NDJSON, and Parquet or SQL Tables. This gives us the option to perform various
         # functions on the data on the fly, like filtering or changing the file format altogether. For other
         # files whose content cannot be converted to dataframe like - zip or image, we get a DataStream object.
         if isinstance(source_ref, DataStream):
             return self.load_file_to_table(
-                input_file=source_ref.actual_file, output_table=self.dataset, if_exists=self.if_exists
+                input_file=source_ref.actual_file,
+                output_table=self.dataset,
+                if_exists=self.if_exists,
+                chunk_size=getattr(self.transfer_params, "chunk_size", None) or DEFAULT_CHUNK_SIZE,
             )
+        if isinstance(source_ref, pa.Table):
+            # Rows are inserted from pandas dataframes
+            source_ref = source_ref.to_pandas()
+        if not self._transfer_in_progress:
+            return self.load_dataframe_to_table(
+                input_dataframe=source_ref, output_table=self.dataset, if_exists=self.if_exists
+            )
+        # The first dataframe of the transfer applies `if_exists`, the next chunks are appended to it. The other
+        # writers wait for the first one to have created the table.
+        with self._first_write_lock:
+            if not self._dataframes_written:
+                table_name = self.load_dataframe_to_table(
+                    input_dataframe=source_ref, output_table=self.dataset, if_exists=self.if_exists
+                )
+                self._dataframes_written = True
+                return table_name
         return self.load_dataframe_to_table(
-            input_dataframe=source_ref, output_table=self.dataset, if_exists=self.if_exists
+            input_dataframe=source_ref, output_table=self.dataset, if_exists="append"
         )
 
+    def is_native_path_available(self, source_dataset: File | Table) -> bool:
+        """
+        Check if there is an optimised path for source to destination. Tables of the same connection are
+        transferred inside the database.
+
+        :param source_dataset: File | Table from which we need to transfer data
+        """
+        return isinstance(source_dataset, Table) and source_dataset.conn_id == self.dataset.conn_id
+
+    def transfer_table_natively(
+        self,
+        source_table: Table,
+        target_table: Table,
+        if_exists: LoadExistStrategy = "replace",
+    ) -> str:
+        """
+        Transfer the rows of a table of the same connection without reading them in the worker. The target table is
+        created by a ``CREATE TABLE AS SELECT`` statement when it is replaced or doesn't exist, otherwise the rows
+        are appended by an ``INSERT INTO ... SELECT`` statement, matching the columns by name.
+
+        :param source_table: Table of the same connection the rows are read from
+        :param target_table: Table the rows are written to
+        :param if_exists: Strategy to be used in case the target table already exists.
+        """
+        source_table_name = self.get_table_qualified_name(source_table)
+        target_table_name = self.get_table_qualified_name(target_table)
+        if source_table_name == target_table_name:
+            raise ValueError(f"The table {source_table_name} can't be transferred to itself")
+
+        if if_exists == "replace" or not self.table_exists(target_table):
+            self.drop_table(target_table)
+            self.create_schema_if_needed(target_table.metadata.schema)
+            self.create_table_from_select_statement(
+                f"SELECT * FROM {source_table_name}", target_table  # skipcq: BAN-B608
+            )
+        else:
+            source_sqla_table = self.get_sqla_table(source_table)
+            target_sqla_table = self.get_sqla_table(target_table)
+            columns = [
+                column.name for column in target_sqla_table.columns if column.name in source_sqla_table.c
+            ]
+            self.run_sql(
+                target_sqla_table.insert().from_select(
+                    columns, sqlalchemy.select([source_sqla_table.c[column] for column in columns])
+                )
+            )
+        return target_table_name
+
+    def is_native_unload_available(self, target_file: File) -> bool:  # skipcq: PYL-R0201
+        """
+        Check if the table can be exported to the file by the database, without being read in the worker.
+
+        :param target_file: File the table would be exported to
+        """
+        return False
+
+    def export_table_to_file_natively(self, source_table: Table, target_file: File) -> list[str]:
+        """
+        Export the table to the file, or to files in the folder when the file is a prefix, without reading it in the
+        worker, see ``is_native_unload_available``.
+
+        :param source_table: Table to be exported
+        :param target_file: File, or prefix of the files, the table is exported to
+        :return: Paths of the files written
+        """
+        raise NotImplementedError
+
+    def __enter__(self) -> DatabaseDataProvider:
+        """
+        Start a transfer to the table: the dataframes written until the exit, e.g. the chunks of a table, are
+        appended to each other instead of replacing the table.
+        """
+        self._transfer_in_progress = True
+        self._dataframes_written = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Complete the transfer to the table"""
+        self._transfer_in_progress = False
+
     def load_dataframe_to_table(
         self,
         input_dataframe: pd.DataFrame,
@@ -480,17 +639,19 @@ class DatabaseDataProvider(DataProviders[Table]):
 
         self.create_schema_if_needed(table.metadata.schema)
         if if_exists == "replace" or not self.table_exists(table):
-            files = resolve_file_path_pattern(
-                file,
-                normalize_config=normalize_config,
-                filetype=file.type.name,
-                transfer_params=self.transfer_params,
-                transfer_mode=self.transfer_mode,
+            # We only use the first file for inferring the table schema, there is no need to list the others
+            first_file = next(
+                iter_file_path_pattern(
+                    file,
+                    normalize_config=normalize_config,
+                    filetype=file.type.name,
+                    transfer_params=self.transfer_params,
+                    transfer_mode=self.transfer_mode,
+                )
             )
             self.create_table(
                 table,
-                # We only use the first file for inferring the table schema
-                files[0],
+                first_file,
                 use_native_support=use_native_support,
             )
 
@@ -606,7 +767,7 @@ class DatabaseDataProvider(DataProviders[Table]):
         if_exists: LoadExistStrategy = "replace",
         chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
-        input_files = resolve_file_path_pattern(
+        input_files = iter_file_path_pattern(
             file=input_file,
             normalize_config=normalize_config,
             filetype=input_file.type.name,
@@ -614,13 +775,16 @@ class DatabaseDataProvider(DataProviders[Table]):
             transfer_mode=self.transfer_mode,
         )
 
+        # `if_exists` applies to the first dataframe, the next ones are appended to it
         for file in input_files:
-            self.load_pandas_dataframe_to_table(
-                self.get_dataframe_from_file(file),
-                output_table,
-                chunk_size=chunk_size,
-                if_exists=if_exists,
-            )
+            for dataframe in self.get_dataframes_from_file(file, chunk_rows=chunk_size):
+                self.load_pandas_dataframe_to_table(
+                    dataframe,
+                    output_table,
+                    chunk_size=chunk_size,
+                    if_exists=if_exists,
+                )
+                if_exists = "append"
 
     def load_pandas_dataframe_to_table(
         self,
@@ -659,17 +823,15 @@ class DatabaseDataProvider(DataProviders[Table]):
             raise ValueError("Can't load empty dataframe")
 
     @staticmethod
-    def get_dataframe_from_file(file: File):
+    def get_dataframes_from_file(file: File, chunk_rows: int) -> Iterator[pd.DataFrame]:
         """
-        Get pandas dataframe file. We need export_to_dataframe() for Biqqery,Snowflake and Redshift except for Postgres.
-        For postgres we are overriding this method and using export_to_dataframe_via_byte_stream().
-        export_to_dataframe_via_byte_stream copies files in a buffer and then use that buffer to ingest data.
-        With this approach we have significant performance boost for postgres.
+        Get the pandas dataframes of a file, of up to ``chunk_rows`` rows each for the file types which can be parsed
+        incrementally, so that loading a file holds a single chunk in memory.
 
         :param file: File path and conn_id for object stores
+        :param chunk_rows: Maximum number of rows of each dataframe
         """
-
-        return file.export_to_dataframe()
+        return file.iter_dataframes(chunk_rows=chunk_rows)
 
     def check_schema_autodetection_is_supported(  # skipcq: PYL-R0201
         self, source_file: File  # skipcq: PYL-W0613
@@ -745,3 +907,80 @@ class DatabaseDataProvider(DataProviders[Table]):
         sqla_table = self.get_sqla_table(self.dataset)
         df = pd.read_sql(sql=sqla_table.select(), con=self.sqlalchemy_engine)
         return PandasDataframe.from_pandas_df(df)
+
+    def export_table_to_pandas_dataframe_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Copy the content of a table to in-memory Pandas dataframes of ``chunk_size`` rows, one at a time. Rows are
+        fetched with a server side cursor where the database supports it, so only a chunk is held in memory.
+
+        :param chunk_size: Number of rows of each dataframe
+        """
+        if not self.table_exists(self.dataset):
+            raise ValueError(f"The table {self.dataset.name} does not exist")
+
+        sqla_table = self.get_sqla_table(self.dataset)
+        with self.sqlalchemy_engine.connect() as connection:
+            streaming_connection = connection.execution_options(stream_results=True)
+            for df in pd.read_sql(sql=sqla_table.select(), con=streaming_connection, chunksize=chunk_size):
+                yield PandasDataframe.from_pandas_df(df)
+
+    def export_table_to_pandas_dataframe_partitions(
+        self,
+        column: str,
+        partitions: int,
+        bounds: tuple[Any, Any] | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Copy the content of a table to in-memory Pandas dataframes, reading ranges of ``column`` with concurrent
+        queries, each on its own connection of the engine pool, up to ``sql_pool_size`` at a time. The dataframes
+        are yielded as they are read, with the index of their range in ``DataFrame.attrs[PARTITION_ATTRIBUTE]``.
+
+        :param column: Numeric or date column the table is split on
+        :param partitions: Number of ranges read concurrently
+        :param bounds: Lower and upper values of ``column`` the ranges are computed from. Default to the minimum
+            and maximum values of the column
+        :param chunk_size: Number of rows of each dataframe. Default None, a dataframe per range
+        """
+        if not self.table_exists(self.dataset):
+            raise ValueError(f"The table {self.dataset.name} does not exist")
+
+        engine = self.sqlalchemy_engine
+        sqla_table = self.get_sqla_table(self.dataset)
+        if column not in sqla_table.c:
+            raise ValueError(f"The partition column {column} does not exist in the table {self.dataset.name}")
+        sqla_column = sqla_table.c[column]
+        if bounds is None:
+            with engine.connect() as connection:
+                query = sqlalchemy.select(
+                    [sqlalchemy.func.min(sqla_column), sqlalchemy.func.max(sqla_column)]
+                )
+                lower, upper = connection.execute(query).first()
+        else:
+            lower, upper = bounds
+        predicates = partition_predicates(sqla_column, split_range(lower, upper, partitions=partitions))
+        logging.info("Reading %s in %d partitions of %s", self.dataset.name, len(predicates), column)
+        readers = [
+            self._read_partition(engine, sqla_table.select().where(predicate), index, chunk_size)
+            for index, predicate in enumerate(predicates)
+        ]
+        # Partitions beyond the size of the connection pool wait for a reader to complete
+        yield from interleave(
+            readers, max_workers=min(len(readers), SQL_POOL_SIZE), max_prefetch=len(readers)
+        )
+
+    @staticmethod
+    def _read_partition(
+        engine: sqlalchemy.engine.base.Engine, query: ClauseElement, index: int, chunk_size: int | None
+    ) -> Iterator[pd.DataFrame]:
+        """Read the rows of a partition into dataframes of ``chunk_size`` rows, or a single one"""
+        with engine.connect() as connection:
+            if chunk_size:
+                streaming_connection = connection.execution_options(stream_results=True)
+                dataframes = pd.read_sql(sql=query, con=streaming_connection, chunksize=chunk_size)
+            else:
+                dataframes = [pd.read_sql(sql=query, con=connection)]
+            for df in dataframes:
+                df = PandasDataframe.from_pandas_df(df)
+                df.attrs[PARTITION_ATTRIBUTE] = index
+                yield df
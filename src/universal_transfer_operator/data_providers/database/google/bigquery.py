@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import Callable, Mapping
+from typing import Any, Callable, Mapping, cast
 
 import attr
 import pandas as pd
@@ -36,6 +36,7 @@ from universal_transfer_operator.datasets.table import Metadata, Table
 from universal_transfer_operator.exceptions import DatabaseCustomError
 from universal_transfer_operator.settings import BIGQUERY_SCHEMA, BIGQUERY_SCHEMA_LOCATION
 from universal_transfer_operator.universal_transfer_operator import TransferIntegrationOptions
+from universal_transfer_operator.utils import get_cached
 
 DEFAULT_CONN_ID = BigQueryHook.default_conn_name
 NATIVE_PATHS_SUPPORTED_FILE_TYPES = {
@@ -100,16 +101,19 @@ class BigqueryDataProvider(DatabaseDataProvider):
     @property
     def hook(self) -> BigQueryHook:
         """Retrieve Airflow hook to interface with Bigquery."""
+        return get_cached(self.get_cache_key("hook"), self._create_hook)
+
+    def _create_hook(self) -> BigQueryHook:
+        """Create the hook of the connection, see ``hook``"""
         return BigQueryHook(
             gcp_conn_id=self.dataset.conn_id, use_legacy_sql=False, location=BIGQUERY_SCHEMA_LOCATION
         )
 
-    @property
-    def sqlalchemy_engine(self) -> Engine:
-        """Return SQAlchemy engine."""
+    def create_sqlalchemy_engine(self) -> Engine:
+        """Create SQAlchemy engine."""
         uri = self.hook.get_uri()
         with self.hook.provide_gcp_credential_file_as_context():
-            return create_engine(uri)
+            return create_engine(uri, **self.engine_kwargs)
 
     @property
     def default_metadata(self) -> Metadata:
@@ -234,12 +238,13 @@ class BigqueryDataProvider(DatabaseDataProvider):
 
     def is_native_path_available(self, source_dataset: File | Table) -> bool:
         """
-        Check if there is an optimised path for source to destination.
+        Check if there is an optimised path for source to destination. Tables of the same connection are
+        transferred inside BigQuery.
 
-        :param source_dataset: File from which we need to transfer data
+        :param source_dataset: File | Table from which we need to transfer data
         """
         if isinstance(source_dataset, Table):
-            return False
+            return super().is_native_path_available(source_dataset)
         file_type = NATIVE_PATHS_SUPPORTED_FILE_TYPES.get(source_dataset.type.name)
         location_type = self.NATIVE_PATHS.get(source_dataset.location.location_type)
         return bool(location_type and file_type)
@@ -274,7 +279,6 @@ class BigqueryDataProvider(DatabaseDataProvider):
             **kwargs,
         )
 
-
     def load_gs_file_to_table(
         self,
         source_file: File,
@@ -406,6 +410,62 @@ class BigqueryDataProvider(DatabaseDataProvider):
             )
         job.result()
 
+    def is_native_unload_available(self, target_file: File) -> bool:
+        """
+        Check if the table can be exported to the file by the database, without being read in the worker. Tables
+        are extracted to CSV, NDJSON and parquet files in GCS.
+
+        :param target_file: File the table would be exported to
+        """
+        try:
+            file_type = NATIVE_PATHS_SUPPORTED_FILE_TYPES.get(target_file.type.name)
+        except ValueError:
+            return False
+        return bool(file_type) and target_file.location.location_type == FileLocation.GS
+
+    def export_table_to_file_natively(self, source_table: Table, target_file: File) -> list[str]:
+        """
+        Export the content of a table to GCS by an extract job. When the file is a prefix, e.g. ``gs://bucket/folder/``,
+        the table is sharded by BigQuery in files named after the table and numbered from ``000000000000``.
+        Otherwise it is exported to the file itself, which can't be bigger than 1 GB, unless its path has a ``*``
+        wildcard.
+
+        :param source_table: Table to be exported
+        :param target_file: File, or prefix of the files, the table is exported to
+        :return: Paths of the files written
+        """
+        file_type = target_file.type.name
+        destination_uri = target_file.path
+        if target_file.is_pattern():
+            if destination_uri.endswith("/"):
+                destination_uri += f"{source_table.name}_"
+            destination_uri += f"*.{file_type.value}"
+
+        extract_job_config: dict[str, Any] = {
+            "sourceTable": {
+                "projectId": self.get_project_id(source_table),
+                "datasetId": source_table.metadata.schema,
+                "tableId": source_table.name,
+            },
+            "destinationUris": [destination_uri],
+            "destinationFormat": NATIVE_PATHS_SUPPORTED_FILE_TYPES[file_type],
+        }
+        if file_type == FileType.CSV:
+            extract_job_config["printHeader"] = True
+
+        job_config = {
+            "jobType": "EXTRACT",
+            "extract": extract_job_config,
+            "labels": {"source_table": source_table.name},
+        }
+        job = cast(bigquery.ExtractJob, self.hook.insert_job(configuration=job_config))
+
+        if "*" not in destination_uri:
+            return [destination_uri]
+        # The wildcard is replaced by the number of each file, padded to 12 digits
+        (files_count,) = job.destination_uri_file_counts
+        return [destination_uri.replace("*", f"{number:012d}") for number in range(files_count)]
+
     @property
     def openlineage_dataset_name(self) -> str:
         """
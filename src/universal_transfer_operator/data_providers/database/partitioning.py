@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import datetime
+from decimal import Decimal
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.sql import ColumnElement
+
+
+def split_range(lower: Any, upper: Any, partitions: int) -> list[Any]:
+    """
+    Compute the values splitting ``[lower, upper]`` in up to ``partitions`` ranges of the same width. Integer
+    ranges are split on integers and date ranges on days, so fewer ranges are returned for narrow bounds.
+
+    :param lower: Lowest value of the range
+    :param upper: Highest value of the range
+    :param partitions: Number of ranges
+    :return: Sorted boundaries between the ranges, ``partitions - 1`` at most
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be greater than 0")
+    # No bounds when the table is empty or the column only has null values
+    if lower is None or upper is None or partitions == 1 or lower >= upper:
+        return []
+    if isinstance(lower, bool) or not isinstance(lower, (int, float, Decimal, datetime.date)):
+        raise ValueError(
+            f"Can't partition a table on values of type {type(lower).__name__}, the partition column must be"
+            " numeric or a date"
+        )
+    if isinstance(lower, int) and isinstance(upper, int):
+        boundaries = [lower + (upper - lower + 1) * index // partitions for index in range(1, partitions)]
+    else:
+        step = (upper - lower) / partitions
+        boundaries = [lower + step * index for index in range(1, partitions)]
+    return sorted({boundary for boundary in boundaries if lower < boundary <= upper})
+
+
+def partition_predicates(column: ColumnElement, boundaries: list[Any]) -> list[ColumnElement]:
+    """
+    Build the ``WHERE`` clauses selecting the ranges of ``column`` between ``boundaries``. Ranges include their
+    lower boundary and exclude the upper one, the first and last ones are unbounded so that every row, including
+    the ones with a null value, is selected exactly once.
+
+    :param column: Column the table is partitioned on
+    :param boundaries: Sorted boundaries between the ranges
+    """
+    edges = [None, *boundaries, None]
+    predicates = []
+    for start, end in zip(edges, edges[1:]):
+        conditions = []
+        if start is not None:
+            conditions.append(column >= start)
+        if end is not None:
+            conditions.append(column < end)
+        predicates.append(sqlalchemy.and_(*conditions) if conditions else sqlalchemy.true())
+    predicates[0] = sqlalchemy.or_(predicates[0], column.is_(None))
+    return predicates
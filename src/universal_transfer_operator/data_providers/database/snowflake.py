@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
 import random
 import string
+import tempfile
+import threading
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
-from typing import Sequence
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterator, Sequence
 from urllib.parse import urlparse
 
 import attr
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from airflow.providers.snowflake.hooks.snowflake import SnowflakeHook
-from snowflake.connector import pandas_tools
-from snowflake.connector.errors import (
-    ProgrammingError,
-)
+from snowflake.connector import DictCursor
 
 from universal_transfer_operator.constants import (
     DEFAULT_CHUNK_SIZE,
@@ -23,6 +28,7 @@ from universal_transfer_operator.constants import (
     LoadExistStrategy,
 )
 from universal_transfer_operator.data_providers.database.base import DatabaseDataProvider
+from universal_transfer_operator.data_providers.filesystem import iter_file_path_pattern
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Metadata, Table
 from universal_transfer_operator.exceptions import DatabaseCustomError
@@ -33,6 +39,7 @@ from universal_transfer_operator.settings import (
     SNOWFLAKE_STORAGE_INTEGRATION_GOOGLE,
 )
 from universal_transfer_operator.universal_transfer_operator import TransferIntegrationOptions
+from universal_transfer_operator.utils import get_cached, get_connection, imap_bounded
 
 DEFAULT_STORAGE_INTEGRATION = {
     FileLocation.S3: SNOWFLAKE_STORAGE_INTEGRATION_AMAZON,
@@ -53,6 +60,31 @@ NATIVE_LOAD_SUPPORTED_FILE_LOCATIONS = (
     FileLocation.S3,
 )
 
+# Maximum number of files loaded by a COPY INTO statement with FILES
+COPY_INTO_MAX_FILES = 1000
+
+# Maximum size of a file unloaded by COPY INTO with SINGLE = TRUE
+SNOWFLAKE_MAX_SINGLE_FILE_SIZE = 5 * 1024 * 1024 * 1024
+
+# Number of files uploaded in parallel to an internal stage by PUT
+DEFAULT_PUT_WORKERS = 4
+
+# Snowflake types of the columns created for the Arrow types, see ``arrow_type_to_snowflake``
+ARROW_TO_SNOWFLAKE_TYPES: list[tuple[Callable[[pa.DataType], bool], str]] = [
+    (pa.types.is_boolean, "BOOLEAN"),
+    (pa.types.is_integer, "NUMBER(38, 0)"),
+    (pa.types.is_floating, "FLOAT"),
+    (pa.types.is_date, "DATE"),
+    (pa.types.is_time, "TIME"),
+    (pa.types.is_binary, "BINARY"),
+    (pa.types.is_large_binary, "BINARY"),
+    (pa.types.is_fixed_size_binary, "BINARY"),
+    (pa.types.is_list, "ARRAY"),
+    (pa.types.is_large_list, "ARRAY"),
+    (pa.types.is_struct, "OBJECT"),
+    (pa.types.is_map, "OBJECT"),
+]
+
 
 @dataclass
 class SnowflakeStage:
@@ -152,12 +184,16 @@ class SnowflakeStage:
 class SnowflakeOptions(TransferIntegrationOptions):
     """
     Snowflake load option for naive transfer.
+
+    :param put_workers: Number of local files uploaded in parallel to an internal stage by ``PUT``, when loading
+        dataframes and local files. Default 4
     """
 
     file_options: dict = attr.field(factory=dict)
     copy_options: dict = attr.field(factory=dict)
     storage_integration: str | None = attr.field(default=None)
     validation_mode: str | None = attr.field(default=None)
+    put_workers: int = attr.field(default=DEFAULT_PUT_WORKERS)
 
 
 class SnowflakeDataProvider(DatabaseDataProvider):
@@ -180,10 +216,22 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         super().__init__(
             dataset=self.dataset, transfer_mode=self.transfer_mode, transfer_params=self.transfer_params
         )
+        # Stages created during the transfer by URL, file type and authentication, see ``stage_for``
+        self._stages: dict[tuple[str, FileType, str], SnowflakeStage] = {}
+        self._stages_lock = threading.Lock()
 
     def __repr__(self):
         return f'{self.__class__.__name__}(conn_id="{self.dataset.conn_id})'
 
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Complete the transfer to the table, dropping the stages created during the transfer"""
+        super().__exit__(exc_type, exc_value, traceback)
+        with self._stages_lock:
+            stages = list(self._stages.values())
+            self._stages.clear()
+        for stage in stages:
+            self.drop_stage(stage)
+
     @property
     def sql_type(self) -> str:
         return "snowflake"
@@ -191,25 +239,28 @@ class SnowflakeDataProvider(DatabaseDataProvider):
     @property
     def hook(self) -> SnowflakeHook:
         """Retrieve Airflow hook to interface with the Snowflake database."""
-        kwargs = {}
-        _hook = SnowflakeHook(snowflake_conn_id=self.dataset.conn_id)
+        return get_cached(self.get_cache_key("hook"), self._create_hook)
+
+    def _create_hook(self) -> SnowflakeHook:
+        """Create the hook, defaulting to the database and schema of the table when the connection has none"""
+        hook = SnowflakeHook(snowflake_conn_id=self.dataset.conn_id)
         if self.dataset and self.dataset.metadata:
-            if _hook.database is None and self.dataset.metadata.database:
-                kwargs.update({"database": self.dataset.metadata.database})
-            if _hook.schema is None and self.dataset.metadata.schema:
-                kwargs.update({"schema": self.dataset.metadata.schema})
-        return SnowflakeHook(snowflake_conn_id=self.dataset.conn_id, **kwargs)
+            if hook.database is None and self.dataset.metadata.database:
+                hook.database = self.dataset.metadata.database
+            if hook.schema is None and self.dataset.metadata.schema:
+                hook.schema = self.dataset.metadata.schema
+        return hook
 
     @property
     def default_metadata(self) -> Metadata:
         """
         Fill in default metadata values for table objects addressing snowflake databases
         """
-        connection = self.hook.get_conn()
-        return Metadata(  # type: ignore
-            schema=connection.schema,
-            database=connection.database,
-        )
+        with closing(self.hook.get_conn()) as connection:
+            return Metadata(  # type: ignore
+                schema=connection.schema,
+                database=connection.database,
+            )
 
     # ---------------------------------------------------------
     # Table metadata
@@ -269,6 +320,7 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         """
         Create a SQL table, automatically inferring the schema using the given file.
         Overriding default behaviour and not using the `prep_table` since it doesn't allow the adding quotes.
+        The columns are created from the Arrow schema of the file or dataframe, see ``create_table_from_arrow_schema``.
 
         :param table: The table to be created.
         :param file: File used to infer the new table columns.
@@ -283,21 +335,49 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         else:
             source_dataframe = file.export_to_dataframe(nrows=LOAD_TABLE_AUTODETECT_ROWS_COUNT)
 
-        # We are changing the case of table name to ease out on the requirements to add quotes in raw queries.
-        # ToDO - Currently, we cannot to append using load_file to a table name which is having name in lower case.
-        pandas_tools.write_pandas(
-            conn=self.hook.get_conn(),
-            df=source_dataframe,
-            table_name=table.name.upper(),
-            schema=table.metadata.schema,
-            database=table.metadata.database,
-            chunk_size=DEFAULT_CHUNK_SIZE,
-            quote_identifiers=self.use_quotes(source_dataframe),
-            auto_create_table=True,
+        self.create_table_from_arrow_schema(
+            table, pa.Schema.from_pandas(source_dataframe, preserve_index=False)
+        )
+
+    def create_table_from_arrow_schema(self, table: Table, schema: pa.Schema) -> None:
+        """
+        Create a table, if it doesn't exist, with a column of the matching Snowflake type for each field of the Arrow
+        schema. The column names are quoted when some of them are in mixed case, see ``use_quotes``.
+
+        :param table: The table to be created.
+        :param schema: Arrow schema of the rows to be loaded to the table
+        """
+        identifiers = self.column_identifiers(schema.names)
+        columns = ", ".join(
+            f"{identifier} {arrow_type_to_snowflake(schema_field.type)}"
+            for identifier, schema_field in zip(identifiers, schema)
+        )
+        self.run_sql(f"CREATE TABLE IF NOT EXISTS {self.get_table_qualified_name(table)} ({columns})")
+
+    def load_dataframe_to_table(
+        self,
+        input_dataframe: pd.DataFrame,
+        output_table: Table,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        """
+        Load content of dataframe in output_table. Only the schema is created beforehand, the table is replaced or
+        created by ``load_pandas_dataframe_to_table``.
+
+        :param input_dataframe: dataframe
+        :param output_table: Table to create
+        :param if_exists: Overwrite file if exists
+        :param chunk_size: Specify the number of records in each batch to be written at a time
+        """
+        self.create_schema_if_needed(output_table.metadata.schema)
+        self.load_pandas_dataframe_to_table(
+            input_dataframe,
+            output_table,
+            chunk_size=chunk_size,
+            if_exists=if_exists,
         )
-        # We are truncating since we only expect table to be created with required schema.
-        # Since this method is used by both native and pandas path we cannot skip this step.
-        self.truncate_table(table)
+        return self.get_table_qualified_name(output_table)
 
     def load_pandas_dataframe_to_table(
         self,
@@ -309,6 +389,7 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         """
         Create a table with the dataframe's contents.
         If the table already exists, append or replace the content, depending on the value of `if_exists`.
+        The rows are loaded by ``bulk_load_arrow_table``, through parquet files uploaded in parallel.
 
         :param source_dataframe: Local or remote filepath
         :param target_table: Table in which the file will be loaded
@@ -317,24 +398,74 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         """
         self._assert_not_empty_df(source_dataframe)
 
-        auto_create_table = False
-        if not self.table_exists(target_table):
-            auto_create_table = True
-        elif if_exists == "replace":
+        if if_exists == "replace":
+            self.drop_table(target_table)
+        if if_exists == "replace" or not self.table_exists(target_table):
             self.create_table(target_table, dataframe=source_dataframe)
+        self.bulk_load_arrow_table(
+            pa.Table.from_pandas(source_dataframe, preserve_index=False),
+            target_table,
+            rows_per_file=chunk_size,
+        )
 
-        # We are changing the case of table name to ease out on the requirements to add quotes in raw queries.
-        # ToDO - Currently, we cannot to append using load_file to a table name which is having name in lower case.
-        pandas_tools.write_pandas(
-            conn=self.hook.get_conn(),
-            df=source_dataframe,
-            table_name=target_table.name.upper(),
-            schema=target_table.metadata.schema,
-            database=target_table.metadata.database,
-            chunk_size=chunk_size,
-            quote_identifiers=self.use_quotes(source_dataframe),
-            auto_create_table=auto_create_table,
+    def bulk_load_arrow_table(
+        self, source_table: pa.Table, target_table: Table, rows_per_file: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        Load the rows of an Arrow table to an existing table. The rows are written to local snappy compressed
+        parquet files, uploaded by ``transfer_params.put_workers`` threads to a temporary internal stage and loaded
+        by a single COPY INTO, matching the columns by name.
+
+        :param source_table: Arrow table of the rows to be loaded
+        :param target_table: Table in which the rows will be loaded
+        :param rows_per_file: Maximum number of rows of each parquet file. The rows are split in as many files as
+            there are threads uploading them, when it is more
+        """
+        put_workers = getattr(self.transfer_params, "put_workers", DEFAULT_PUT_WORKERS)
+        rows_per_file = max(1, min(rows_per_file, math.ceil(source_table.num_rows / max(put_workers, 1))))
+        parts = range(math.ceil(source_table.num_rows / rows_per_file))
+
+        table_name = self.get_table_qualified_name(target_table)
+        columns = ", ".join(self.column_identifiers(source_table.schema.names))
+        # The fields of the parquet files are named after the columns of the Arrow table
+        values = ", ".join('$1:"{}"'.format(name.replace('"', '""')) for name in source_table.schema.names)
+        file_format = "FILE_FORMAT=(TYPE=PARQUET, BINARY_AS_TEXT=FALSE)"
+        with tempfile.TemporaryDirectory() as directory:
+            with self.internal_stage(file_format) as (connection, stage):
+                put_part = partial(
+                    self._put_parquet_part, connection, stage, source_table, rows_per_file, directory
+                )
+                for _ in imap_bounded(put_part, parts, max_workers=put_workers):
+                    pass
+                sql_statement = (
+                    f"COPY INTO {table_name} ({columns}) "
+                    f"FROM (SELECT {values} FROM @{stage.qualified_name})"  # skipcq: BAN-B608
+                )
+                self.evaluate_results(self._execute(connection, sql_statement))
+
+    def _put_parquet_part(
+        self,
+        connection: Any,
+        stage: SnowflakeStage,
+        source_table: pa.Table,
+        rows_per_file: int,
+        directory: str,
+        part: int,
+    ) -> None:
+        """Write a part of the rows of the Arrow table to a parquet file, upload it to the stage and remove it"""
+        path = os.path.join(directory, f"part_{part:05d}.parquet")
+        # Timestamps are written in microseconds, which Snowflake reads without parquet logical types
+        pq.write_table(
+            source_table.slice(part * rows_per_file, rows_per_file),
+            path,
+            compression="snappy",
+            coerce_timestamps="us",
+            allow_truncated_timestamps=True,
         )
+        try:
+            self._put_file(connection, stage, path, auto_compress=False)
+        finally:
+            os.remove(path)
 
     def truncate_table(self, table):
         """Truncate table"""
@@ -365,6 +496,17 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         """
         return any(col for col in cols if not col.islower() and not col.isupper())
 
+    @classmethod
+    def column_identifiers(cls, cols: Sequence[str]) -> list[str]:
+        """
+        Get the identifiers of the columns in SQL statements, quoted when ``use_quotes`` is true.
+
+        :param cols: list of columns
+        """
+        if not cls.use_quotes(cols):
+            return list(cols)
+        return ['"{}"'.format(col.replace('"', '""')) for col in cols]
+
     @property
     def openlineage_dataset_name(self) -> str:
         """
@@ -372,7 +514,7 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         Example: db_name.schema_name.table_name
         """
-        conn = self.hook.get_connection(self.dataset.conn_id)
+        conn = get_connection(self.dataset.conn_id)
         conn_extra = conn.extra_dejson
         schema = conn_extra.get("schema") or conn.schema
         db = conn_extra.get("database")
@@ -385,7 +527,7 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         Example: snowflake://ACCOUNT
         """
-        account = self.hook.get_connection(self.dataset.conn_id).extra_dejson.get("account")
+        account = get_connection(self.dataset.conn_id).extra_dejson.get("account")
         return f"{self.sql_type}://{account}"
 
     @property
@@ -401,15 +543,17 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         source_dataset: File | Table,  # skipcq PYL-W0613, PYL-R0201
     ) -> bool:
         """
-        Check if there is an optimised path for source to destination.
+        Check if there is an optimised path for source to destination. Tables of the same connection are
+        transferred inside Snowflake, and local files are uploaded to an internal stage.
 
         :param source_dataset: File | Table from which we need to transfer data
         """
         if isinstance(source_dataset, Table):
-            return False
+            return super().is_native_path_available(source_dataset)
         is_file_type_supported = source_dataset.type.name in NATIVE_LOAD_SUPPORTED_FILE_TYPES
-        is_file_location_supported = (
-            source_dataset.location.location_type in NATIVE_LOAD_SUPPORTED_FILE_LOCATIONS
+        is_file_location_supported = source_dataset.location.location_type in (
+            *NATIVE_LOAD_SUPPORTED_FILE_LOCATIONS,
+            FileLocation.LOCAL,
         )
         return is_file_type_supported and is_file_location_supported
 
@@ -426,6 +570,8 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         - Creating a Snowflake external stage
         - Using Snowflake COPY INTO statement
 
+        Local files are uploaded to an internal stage instead, see ``load_local_files_to_table``.
+
         Requirements:
         - The user must have permissions to create a STAGE in Snowflake.
         - If loading from GCP Cloud Storage, `native_support_kwargs` must define `storage_integration`
@@ -445,6 +591,10 @@ class SnowflakeDataProvider(DatabaseDataProvider):
             <https://docs.snowflake.com/en/sql-reference/sql/create-stage.html>`_
 
         """
+        if source_file.location.location_type == FileLocation.LOCAL:
+            self.load_local_files_to_table(source_file=source_file, target_table=target_table)
+            return
+
         native_support_kwargs = native_support_kwargs or {}
         # if not self.load_options:
         #     self.load_options = SnowflakeLoadOptions()
@@ -453,12 +603,94 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         if storage_integration is None:
             storage_integration = self.transfer_params.storage_integration
 
-        stage = self.create_stage(file=source_file, storage_integration=storage_integration)
+        with self.stage_for(file=source_file, storage_integration=storage_integration) as stage:
+            self._copy_into_table_from_stage(source_file=source_file, target_table=target_table, stage=stage)
+
+    def load_local_files_to_table(self, source_file: File, target_table: Table) -> None:
+        """
+        Load local files to an existing table natively. The files are uploaded by ``transfer_params.put_workers``
+        threads to a temporary internal stage, compressed on the fly except parquet files, and loaded by a single
+        COPY INTO, validated first when ``transfer_params.validation_mode`` is set.
+
+        :param source_file: File, or pattern of the files, to be loaded
+        :param target_table: Table to which the content of the files will be loaded to
+        """
+        files = iter_file_path_pattern(
+            file=source_file,
+            filetype=source_file.type.name,
+            transfer_params=self.transfer_params,
+            transfer_mode=self.transfer_mode,
+        )
+        put_workers = getattr(self.transfer_params, "put_workers", DEFAULT_PUT_WORKERS)
+        auto_compress = source_file.type.name != FileType.PARQUET
+        options = self._stage_options_sub_statement(source_file.type.name)
+        with self.internal_stage(options) as (connection, stage):
+            # Each file is uploaded to its own folder, since files of different folders can have the same name
+            put_file = partial(self._put_file, connection, stage, auto_compress=auto_compress)
+            for _ in imap_bounded(
+                lambda indexed_file: put_file(indexed_file[1].path, folder=str(indexed_file[0])),
+                enumerate(files),
+                max_workers=put_workers,
+            ):
+                pass
+            sql_statement = (
+                f"COPY INTO {self.get_table_qualified_name(target_table)} FROM @{stage.qualified_name}"
+            )
+            validation_mode = getattr(self.transfer_params, "validation_mode", None)
+            if validation_mode is not None:
+                self._execute(connection, f"{sql_statement} VALIDATION_MODE='{validation_mode}'")
+            self.evaluate_results(self._execute(connection, sql_statement))
+
+    @contextmanager
+    def internal_stage(self, options: str = "") -> Iterator[tuple[Any, SnowflakeStage]]:
+        """
+        Open a connection and create a temporary internal stage in its session, for local files to be uploaded with
+        PUT and loaded with COPY INTO on that connection. The stage is dropped with the session, when the connection
+        is closed at the end of the block.
+
+        :param options: FILE_FORMAT and COPY_OPTIONS of the stage
+        """
+        with closing(self.hook.get_conn()) as connection:
+            stage = SnowflakeStage(metadata=Metadata(schema=connection.schema, database=connection.database))
+            self._execute(connection, f"CREATE TEMPORARY STAGE {stage.qualified_name} {options}")
+            yield connection, stage
+
+    def _put_file(
+        self, connection: Any, stage: SnowflakeStage, path: str, folder: str = "", auto_compress: bool = True
+    ) -> None:
+        """Upload a local file to a folder of an internal stage with PUT"""
+        self._execute(
+            connection,
+            f"PUT 'file://{os.path.abspath(path)}' @{stage.qualified_name}/{folder} "
+            f"AUTO_COMPRESS={str(auto_compress).upper()} OVERWRITE=TRUE",
+        )
+
+    @staticmethod
+    def _execute(connection: Any, sql_statement: str) -> list[dict]:
+        """Run a statement on the connection, e.g. in the session of a temporary stage, returning its rows"""
+        logging.debug("SQL statement executed: %s ", sql_statement)
+        with closing(connection.cursor(DictCursor)) as cursor:
+            cursor.execute(sql_statement)
+            return cursor.fetchall()  # type: ignore[no-any-return]
+
+    def _stage_options_sub_statement(self, file_type: FileType) -> str:
+        """
+        Create the FILE_FORMAT and COPY_OPTIONS of a stage for the files of the given type, with the
+        ``file_options`` and ``copy_options`` of the transfer parameters.
 
-        rows = self._copy_into_table_from_stage(
-            source_file=source_file, target_table=target_table, stage=stage
+        :param file_type: Type of the files loaded or unloaded through the stage
+        """
+        file_format = ASTRO_SDK_TO_SNOWFLAKE_FILE_FORMAT_MAP[file_type]
+        # The stage of a table unloaded to files is created with the transfer parameters of the file
+        copy_options = []
+        copy_options.extend(
+            [f"{k}={v}" for k, v in getattr(self.transfer_params, "copy_options", {}).items()]
         )
-        self.evaluate_results(rows)
+        file_options = [f"{k}={v}" for k, v in getattr(self.transfer_params, "file_options", {}).items()]
+        file_options.extend([f"TYPE={file_format}", "TRIM_SPACE=TRUE"])
+        file_options_str = ", ".join(file_options)
+        copy_options_str = ", ".join(copy_options)
+        return f"FILE_FORMAT=({file_options_str}) COPY_OPTIONS=({copy_options_str}) "
 
     @staticmethod
     def _create_stage_auth_sub_statement(file: File, storage_integration: str | None = None) -> str:
@@ -477,6 +709,37 @@ class SnowflakeDataProvider(DatabaseDataProvider):
             return f"storage_integration = {storage_integration};"
         return file.location.get_snowflake_stage_auth_sub_statement()  # type: ignore
 
+    @contextmanager
+    def stage_for(self, file: File, storage_integration: str | None = None) -> Iterator[SnowflakeStage]:
+        """
+        Get a stage to load or unload the file. During a transfer to the table, i.e. within the ``with`` block of
+        the data provider, the stages are created once per URL, file type and authentication, and dropped at the
+        end of the transfer. Otherwise, the stage is dropped at the end of the ``with`` block of this method.
+
+        :param file: File to be copied from/to using stage
+        :param storage_integration: Previously created Snowflake storage integration
+        """
+        if not self._transfer_in_progress:
+            stage = self.create_stage(file=file, storage_integration=storage_integration)
+            try:
+                yield stage
+            finally:
+                self.drop_stage(stage)
+            return
+
+        unnamed_stage = SnowflakeStage()
+        unnamed_stage.set_url_from_file(file)
+        key = (
+            unnamed_stage.url,
+            file.type.name,
+            self._create_stage_auth_sub_statement(file=file, storage_integration=storage_integration),
+        )
+        with self._stages_lock:
+            if key not in self._stages:
+                self._stages[key] = self.create_stage(file=file, storage_integration=storage_integration)
+            stage = self._stages[key]
+        yield stage
+
     def create_stage(
         self,
         file: File,
@@ -511,18 +774,10 @@ class SnowflakeDataProvider(DatabaseDataProvider):
         stage = SnowflakeStage(metadata=metadata)
         stage.set_url_from_file(file)
 
-        file_format = ASTRO_SDK_TO_SNOWFLAKE_FILE_FORMAT_MAP[file.type.name]
-        copy_options = []
-        copy_options.extend([f"{k}={v}" for k, v in self.transfer_params.copy_options.items()])
-        file_options = [f"{k}={v}" for k, v in self.transfer_params.file_options.items()]
-        file_options.extend([f"TYPE={file_format}", "TRIM_SPACE=TRUE"])
-        file_options_str = ", ".join(file_options)
-        copy_options_str = ", ".join(copy_options)
         sql_statement = "".join(
             [
                 f"CREATE OR REPLACE STAGE {stage.qualified_name} URL='{stage.url}' ",
-                f"FILE_FORMAT=({file_options_str}) ",
-                f"COPY_OPTIONS=({copy_options_str}) ",
+                self._stage_options_sub_statement(file.type.name),
                 auth,
             ]
         )
@@ -531,13 +786,55 @@ class SnowflakeDataProvider(DatabaseDataProvider):
 
         return stage
 
-    def _copy_into_table_from_stage(self, source_file, target_table, stage):
+    def _copy_into_table_from_stage(
+        self, source_file: File, target_table: Table, stage: SnowflakeStage
+    ) -> list:
+        """
+        Load the file from the stage to the table. The files of a pattern are listed and loaded by batches of up to
+        1000 files, each batch being loaded in parallel by the warehouse and validated first when
+        ``transfer_params.validation_mode`` is set.
+
+        :param source_file: File, or pattern of the files, to be loaded
+        :param target_table: Table to which the content of the file will be loaded to
+        :param stage: Stage of the folder of the file
+        :return: Rows returned by the COPY INTO statements
+        """
         table_name = self.get_table_qualified_name(target_table)
-        file_path = os.path.basename(source_file.path) or ""
-        sql_statement = f"COPY INTO {table_name} FROM @{stage.qualified_name}/{file_path}"
+        rows = []
+        for source in self._iter_copy_into_sources(source_file, stage):
+            sql_statement = f"COPY INTO {table_name} FROM {source}"
+            self._validate_before_copy_into(sql_statement)
+            batch_rows = self._run_copy_into(sql_statement)
+            self.evaluate_results(batch_rows)
+            rows.extend(batch_rows)
+        return rows
 
-        self._validate_before_copy_into(source_file, target_table, stage)
+    def _iter_copy_into_sources(self, source_file: File, stage: SnowflakeStage) -> Iterator[str]:
+        """Yield the sources of the COPY INTO statements loading the file, see ``_copy_into_table_from_stage``"""
+        if not source_file.is_pattern():
+            yield f"@{stage.qualified_name}/{os.path.basename(source_file.path)}"
+            return
+
+        # The files are named relatively to the stage, which is the folder of the pattern
+        folder = source_file.path[: source_file.path.rfind("/") + 1]
+        paths = (
+            file.path[len(folder) :]
+            for file in iter_file_path_pattern(
+                file=source_file,
+                filetype=source_file.type.name,
+                transfer_params=self.transfer_params,
+                transfer_mode=self.transfer_mode,
+            )
+        )
+        while True:
+            batch = list(islice(paths, COPY_INTO_MAX_FILES))
+            if not batch:
+                return
+            files = ", ".join("'{}'".format(path.replace("'", "''")) for path in batch)
+            yield f"@{stage.qualified_name} FILES = ({files})"
 
+    def _run_copy_into(self, sql_statement: str) -> list:
+        """Run a COPY INTO statement, returning the rows of its result"""
         # Below code is added due to breaking change in apache-airflow-providers-snowflake==3.2.0,
         # we need to pass handler param to get the rows. But in version apache-airflow-providers-snowflake==3.1.0
         # if we pass the handler provider raises an exception AttributeError
@@ -550,28 +847,95 @@ class SnowflakeDataProvider(DatabaseDataProvider):
                 raise DatabaseCustomError from exe
         except ValueError as exe:
             raise DatabaseCustomError from exe
-        finally:
-            self.drop_stage(stage)
-        return rows
+        return rows  # type: ignore[no-any-return]
 
-    def _validate_before_copy_into(
-        self, source_file: File, target_table: Table, stage: SnowflakeStage
-    ) -> None:
-        """Validate COPY INTO command to tests the files for errors but does not load them."""
-        if self.transfer_params:
-            if self.transfer_params.validation_mode is None:
-                return
-            table_name = self.get_table_qualified_name(target_table)
-            file_path = os.path.basename(source_file.path) or ""
-            sql_statement = (
-                f"COPY INTO {table_name} FROM "
-                f"@{stage.qualified_name}/{file_path} VALIDATION_MODE='{self.transfer_params.validation_mode}'"
-            )
+    def _validate_before_copy_into(self, sql_statement: str) -> None:
+        """
+        Validate COPY INTO command to tests the files for errors but does not load them.
+
+        :param sql_statement: COPY INTO statement to be validated
+        """
+        validation_mode = getattr(self.transfer_params, "validation_mode", None)
+        if validation_mode is None:
+            return
+        self.hook.run(
+            f"{sql_statement} VALIDATION_MODE='{validation_mode}'", handler=lambda cur: cur.fetchall()
+        )
+
+    def is_native_unload_available(self, target_file: File) -> bool:
+        """
+        Check if the table can be exported to the file by the database, without being read in the worker. Tables
+        are unloaded to CSV, NDJSON and parquet files in S3 and GCS.
+
+        :param target_file: File the table would be exported to
+        """
+        try:
+            is_file_type_supported = target_file.type.name in NATIVE_LOAD_SUPPORTED_FILE_TYPES
+        except ValueError:
+            return False
+        return (
+            is_file_type_supported
+            and target_file.location.location_type in NATIVE_LOAD_SUPPORTED_FILE_LOCATIONS
+        )
+
+    def export_table_to_file_natively(self, source_table: Table, target_file: File) -> list[str]:
+        """
+        Unload the content of a table to files natively by:
+        - Creating a Snowflake external stage on the folder of the file
+        - Using Snowflake COPY INTO @stage statement
+
+        When the file is a prefix, e.g. ``s3://bucket/folder/``, the table is unloaded in parallel to several files
+        of up to ``transfer_params.unload_max_file_size`` bytes, named by Snowflake. Otherwise it is unloaded to the
+        file itself, of up to 5 GB.
+
+        :param source_table: Table to be exported
+        :param target_file: File, or prefix of the files, the table is exported to
+        :return: Paths of the files written
+
+        .. seealso::
+            `Snowflake official documentation on COPY INTO location
+            <https://docs.snowflake.com/en/sql-reference/sql/copy-into-location.html>`_
+        """
+        storage_integration = getattr(self.transfer_params, "storage_integration", None)
+        with self.stage_for(file=target_file, storage_integration=storage_integration) as stage:
+            sql_statement = self._copy_into_stage_from_table_statement(source_table, target_file, stage)
+            logging.debug("SQL statement executed: %s ", sql_statement)
             try:
-                self.hook.run(sql_statement, handler=lambda cur: cur.fetchall())
-            except ProgrammingError as load_exception:
-                self.drop_stage(stage)
-                raise load_exception
+                rows = self.hook.run(sql_statement, handler=lambda cur: cur.fetchall())
+            except ValueError as exe:
+                raise DatabaseCustomError from exe
+
+        # The files are named relatively to the stage, which is the folder of the file
+        folder = target_file.path[: target_file.path.rfind("/") + 1]
+        return [folder + (row["FILE_NAME"] if isinstance(row, dict) else row[0]) for row in rows]
+
+    def _copy_into_stage_from_table_statement(
+        self, source_table: Table, target_file: File, stage: SnowflakeStage
+    ) -> str:
+        """Build the COPY INTO @stage statement unloading the table, see ``export_table_to_file_natively``"""
+        file_type = target_file.type.name
+        source = self.get_table_qualified_name(source_table)
+        file_format = [f"TYPE = {ASTRO_SDK_TO_SNOWFLAKE_FILE_FORMAT_MAP[file_type]}"]
+        copy_options = ["OVERWRITE = TRUE", "DETAILED_OUTPUT = TRUE"]
+        if file_type == FileType.NDJSON:
+            # JSON files are unloaded from a single column of objects
+            source = f"(SELECT OBJECT_CONSTRUCT(*) FROM {source})"  # skipcq: BAN-B608
+        else:
+            copy_options.append("HEADER = TRUE")
+        if file_type != FileType.PARQUET:
+            # Text files are written uncompressed, as named by the file
+            file_format.append("COMPRESSION = NONE")
+        if target_file.is_pattern():
+            max_file_size = getattr(self.transfer_params, "unload_max_file_size", None)
+            if max_file_size:
+                copy_options.append(f"MAX_FILE_SIZE = {max_file_size}")
+        else:
+            copy_options.extend(["SINGLE = TRUE", f"MAX_FILE_SIZE = {SNOWFLAKE_MAX_SINGLE_FILE_SIZE}"])
+        file_name = os.path.basename(target_file.path)
+        return (
+            f"COPY INTO @{stage.qualified_name}/{file_name} FROM {source} "
+            f"FILE_FORMAT = ({' '.join(file_format)}) {' '.join(copy_options)}"
+        )
 
     def drop_stage(self, stage: SnowflakeStage) -> None:
         """
@@ -593,3 +957,22 @@ class SnowflakeDataProvider(DatabaseDataProvider):
             # Handle case for apache-airflow-providers-snowflake>=4.0.1
             if any(row[0] == COPY_INTO_COMMAND_FAIL_STATUS for row in rows):
                 raise DatabaseCustomError(rows)
+
+
+def arrow_type_to_snowflake(data_type: pa.DataType) -> str:
+    """
+    Get the Snowflake type of a column of values of the given Arrow type, as loaded from parquet files.
+
+    :param data_type: Arrow type of the values
+    """
+    if pa.types.is_dictionary(data_type):
+        return arrow_type_to_snowflake(data_type.value_type)
+    if pa.types.is_decimal(data_type):
+        return f"NUMBER({min(data_type.precision, 38)}, {min(data_type.scale, 37)})"
+    if pa.types.is_timestamp(data_type):
+        return "TIMESTAMP_TZ" if data_type.tz else "TIMESTAMP_NTZ"
+    for is_type, snowflake_type in ARROW_TO_SNOWFLAKE_TYPES:
+        if is_type(data_type):
+            return snowflake_type
+    # Strings, and the columns of null values
+    return "VARCHAR"
@@ -1,20 +1,42 @@
 from __future__ import annotations
 
+import csv
+import logging
 import socket
+from typing import Any, Iterable, Iterator, Sequence
 
+import pandas as pd
 from airflow.providers.sqlite.hooks.sqlite import SqliteHook
 from sqlalchemy import MetaData as SqlaMetaData, create_engine
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql.schema import Table as SqlaTable
 
+from universal_transfer_operator.constants import (
+    DEFAULT_CHUNK_SIZE,
+    FileLocation,
+    FileType,
+    LoadExistStrategy,
+)
 from universal_transfer_operator.data_providers.database.base import DatabaseDataProvider
+from universal_transfer_operator.data_providers.filesystem import iter_file_path_pattern
+from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Metadata, Table
 from universal_transfer_operator.universal_transfer_operator import TransferIntegrationOptions
+from universal_transfer_operator.utils import get_cached, get_connection
+
+# Format of the datetimes stored by SQLAlchemy in SQLite, which has no datetime type
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
 
 class SqliteDataProvider(DatabaseDataProvider):
     """SqliteDataProvider represent all the DataProviders interactions with Sqlite Databases."""
 
+    # Settings of the connection while rows are bulk loaded, restored afterwards. The rows are inserted in a single
+    # transaction, so the pages written don't need to be synced to disk one by one. A negative cache size is in KiB.
+    # The journal mode is left unchanged: it is a setting of the database file, not of the connection
+    BULK_LOAD_PRAGMAS: dict[str, Any] = {"synchronous": "OFF", "cache_size": -64000}
+
     def __init__(
         self,
         dataset: Table,
@@ -40,15 +62,25 @@ class SqliteDataProvider(DatabaseDataProvider):
     @property
     def hook(self) -> SqliteHook:
         """Retrieve Airflow hook to interface with the Sqlite database."""
+        return get_cached(self.get_cache_key("hook"), self._create_hook)
+
+    def _create_hook(self) -> SqliteHook:
+        """Create the hook of the connection, see ``hook``"""
         return SqliteHook(sqlite_conn_id=self.dataset.conn_id)
 
-    @property
-    def sqlalchemy_engine(self) -> Engine:
-        """Return SQAlchemy engine."""
+    def create_sqlalchemy_engine(self) -> Engine:
+        """Create SQAlchemy engine."""
         # Airflow uses sqlite3 library and not SqlAlchemy for SqliteHook
         # and it only uses the hostname directly.
-        airflow_conn = self.hook.get_connection(self.dataset.conn_id)
-        return create_engine(f"sqlite:///{airflow_conn.host}")
+        airflow_conn = get_connection(self.dataset.conn_id)
+        # SQLAlchemy doesn't pool the connections to database files by default. Pooled connections are used by
+        # several threads, one at a time, e.g. when reading partitions of a table concurrently.
+        return create_engine(
+            f"sqlite:///{airflow_conn.host}",
+            poolclass=QueuePool,
+            connect_args={"check_same_thread": False},
+            **self.engine_kwargs,
+        )
 
     @property
     def default_metadata(self) -> Metadata:
@@ -93,6 +125,145 @@ class SqliteDataProvider(DatabaseDataProvider):
         """
         return SqlaTable(table.name, SqlaMetaData(), autoload_with=self.sqlalchemy_engine)
 
+    # ---------------------------------------------------------
+    # Table load methods
+    # ---------------------------------------------------------
+    def load_pandas_dataframe_to_table(
+        self,
+        source_dataframe: pd.DataFrame,
+        target_table: Table,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Create a table with the dataframe's contents.
+        If the table already exists, append or replace the content, depending on the value of `if_exists`.
+        The rows are inserted by ``bulk_insert`` instead of the multi-rows inserts of pandas, which are bound by the
+        maximum number of variables of a statement and committed one by one.
+
+        :param source_dataframe: Local or remote filepath
+        :param target_table: Table in which the file will be loaded
+        :param if_exists: Strategy to be used in case the target table already exists.
+        :param chunk_size: Specify the number of rows in each batch to be written at a time.
+        """
+        self._assert_not_empty_df(source_dataframe)
+
+        if if_exists == "replace":
+            self.drop_table(target_table)
+        if if_exists == "replace" or not self.table_exists(target_table):
+            self.create_table(target_table, dataframe=source_dataframe)
+        self.bulk_insert(
+            target_table,
+            columns=[str(column) for column in source_dataframe.columns],
+            batches=iter_dataframe_rows(source_dataframe, batch_rows=chunk_size),
+        )
+
+    def bulk_insert(
+        self, table: Table, columns: Sequence[str], batches: Iterable[Iterable[Sequence[Any]]]
+    ) -> None:
+        """
+        Insert rows in an existing table with a prepared statement, in a single transaction. The connection is set
+        up with ``BULK_LOAD_PRAGMAS`` during the load, and the indexes of a table empty before the load are created
+        once the rows are inserted rather than updated row by row.
+
+        :param table: Table the rows are inserted in
+        :param columns: Columns of the table the values of the rows are inserted in, in order
+        :param batches: Batches of rows, each row being a sequence of values sqlite3 can bind
+        """
+        table_name = quote_identifier(self.get_table_qualified_name(table))
+        statement = (
+            f"INSERT INTO {table_name} ({', '.join(map(quote_identifier, columns))}) "  # skipcq: BAN-B608
+            f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+        connection = self.sqlalchemy_engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            previous_pragmas = set_pragmas(cursor, self.BULK_LOAD_PRAGMAS)
+            try:
+                # The write lock is taken upfront, so concurrent writers wait for each other instead of failing
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    indexes = self._drop_indexes_if_empty(cursor, table)
+                    for batch in batches:
+                        cursor.executemany(statement, batch)
+                    for index in indexes:
+                        cursor.execute(index)
+                except BaseException:
+                    connection.rollback()
+                    raise
+                connection.commit()
+            finally:
+                set_pragmas(cursor, previous_pragmas)
+        finally:
+            connection.close()
+
+    def _drop_indexes_if_empty(self, cursor, table: Table) -> list[str]:
+        """
+        Drop the indexes of the table if it has no rows, returning the statements to create them again. The indexes
+        of the primary key and unique constraints can't be dropped and are kept.
+        """
+        table_name = self.get_table_qualified_name(table)
+        if cursor.execute(
+            f"SELECT 1 FROM {quote_identifier(table_name)} LIMIT 1"
+        ).fetchone():  # skipcq: BAN-B608
+            return []
+        indexes = cursor.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? COLLATE NOCASE AND sql IS NOT NULL",
+            (table_name,),
+        ).fetchall()
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {quote_identifier(name)}")
+        return [sql for _, sql in indexes]
+
+    def is_native_path_available(
+        self,
+        source_dataset: File | Table,  # skipcq PYL-W0613, PYL-R0201
+    ) -> bool:
+        """
+        Check if there is an optimised path for source to destination. Local CSV files are loaded natively, and
+        tables of the same connection are transferred inside the database.
+
+        :param source_dataset: File | Table from which we need to transfer data
+        """
+        if isinstance(source_dataset, Table):
+            return super().is_native_path_available(source_dataset)
+        return bool(
+            source_dataset.type.name == FileType.CSV
+            and source_dataset.location.location_type == FileLocation.LOCAL
+        )
+
+    def load_file_to_table_natively(
+        self,
+        source_file: File,
+        target_table: Table,
+        if_exists: LoadExistStrategy = "replace",  # skipcq: PYL-W0613
+        **kwargs,
+    ):
+        """
+        Load local CSV files to an existing table with ``bulk_insert``, streaming the rows of the files without
+        parsing them with pandas. The values are converted by SQLite according to the type of their column, e.g. to
+        integers for the integer columns, and empty values are loaded as NULL.
+
+        :param source_file: File from which we need to transfer data
+        :param target_table: Table that needs to be populated with file data
+        :param if_exists: Overwrite file if exists. Default False
+        """
+        for file in iter_file_path_pattern(
+            file=source_file,
+            filetype=source_file.type.name,
+            transfer_params=self.transfer_params,
+            transfer_mode=self.transfer_mode,
+        ):
+            logging.info("Loading %s to %s natively", file.path, target_table.name)
+            with open(file.path, newline="", encoding="utf-8") as stream:
+                reader = csv.reader(stream)
+                columns = next(reader, None)
+                if columns is None:
+                    continue
+                rows = ([value if value != "" else None for value in row] for row in reader)
+                self.bulk_insert(target_table, columns=columns, batches=[rows])
+
     @property
     def openlineage_dataset_name(self) -> str:
         """
@@ -100,7 +271,7 @@ class SqliteDataProvider(DatabaseDataProvider):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         Example: /tmp/local.db.table_name
         """
-        conn = self.hook.get_connection(self.dataset.conn_id)
+        conn = get_connection(self.dataset.conn_id)
         return f"{conn.host}.{self.dataset.name}"
 
     @property
@@ -110,7 +281,7 @@ class SqliteDataProvider(DatabaseDataProvider):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         Example: file://127.0.0.1:22
         """
-        conn = self.hook.get_connection(self.dataset.conn_id)
+        conn = get_connection(self.dataset.conn_id)
         port = conn.port or 22
         return f"file://{socket.gethostbyname(socket.gethostname())}:{port}"
 
@@ -121,3 +292,53 @@ class SqliteDataProvider(DatabaseDataProvider):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         """
         return f"{self.openlineage_dataset_namespace}{self.openlineage_dataset_name}"
+
+
+def quote_identifier(name: str) -> str:
+    """Quote the name of a table, column or index"""
+    escaped_name = name.replace('"', '""')
+    return f'"{escaped_name}"'
+
+
+def set_pragmas(cursor, pragmas: dict[str, Any]) -> dict[str, Any]:
+    """
+    Set the pragmas of the connection of the cursor, returning their previous values. A pragma which can't be set
+    is left unchanged.
+
+    :param cursor: Cursor of a sqlite3 connection
+    :param pragmas: Values of the pragmas, by name
+    """
+    previous = {}
+    for name, value in pragmas.items():
+        previous[name] = cursor.execute(f"PRAGMA {name}").fetchone()[0]
+        try:
+            cursor.execute(f"PRAGMA {name} = {value}").fetchall()
+        except Exception as error:  # skipcq: PYL-W0703
+            logging.warning("Can't set %s of the SQLite connection to %s: %s", name, value, error)
+    return previous
+
+
+def iter_dataframe_rows(df: pd.DataFrame, batch_rows: int) -> Iterator[list[tuple]]:
+    """
+    Yield the rows of the dataframe in batches of ``batch_rows`` rows, as tuples of values sqlite3 can bind: the
+    missing values are None, the datetimes are formatted like SQLAlchemy does and the timedeltas are integers of
+    nanoseconds like pandas does.
+
+    :param df: Dataframe the rows are read from
+    :param batch_rows: Maximum number of rows of each batch
+    """
+    for start in range(0, len(df), batch_rows):
+        chunk = df.iloc[start : start + batch_rows]
+        columns = [_to_sqlite_values(chunk.iloc[:, position]) for position in range(chunk.shape[1])]
+        yield list(zip(*columns))
+
+
+def _to_sqlite_values(series: pd.Series) -> list:
+    """Convert the values of the column to Python objects sqlite3 can bind"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.strftime(SQLITE_DATETIME_FORMAT)
+    elif pd.api.types.is_timedelta64_dtype(series):
+        values = pd.Series(series.to_numpy().view("int64"), index=series.index)
+    else:
+        values = series
+    return values.astype(object).where(series.notna(), None).tolist()  # type: ignore[no-any-return]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Iterator, cast
 
 from universal_transfer_operator.constants import FileType, TransferMode
 from universal_transfer_operator.data_providers import create_dataprovider
@@ -21,6 +21,32 @@ def resolve_file_path_pattern(
     1. local location - glob pattern
     2. s3/gcs location - prefix
 
+    :param file: File dataset object
+    :param filetype: constant to provide an explicit file type
+    :param normalize_config: parameters in dict format of pandas json_normalize() function
+    :param transfer_params: kwargs to be used by method involved in transfer flow.
+    :param transfer_mode: Use transfer_mode TransferMode; native, non-native or thirdparty.
+    """
+    return list(
+        iter_file_path_pattern(
+            file=file,
+            filetype=filetype,
+            normalize_config=normalize_config,
+            transfer_params=transfer_params,
+            transfer_mode=transfer_mode,
+        )
+    )
+
+
+def iter_file_path_pattern(
+    file: File,
+    filetype: FileType | None = None,
+    normalize_config: dict | None = None,
+    transfer_params: TransferIntegrationOptions | None = None,
+    transfer_mode: TransferMode = TransferMode.NONNATIVE,
+) -> Iterator[File]:
+    """Same as ``resolve_file_path_pattern``, but yield the file objects as the object store listing is paginated
+
     :param file: File dataset object
     :param filetype: constant to provide an explicit file type
     :param normalize_config: parameters in dict format of pandas json_normalize() function
@@ -38,16 +64,16 @@ def resolve_file_path_pattern(
             transfer_mode=transfer_mode,
         ),
     )
-    files = []
-    for path in location.paths:
+    files_count = 0
+    for path, metadata in location.iter_paths_with_metadata():
         if not path.endswith("/"):
-            file = File(
+            files_count += 1
+            yield File(
                 path=path,
                 conn_id=file.conn_id,
                 filetype=filetype,
                 normalize_config=normalize_config,
+                metadata=metadata,
             )
-            files.append(file)
-    if len(files) == 0:
+    if files_count == 0:
         raise FileNotFoundError(f"File(s) not found for path/pattern '{file.path}'")
-    return files
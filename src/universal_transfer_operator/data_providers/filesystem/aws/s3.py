@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import os
-from contextlib import contextmanager
+from collections import defaultdict
 from functools import cached_property
 from tempfile import NamedTemporaryFile
 from typing import Any, Iterator
 from urllib.parse import urlparse, urlunparse
 
 from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+from boto3.s3.transfer import TransferConfig
 
 from universal_transfer_operator.constants import FileLocation, Location, TransferMode
 from universal_transfer_operator.data_providers.filesystem.base import (
@@ -15,7 +15,7 @@ from universal_transfer_operator.data_providers.filesystem.base import (
     Path,
     TempFile,
 )
-from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.file.base import File, FileMetadata
 from universal_transfer_operator.exceptions import DatabaseCustomError
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
 
@@ -26,6 +26,10 @@ class S3DataProvider(BaseFilesystemProviders):
     """
 
     location_type = FileLocation.S3
+    NATIVE_PATHS = {
+        FileLocation.S3: "copy_s3_object",
+        FileLocation.GS: "transfer_using_hook",
+    }
 
     def __init__(
         self,
@@ -61,6 +65,19 @@ class S3DataProvider(BaseFilesystemProviders):
         url = urlparse(path)
         self.hook.delete_objects(bucket=url.netloc, keys=url.path.lstrip("/"))
 
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete several objects with ``DeleteObjects``, a request per bucket and 1000 keys.
+
+        :param paths: S3 paths of the objects to delete
+        """
+        keys_by_bucket: dict[str, list[str]] = defaultdict(list)
+        for path in paths:
+            bucket_name, key = self.hook.parse_s3_url(path)
+            keys_by_bucket[bucket_name].append(key)
+        for bucket_name, keys in keys_by_bucket.items():
+            self.hook.delete_objects(bucket=bucket_name, keys=keys)
+
     @property
     def transport_params(self) -> dict:
         """Structure s3fs credentials from Airflow connection.
@@ -68,71 +85,100 @@ class S3DataProvider(BaseFilesystemProviders):
         """
         return {"client": self.hook.conn}
 
-    @property
-    def paths(self) -> list[str]:
-        """Resolve S3 file paths with prefix"""
+    def iter_paths_with_metadata(self) -> Iterator[tuple[str, FileMetadata | None]]:
+        """Resolve S3 file paths with prefix, one page of the listing at a time"""
+        return self.iter_prefetched_pages(self._list_pages())
+
+    def _list_pages(self) -> Iterator[list[tuple[str, FileMetadata | None]]]:
+        """
+        List the keys with prefix using the ``ListObjectsV2`` paginator and yield the paths and metadata of a page
+        at a time
+        """
         url = urlparse(self.dataset.path)
-        prefixes = self.hook.list_keys(
-            bucket_name=self.bucket_name,
-            prefix=self.s3_key,
-            delimiter=self.delimiter,
-        )
-        paths = [urlunparse((url.scheme, url.netloc, keys, "", "", "")) for keys in prefixes]
-        return paths
+        paginator = self.hook.conn.get_paginator("list_objects_v2")
+        pagination_args = {"Bucket": self.bucket_name, "Prefix": self.s3_key or ""}
+        if self.delimiter:
+            pagination_args["Delimiter"] = self.delimiter
+        for page in paginator.paginate(**pagination_args):
+            yield [
+                (
+                    urlunparse((url.scheme, url.netloc, obj["Key"], "", "", "")),
+                    FileMetadata(
+                        size=obj.get("Size"),
+                        etag=obj["ETag"].strip('"') if obj.get("ETag") else None,
+                        last_modified=obj.get("LastModified"),
+                    ),
+                )
+                for obj in page.get("Contents", [])
+            ]
 
     def check_if_exists(self, path: str | None = None) -> Any:
         """Return true if the dataset exists"""
         path = self.dataset.path if path is None else path
         return self.hook.check_for_key(key=path)
 
-    @contextmanager
-    def read_using_hook(self) -> Iterator[list[TempFile]]:
-        """Read the file from dataset and write to local file location"""
-        if not self.check_if_exists():
-            raise ValueError(f"{self.dataset.path} doesn't exits")
-        files = self.hook.list_keys(
-            bucket_name=self.bucket_name,
-            prefix=self.s3_key,
-            delimiter=self.delimiter,
+    def copy_s3_object(self, source_location: S3DataProvider, source_path: str, destination_path: str) -> str:
+        """
+        Copy an object between S3 locations server side, the content is never downloaded to the worker.
+        Objects bigger than the multipart threshold of ``transfer_config_args`` are copied in parts using
+        ``UploadPartCopy``, smaller ones with a single ``CopyObject`` call.
+
+        :param source_location: S3DataProvider of the source dataset
+        :param source_path: S3 path of the source object
+        :param destination_path: S3 path of the destination object
+        """
+        source_bucket, source_key = source_location.hook.parse_s3_url(source_path)
+        destination_bucket, destination_key = self.hook.parse_s3_url(destination_path)
+        extra_args = dict(self.s3_extra_args)
+        if self.s3_acl_policy:
+            extra_args["ACL"] = self.s3_acl_policy
+        self.hook.conn.copy(
+            CopySource={"Bucket": source_bucket, "Key": source_key},
+            Bucket=destination_bucket,
+            Key=destination_key,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
         )
-        local_file_paths = []
-        try:
-            for file in files:
-                local_file_paths.append(self.download_file(file))
-            yield local_file_paths
-        finally:
-            # Clean up the local files
-            self.cleanup(local_file_paths)
-
-    def write_using_hook(self, source_ref: list[TempFile]):
-        """Write the file from local file location to the dataset"""
-
-        dest_s3_key = self.dataset.path
-
-        if not self.keep_directory_structure and self.prefix:
-            dest_s3_key = os.path.join(dest_s3_key, self.prefix)
-
-        destination_keys = []
-        for file in source_ref:
-            if file.tmp_file and file.tmp_file.exists():
-                dest_key = os.path.join(dest_s3_key, os.path.basename(file.actual_filename.name))
-                self.hook.load_file(
-                    filename=file.tmp_file.as_posix(),
-                    key=dest_key,
-                    replace=True,
-                    acl_policy=self.s3_acl_policy,
-                )
-                destination_keys.append(dest_key)
+        return destination_path
 
-        return destination_keys
+    def download_file(self, path: str) -> TempFile:
+        """
+        Download file and save to temporary path. Objects bigger than the multipart threshold of
+        ``transfer_config_args`` are downloaded as concurrent ranged GETs.
 
-    def download_file(self, file) -> TempFile:
-        """Download file and save to temporary path."""
-        file_object = self.hook.get_key(file, self.bucket_name)
-        _, _, file_name = file.rpartition("/")
+        :param path: S3 path of the object
+        """
+        bucket_name, key = self.hook.parse_s3_url(path)
+        _, _, file_name = key.rpartition("/")
         with NamedTemporaryFile(suffix=file_name, delete=False) as tmp_file:
-            file_object.download_fileobj(tmp_file)
-            return TempFile(tmp_file=Path(tmp_file.name), actual_filename=Path(file_name))
+            pass
+        self.hook.conn.download_file(
+            Bucket=bucket_name, Key=key, Filename=tmp_file.name, Config=self.transfer_config
+        )
+        return TempFile(tmp_file=Path(tmp_file.name), actual_filename=Path(file_name))
+
+    def upload_file(self, file: TempFile, destination_path: str) -> str:
+        """
+        Upload the temporary file to S3 and return path. Files bigger than the multipart threshold of
+        ``transfer_config_args`` are uploaded as a multipart upload with concurrent parts.
+
+        :param file: Temporary file to upload
+        :param destination_path: S3 path of the destination object
+        """
+        if file.tmp_file is None:
+            raise ValueError("Required param `file.tmp_file` missing")
+        bucket_name, key = self.hook.parse_s3_url(destination_path)
+        extra_args = dict(self.s3_extra_args)
+        if self.s3_acl_policy:
+            extra_args["ACL"] = self.s3_acl_policy
+        self.hook.conn.upload_file(
+            Filename=file.tmp_file.as_posix(),
+            Bucket=bucket_name,
+            Key=key,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
+        )
+        return destination_path
 
     @property
     def verify(self) -> Any:
@@ -142,6 +188,14 @@ class S3DataProvider(BaseFilesystemProviders):
     def transfer_config_args(self) -> Any:
         return self.dataset.extra.get("transfer_config_args", {})
 
+    @property
+    def transfer_config(self) -> TransferConfig:
+        """
+        Managed transfer configuration built from ``transfer_config_args``, e.g. ``multipart_threshold``,
+        ``multipart_chunksize`` (part size) and ``max_concurrency`` (parts transferred in parallel per object).
+        """
+        return TransferConfig(**self.transfer_config_args)
+
     @property
     def s3_extra_args(self) -> Any:
         return self.dataset.extra.get("s3_extra_args", {})
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
+import functools
 import io
+import logging
+import operator
 import os
+import threading
 from abc import abstractmethod
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Iterator
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator, cast
+from urllib.parse import urlparse
 
 import attr
 import pandas as pd
+import pyarrow as pa
 import smart_open
 from airflow.hooks.base import BaseHook
 
-from universal_transfer_operator.constants import FileType, Location, TransferMode
+from universal_transfer_operator.constants import (
+    PARTITION_ATTRIBUTE,
+    FileLocation,
+    FileType,
+    Location,
+    TransferMode,
+)
+from universal_transfer_operator.data_providers import create_dataprovider
 from universal_transfer_operator.data_providers.base import DataProviders, DataStream
-from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.data_providers.filesystem.sync import (
+    ListedFile,
+    diff_listings,
+    is_up_to_date,
+)
+from universal_transfer_operator.datasets.file.base import File, FileMetadata
 from universal_transfer_operator.datasets.file.types import create_file_type
+from universal_transfer_operator.datasets.file.types.base import DataframeWriter, FileTypes
+from universal_transfer_operator.datasets.table import Table
+from universal_transfer_operator.settings import LISTING_PREFETCH_PAGES
 from universal_transfer_operator.universal_transfer_operator import TransferIntegrationOptions
-from universal_transfer_operator.utils import get_dataset_connection_type
+from universal_transfer_operator.utils import get_dataset_connection_type, imap_bounded, prefetch
+
+if TYPE_CHECKING:
+    from universal_transfer_operator.data_providers.database.base import DatabaseDataProvider
 
 
 @attr.define
@@ -25,9 +50,22 @@ class TempFile:
     actual_filename: Path
 
 
+@attr.define
+class DataframeFile:
+    """File stream the dataframes of a transfer are appended to, with the writer of its file type"""
+
+    stream: IO
+    writer: DataframeWriter
+    lock: threading.Lock = attr.field(factory=threading.Lock)
+
+
 class BaseFilesystemProviders(DataProviders[File]):
     """BaseFilesystemProviders represent all the DataProviders interactions with File system."""
 
+    location_type: FileLocation
+    # Mapping of the source file locations to the methods transferring their files natively
+    NATIVE_PATHS: dict[FileLocation, str] = {}
+
     def __init__(
         self,
         dataset: File,
@@ -42,27 +80,92 @@ class BaseFilesystemProviders(DataProviders[File]):
         super().__init__(
             dataset=self.dataset, transfer_mode=self.transfer_mode, transfer_params=self.transfer_params
         )
+        # Files the dataframes are appended to during a transfer by path, see ``__enter__``
+        self._dataframe_files: dict[str, DataframeFile] = {}
+        self._dataframe_files_lock = threading.Lock()
+        self._transfer_in_progress = False
 
     def __repr__(self):
         return f'{self.__class__.__name__}(conn_id="{self.dataset.conn_id})'
 
+    def __enter__(self) -> BaseFilesystemProviders:
+        """
+        Start a transfer to the dataset: the dataframes written until the exit, e.g. the chunks of a table, are
+        appended to a single file stream, so that only one of them is in memory at a time.
+        """
+        self._transfer_in_progress = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Complete the files the dataframes were written to, or abort them if the transfer failed"""
+        self._transfer_in_progress = False
+        dataframe_files, self._dataframe_files = self._dataframe_files, {}
+        # Every file is closed even if closing one of them fails
+        with ExitStack() as stack:
+            for dataframe_file in dataframe_files.values():
+                stack.callback(self._close_dataframe_file, dataframe_file, exc_type, exc_value, traceback)
+
+    @staticmethod
+    def _close_dataframe_file(dataframe_file: DataframeFile, exc_type, exc_value, traceback) -> None:
+        """Complete the file, or abort it when the transfer or the completion of the file failed"""
+        try:
+            if exc_type is None:
+                dataframe_file.writer.close()
+        except Exception as error:
+            dataframe_file.stream.__exit__(type(error), error, error.__traceback__)
+            raise
+        dataframe_file.stream.__exit__(exc_type, exc_value, traceback)
+
     @property
     def hook(self) -> BaseHook:
         """Return an instance of the database-specific Airflow hook."""
         raise NotImplementedError
 
     @property
-    @abstractmethod
     def paths(self) -> list[str]:
         """Resolve patterns in path"""
+        return list(self.iter_paths())
+
+    def iter_paths(self) -> Iterator[str]:
+        """
+        Resolve patterns in path, yielding the paths as they are listed so that the transfer can start before the
+        listing is complete.
+        """
+        return (path for path, _ in self.iter_paths_with_metadata())
+
+    @abstractmethod
+    def iter_paths_with_metadata(self) -> Iterator[tuple[str, FileMetadata | None]]:
+        """
+        Same as ``iter_paths``, also yielding the metadata of each file returned by the listing, when available.
+        """
         raise NotImplementedError
 
+    @staticmethod
+    def iter_prefetched_pages(pages: Iterable[list[Any]]) -> Iterator[Any]:
+        """
+        Yield the items of a paginated listing, the next pages being fetched in the background while the items of
+        the current page are consumed.
+
+        :param pages: Pages of items, as returned by the paginated listing API
+        """
+        for page in prefetch(pages, max_prefetch=LISTING_PREFETCH_PAGES):
+            yield from page
+
     def delete(self, path: str):  # type: ignore
         """
         Delete a file/object if they exists
         """
         raise NotImplementedError
 
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete several files/objects, locations with a batch delete API override it.
+
+        :param paths: Paths of the files to delete
+        """
+        for path in paths:
+            self.delete(path)
+
     @property
     def transport_params(self) -> dict | None:  # skipcq: PYL-R0201
         """Get credentials required by smart open to access files"""
@@ -96,15 +199,27 @@ class BaseFilesystemProviders(DataProviders[File]):
             return self.read_using_smart_open()
 
     def read_using_smart_open(self) -> Iterator[DataStream]:
-        """Read the file dataset using smart open returns i/o buffer"""
-        files = self.paths
-        for file in files:
+        """
+        Read the file dataset using smart open returns i/o streams.
+        Files are opened lazily, when the destination starts consuming the stream.
+        """
+        for file in self.iter_paths():
             yield DataStream(
-                remote_obj_buffer=self._convert_remote_file_to_byte_stream(file),
+                opener=functools.partial(self._open_remote_file, file),
                 actual_filename=Path(file),
                 actual_file=self.dataset,
             )
 
+    def _open_remote_file(self, file: str) -> IO[Any]:
+        """
+        Open file from all supported location as a stream that can be read in chunks.
+
+        :returns: an io object that can be streamed into other data structures
+        """
+        mode = "rb" if self.read_as_binary(file) else "r"
+        stream: IO[Any] = smart_open.open(file, mode=mode, transport_params=self.transport_params)
+        return stream
+
     def _convert_remote_file_to_byte_stream(self, file: str) -> io.IOBase:
         """
         Read file from all supported location and convert them into a buffer that can be streamed into other data
@@ -119,15 +234,276 @@ class BaseFilesystemProviders(DataProviders[File]):
             remote_obj_buffer.seek(0)
             return remote_obj_buffer
 
-    def write(self, source_ref: DataStream | pd.DataFrame) -> str:
+    def write(  # type: ignore[override]
+        self, source_ref: DataStream | pd.DataFrame | pa.Table | Table
+    ) -> str | list[str]:
         """
         Write the data from local reference location or a dataframe to the filesystem dataset or database dataset
 
-        :param source_ref: Source DataStream object which will be used to read data
+        :param source_ref: Source DataStream object which will be used to read data, a pandas dataframe, an Arrow
+            table or a table to be exported by its database in native mode
         """
+        if self.transfer_mode == TransferMode.NATIVE and isinstance(source_ref, DataStream):
+            return self.write_natively(source_ref=source_ref)
+        if isinstance(source_ref, Table):
+            return self._get_table_dataprovider(source_ref).export_table_to_file_natively(
+                source_table=source_ref, target_file=self.dataset
+            )
+        if isinstance(source_ref, DataStream):
+            destination_type = self.get_conversion_file_type(source_ref)
+            if destination_type is not None:
+                return self.write_converted_file(source_ref, destination_type)
         return self.write_using_smart_open(source_ref=source_ref)
 
-    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame) -> str:
+    def get_conversion_file_type(self, source_ref: DataStream) -> FileTypes | None:
+        """
+        Get the file type a source file has to be converted to, e.g. parquet for a csv file written to a parquet
+        dataset. None when both have the same type or one of them can't be read in a table, e.g. images.
+
+        :param source_ref: DataStream object of the source file
+        """
+        try:
+            source_type = create_file_type(
+                path=str(source_ref.actual_filename),
+                filetype=source_ref.actual_file.filetype,
+                normalize_config=source_ref.actual_file.normalize_config,
+            )
+            destination_type = self.dataset.type
+        except ValueError:
+            return None
+        return None if source_type == destination_type else destination_type
+
+    def write_converted_file(self, source_ref: DataStream, destination_type: FileTypes) -> str:
+        """
+        Convert a source file to the file type of the dataset through an Arrow table, without building a pandas
+        dataframe for the file types pyarrow can read and write, e.g. csv to parquet.
+
+        :param source_ref: DataStream object of the source file
+        :param destination_type: File type of the dataset
+        """
+        source_type = create_file_type(
+            path=str(source_ref.actual_filename),
+            filetype=source_ref.actual_file.filetype,
+            normalize_config=source_ref.actual_file.normalize_config,
+        )
+        try:
+            table = source_type.export_to_arrow(source_ref.remote_obj_buffer)
+        finally:
+            source_ref.close()
+        destination_file = self.get_destination_path(source_ref.actual_filename)
+        if not self.dataset.is_pattern():
+            # The tables of the source files are appended to the single file of the dataset
+            return self.write_from_dataframe(table, destination_file=destination_file)
+        # Each source file has its own destination file, which is written and closed at once
+        destination_file = f"{os.path.splitext(destination_file)[0]}.{destination_type}"
+        return self._write_dataframe_file(table, destination_file=destination_file)
+
+    def is_native_path_available(self, source_dataset: File | Table) -> bool:  # type: ignore[override]
+        """
+        Check if there is an optimised path for source to destination.
+
+        :param source_dataset: File | Table from which we need to transfer data
+        """
+        if isinstance(source_dataset, Table):
+            return self._get_table_dataprovider(source_dataset).is_native_unload_available(self.dataset)
+        if not isinstance(source_dataset, File):
+            return False
+        return source_dataset.location.location_type in self.NATIVE_PATHS
+
+    def _get_table_dataprovider(self, table: Table) -> DatabaseDataProvider:
+        """Get the data provider of a source table, which exports it to the dataset natively"""
+        return cast(
+            "DatabaseDataProvider",
+            create_dataprovider(
+                dataset=table, transfer_params=self.transfer_params, transfer_mode=self.transfer_mode
+            ),
+        )
+
+    def write_natively(self, source_ref: DataStream) -> list[str]:
+        """
+        Transfer all the files of the source dataset to the dataset without reading them in the worker,
+        e.g. using a server side copy when both datasets are in the same object store.
+
+        :param source_ref: DataStream object of source dataset
+        :return: File paths written
+        """
+        source_location = cast(BaseFilesystemProviders, source_ref.actual_file.location)
+        method_name = self.NATIVE_PATHS.get(source_location.location_type)
+        if not method_name:
+            raise ValueError(
+                f"No native path available for {source_location.location_type} to {self.location_type}."
+            )
+        transfer_method = getattr(self, method_name)
+        source_paths = (path for path in source_location.iter_paths() if not path.endswith("/"))
+        return list(
+            imap_bounded(
+                lambda source_path: transfer_method(
+                    source_location=source_location,
+                    source_path=source_path,
+                    destination_path=self.get_destination_path(source_path),
+                ),
+                source_paths,
+                max_workers=self.concurrency,
+            )
+        )
+
+    def transfer_using_hook(
+        self, source_location: BaseFilesystemProviders, source_path: str, destination_path: str
+    ) -> str:
+        """
+        Transfer a file from another object store by downloading it to a temporary file with the source hook and
+        uploading it with the dataset hook. The temporary file is removed as soon as its upload completes, so at
+        most ``concurrency`` files are kept on local disk at a time.
+
+        :param source_location: DataProvider of the source dataset
+        :param source_path: Path of the source file
+        :param destination_path: Path of the destination file
+        """
+        tmp_file = source_location.download_file(source_path)
+        try:
+            return self.upload_file(tmp_file, destination_path=destination_path)
+        finally:
+            self.cleanup([tmp_file])
+
+    def download_file(self, path: str) -> TempFile:
+        """Download file and save to temporary path."""
+        raise NotImplementedError
+
+    def upload_file(self, file: TempFile, destination_path: str) -> str:
+        """Upload the temporary file to the destination path and return the path"""
+        raise NotImplementedError
+
+    @property
+    def concurrency(self) -> int:
+        """Number of files transferred in parallel"""
+        return max(getattr(self.transfer_params, "concurrency", 1), 1)
+
+    def sync(self, source_location: BaseFilesystemProviders) -> dict[str, int]:
+        """
+        Transfer only the files of the source which are missing or different in the dataset, similar to ``rsync``.
+        Files are matched by their path relative to the dataset (see ``get_relative_path``), as they are written
+        under the same relative path in the destination folder, and compared using the size and checksums or
+        modification times returned by the listings (see ``sync.is_up_to_date``).
+        The destination files which aren't in the source are deleted when ``transfer_params.sync_delete`` is set.
+
+        :param source_location: DataProvider of the source dataset
+        :return: Number of files copied, skipped and deleted
+        """
+        result = diff_listings(
+            self._list_for_sync(source_location),
+            self._list_for_sync(self),
+            is_up_to_date=functools.partial(
+                is_up_to_date,
+                source_location_type=source_location.location_type,
+                destination_location_type=self.location_type,
+            ),
+        )
+        copied = list(
+            imap_bounded(
+                functools.partial(self.sync_file, source_location),
+                result.to_copy,
+                max_workers=self.concurrency,
+            )
+        )
+        deleted = []
+        if result.extra and getattr(self.transfer_params, "sync_delete", False):
+            self.delete_files(result.extra)
+            deleted = result.extra
+        logging.info(
+            "Synced %s to %s: %d files copied, %d skipped, %d deleted",
+            source_location.dataset.path,
+            self.dataset.path,
+            len(copied),
+            len(result.skipped),
+            len(deleted),
+        )
+        return {"copied": len(copied), "skipped": len(result.skipped), "deleted": len(deleted)}
+
+    @staticmethod
+    def _list_for_sync(location: BaseFilesystemProviders) -> list[ListedFile]:
+        """List the files of a location sorted by relative path, an empty location may not exist yet"""
+        try:
+            files = [
+                ListedFile(key=location.get_relative_path(path), path=path, metadata=metadata)
+                for path, metadata in location.iter_paths_with_metadata()
+                if not path.endswith("/")
+            ]
+        except FileNotFoundError:
+            return []
+        # Object stores list keys in order, sorting an already sorted list is linear
+        return sorted(files, key=operator.attrgetter("key"))
+
+    def sync_file(self, source_location: BaseFilesystemProviders, source_path: str) -> str:
+        """
+        Transfer a single file of the source dataset to the same path relative to the dataset, see ``sync``.
+
+        :param source_location: DataProvider of the source dataset
+        :param source_path: Path of the source file
+        :return: File path written
+        """
+        destination_path = os.path.join(self.dataset.path, source_location.get_relative_path(source_path))
+        return self.transfer_file(source_location, source_path, destination_path=destination_path)
+
+    def get_relative_path(self, path: str) -> str:
+        """
+        Get the path of a listed file relative to the dataset, e.g. ``a/x.csv`` for ``s3://bucket/folder/a/x.csv``
+        in ``s3://bucket/folder``. The files of a file pattern, e.g. ``/folder/*.csv``, are relative to the folder of
+        the pattern.
+
+        :param path: Path of a file of the dataset
+        """
+        prefix = urlparse(self.dataset.path).path.rstrip("/") + "/"
+        file_path = urlparse(path).path
+        if not file_path.startswith(prefix):
+            prefix = prefix[: prefix.rstrip("/").rfind("/") + 1]
+        if not file_path.startswith(prefix):
+            return os.path.basename(file_path)
+        return file_path[len(prefix) :]
+
+    def transfer_file(
+        self, source_location: BaseFilesystemProviders, source_path: str, destination_path: str | None = None
+    ) -> str:
+        """
+        Transfer a single file of the source dataset to the dataset, natively when possible.
+
+        :param source_location: DataProvider of the source dataset
+        :param source_path: Path of the source file
+        :param destination_path: Path of the file written. Default to the path given by ``get_destination_path``
+        :return: File path written
+        """
+        destination_path = destination_path or self.get_destination_path(source_path)
+        method_name = self.NATIVE_PATHS.get(source_location.location_type)
+        if self.transfer_mode == TransferMode.NATIVE and method_name:
+            return str(
+                getattr(self, method_name)(
+                    source_location=source_location,
+                    source_path=source_path,
+                    destination_path=destination_path,
+                )
+            )
+        return self.write_from_file(
+            DataStream(
+                opener=functools.partial(source_location._open_remote_file, source_path),
+                actual_filename=Path(source_path),
+                actual_file=source_location.dataset,
+            ),
+            destination_file=destination_path,
+        )
+
+    def get_destination_path(self, source_path: str | Path) -> str:
+        """
+        Get the path a source file is written to. When the dataset is a folder or file pattern, the source file
+        name is kept.
+
+        :param source_path: Path of the source file
+        """
+        destination_file = self.dataset.path
+        # check if destination dataset is folder or file pattern
+        if self.dataset.is_pattern():
+            destination_file = os.path.join(self.dataset.path, os.path.basename(source_path))
+        return destination_file
+
+    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame | pa.Table) -> str:
         """Write the source data from remote object i/o buffer to the dataset using smart open"""
         if isinstance(source_ref, DataStream):
             # `source_ref` can be a dataframe for all the filetypes we can create a dataframe for like -
@@ -138,34 +514,81 @@ class BaseFilesystemProviders(DataProviders[File]):
         else:
             return self.write_from_dataframe(source_ref)
 
-    def write_from_file(self, source_ref: DataStream) -> str:
+    def write_from_file(self, source_ref: DataStream, destination_file: str | None = None) -> str:
         """Write the remote object i/o buffer to the dataset using smart open
         :param source_ref: DataStream object of source dataset
+        :param destination_file: Path of the file written. Default to the path given by ``get_destination_path``
         :return: File path that is the used for write pattern
         """
         mode = "wb" if self.read_as_binary(source_ref.actual_file.path) else "w"
-
-        destination_file = self.dataset.path
-        # check if destination dataset is folder or file pattern
-        if self.dataset.is_pattern():
-            destination_file = os.path.join(self.dataset.path, os.path.basename(source_ref.actual_filename))
+        destination_file = destination_file or self.get_destination_path(source_ref.actual_filename)
 
         with smart_open.open(destination_file, mode=mode, transport_params=self.transport_params) as stream:
-            stream.write(source_ref.remote_obj_buffer.read())
+            source_ref.copy_to(stream)
         return destination_file
 
-    def write_from_dataframe(self, source_ref: pd.DataFrame) -> str:
+    def write_from_dataframe(
+        self, source_ref: pd.DataFrame | pa.Table, destination_file: str | None = None
+    ) -> str:
         """Write the dataframe to the SFTP dataset using smart open
-        :param source_ref: DataStream object of source dataset
+        :param source_ref: pandas dataframe or Arrow table
+        :param destination_file: Path of the file written. Default to the path of the dataset
         :return: File path that is the used for write pattern
         """
-        mode = "wb" if self.read_as_binary(self.dataset.path) else "w"
+        destination_file = destination_file or self.dataset.path
+        partition = (
+            source_ref.attrs.get(PARTITION_ATTRIBUTE) if isinstance(source_ref, pd.DataFrame) else None
+        )
+        if partition is not None and getattr(self.transfer_params, "file_per_partition", False):
+            destination_file = self.get_partition_path(destination_file, partition)
+        if self._transfer_in_progress:
+            with self._dataframe_files_lock:
+                if destination_file not in self._dataframe_files:
+                    mode = "wb" if self.read_as_binary(self.dataset.path) else "w"
+                    url = self.get_write_url(destination_file)
+                    stream = smart_open.open(url, mode=mode, transport_params=self.transport_params)
+                    self._dataframe_files[destination_file] = DataframeFile(
+                        stream=stream, writer=self.dataset.type.create_dataframe_writer(stream)
+                    )
+                dataframe_file = self._dataframe_files[destination_file]
+            # Files of different partitions are written in parallel
+            with dataframe_file.lock:
+                dataframe_file.writer.write(source_ref)
+            return destination_file
 
-        destination_file = self.dataset.path
-        with smart_open.open(destination_file, mode=mode, transport_params=self.transport_params) as stream:
-            self.dataset.type.create_from_dataframe(stream=stream, df=source_ref)
+        return self._write_dataframe_file(source_ref, destination_file=destination_file)
+
+    def _write_dataframe_file(self, source_ref: pd.DataFrame | pa.Table, destination_file: str) -> str:
+        """Write a dataframe or Arrow table to its own file, closing the file once written"""
+        mode = "wb" if self.read_as_binary(self.dataset.path) else "w"
+        url = self.get_write_url(destination_file)
+        with smart_open.open(url, mode=mode, transport_params=self.transport_params) as stream:
+            if isinstance(source_ref, pa.Table):
+                self.dataset.type.create_from_arrow(table=source_ref, stream=stream)
+            else:
+                self.dataset.type.create_from_dataframe(stream=stream, df=source_ref)
         return destination_file
 
+    @staticmethod
+    def get_partition_path(path: str, partition: int) -> str:
+        """
+        Get the path of the file a partition of the source table is written to, e.g. ``s3://bucket/table.csv``
+        becomes ``s3://bucket/table-part-00001.csv`` for the partition 1.
+
+        :param path: Path of the dataset
+        :param partition: Index of the partition
+        """
+        root, extension = os.path.splitext(path)
+        return f"{root}-part-{partition:05d}{extension}"
+
+    def get_write_url(self, path: str) -> str:  # skipcq: PYL-R0201
+        """
+        Get the URL smart open writes a file of the dataset to.
+
+        :param path: Path of the file
+        """
+        return path
+
     def read_as_binary(self, file: str) -> bool:
         """
         Checks if file has to be read as binary or as string i/o.
@@ -184,7 +607,7 @@ class BaseFilesystemProviders(DataProviders[File]):
             return True
 
         read_as_non_binary = {FileType.CSV, FileType.JSON, FileType.NDJSON}
-        if filetype in read_as_non_binary:
+        if filetype.name in read_as_non_binary:
             return False
         return True
 
@@ -192,8 +615,8 @@ class BaseFilesystemProviders(DataProviders[File]):
     def cleanup(file_list: list[TempFile]) -> None:
         """Cleans up the temporary files created"""
         for file in file_list:
-            if os.path.exists(file.actual_filename):
-                os.remove(file.actual_filename)
+            if file.tmp_file and os.path.exists(file.tmp_file):
+                os.remove(file.tmp_file)
 
     @property
     def openlineage_dataset_namespace(self) -> str:
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import logging
-from contextlib import contextmanager
 from functools import cached_property
 from tempfile import NamedTemporaryFile
 from typing import Any, Iterator
@@ -9,15 +7,34 @@ from urllib.parse import urlparse, urlunparse
 
 from airflow.providers.google.cloud.hooks.gcs import GCSHook, _parse_gcs_url
 
+try:
+    # Concurrent chunked transfers of a single object are only available in recent google-cloud-storage releases
+    from google.cloud.storage.transfer_manager import (
+        THREAD,
+        download_chunks_concurrently,
+        upload_chunks_concurrently,
+    )
+
+    CHUNKED_TRANSFER_SUPPORT = True
+except ImportError:
+    CHUNKED_TRANSFER_SUPPORT = False
+
 from universal_transfer_operator.constants import FileLocation, Location, TransferMode
 from universal_transfer_operator.data_providers.filesystem.base import (
     BaseFilesystemProviders,
     Path,
     TempFile,
 )
-from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.file.base import File, FileMetadata
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
 
+# Same defaults as boto3's TransferConfig, so `transfer_config_args` behave alike for S3 and GCS
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+# Maximum number of calls of a GCS batch request
+GCS_MAX_BATCH_SIZE = 100
+
 
 class GCSDataProvider(BaseFilesystemProviders):
     """
@@ -25,6 +42,10 @@ class GCSDataProvider(BaseFilesystemProviders):
     """
 
     location_type = FileLocation.GS
+    NATIVE_PATHS = {
+        FileLocation.GS: "rewrite_gcs_object",
+        FileLocation.S3: "transfer_using_hook",
+    }
 
     def __init__(
         self,
@@ -59,24 +80,56 @@ class GCSDataProvider(BaseFilesystemProviders):
         url = urlparse(path)
         self.hook.delete(bucket_name=url.netloc, object_name=url.path.lstrip("/"))
 
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete several objects using batch requests.
+
+        :param paths: GCS paths of the objects to delete
+        """
+        client = self.hook.get_conn()
+        for start in range(0, len(paths), GCS_MAX_BATCH_SIZE):
+            with client.batch():
+                for path in paths[start : start + GCS_MAX_BATCH_SIZE]:
+                    bucket_name, object_name = _parse_gcs_url(gsurl=path)
+                    client.bucket(bucket_name).blob(object_name).delete()
+
     @property
     def transport_params(self) -> dict:
         """get GCS credentials for storage"""
         client = self.hook.get_conn()
         return {"client": client}
 
-    @property
-    def paths(self) -> list[str]:
-        """Resolve GS file paths with prefix"""
+    def iter_paths_with_metadata(self) -> Iterator[tuple[str, FileMetadata | None]]:
+        """Resolve GS file paths with prefix, one page of the listing at a time"""
+        return self.iter_prefetched_pages(self._list_pages())
+
+    def _list_pages(self) -> Iterator[list[tuple[str, FileMetadata | None]]]:
+        """List the objects with prefix and yield the paths and metadata of a page of the listing at a time"""
         url = urlparse(self.dataset.path)
-        prefix = url.path[1:]
-        prefixes = self.hook.list(
-            bucket_name=self.bucket_name,  # type: ignore
-            prefix=prefix,
-            delimiter=self.delimiter,
+        blobs = self.hook.get_conn().list_blobs(
+            bucket_or_name=self.bucket_name, prefix=url.path[1:], delimiter=self.delimiter
         )
-        paths = [urlunparse((url.scheme, url.netloc, keys, "", "", "")) for keys in prefixes]
-        return paths
+        for page in blobs.pages:
+            objects: list[tuple[str, FileMetadata | None]] = [
+                (
+                    blob.name,
+                    FileMetadata(
+                        size=blob.size,
+                        etag=blob.etag,
+                        md5=blob.md5_hash,
+                        crc32c=blob.crc32c,
+                        last_modified=blob.updated,
+                    ),
+                )
+                for blob in page
+            ]
+            # Same as GCSHook.list, the prefixes are returned instead of the objects when there are any
+            if page.prefixes:
+                objects = [(prefix, None) for prefix in page.prefixes]
+            yield [
+                (urlunparse((url.scheme, url.netloc, name, "", "", "")), metadata)
+                for name, metadata in objects
+            ]
 
     def check_if_exists(self, path: str | None = None) -> Any:
         """Return true if the dataset exists"""
@@ -84,70 +137,109 @@ class GCSDataProvider(BaseFilesystemProviders):
         url = urlparse(path)
         return self.hook.exists(bucket_name=url.netloc, object_name=url.path.lstrip("/"))
 
-    @contextmanager
-    def read_using_hook(self) -> Iterator[list[TempFile]]:
-        """Read the file from dataset and write to local file location"""
-        if not self.check_if_exists():
-            raise ValueError(f"{self.dataset.path} doesn't exits")
-
-        logging.info(
-            "Getting list of the files. Bucket: %s; Delimiter: %s; Prefix: %s",
-            self.bucket_name,  # type: ignore
-            self.delimiter,
-            self.prefix,
-        )
-        files = self.hook.list(
-            bucket_name=self.bucket_name,  # type: ignore
-            prefix=self.prefix,
-            delimiter=self.delimiter,
-        )
-
-        try:
-            local_file_paths = []
-            if files:
-                for file in files:
-                    local_file_paths.append(self.download_file(file))
-            yield local_file_paths
-        finally:
-            # Clean up the local files
-            self.cleanup(local_file_paths)
-
-    def write_using_hook(self, source_ref: list[TempFile]) -> list[str]:
-        """Write the file from local file location to the dataset"""
-        destination_objects = []
-        if source_ref:
-            for file in source_ref:
-                destination_objects.append(self.upload_file(file))
-            logging.info("All done, uploaded %d files to Google Cloud Storage", len(source_ref))
-        else:
-            logging.info("In sync, no files needed to be uploaded to Google Cloud Storage")
-        return destination_objects
+    def upload_file(self, file: TempFile, destination_path: str) -> str:
+        """
+        Upload the temporary file to GCS and return path. Files bigger than ``multipart_threshold`` of
+        ``transfer_config_args`` are uploaded in ``multipart_chunksize`` parts, ``max_concurrency`` at a time,
+        when the installed google-cloud-storage supports it.
 
-    def upload_file(self, file: TempFile):
-        """Upload file to GCS and return path"""
-        # There will always be a '/' before file because it is
-        # enforced at instantiation time
+        :param file: Temporary file to upload
+        :param destination_path: GCS path of the destination object
+        """
         if file.tmp_file is None:
             raise ValueError("Required param `file.tmp_file` missing")
-        dest_gcs_object = self.blob_name + file.actual_filename.name
-        self.hook.upload(
-            bucket_name=self.bucket_name,
-            object_name=dest_gcs_object,
-            filename=file.tmp_file.as_posix(),
-            gzip=self.gzip,
+        bucket_name, object_name = _parse_gcs_url(gsurl=destination_path)
+        if self._use_chunked_transfer(file.tmp_file.stat().st_size) and not self.gzip:
+            blob = self.hook.get_conn().bucket(bucket_name).blob(object_name)
+            upload_chunks_concurrently(
+                file.tmp_file.as_posix(),
+                blob,
+                chunk_size=self.multipart_chunksize,
+                worker_type=THREAD,
+                max_workers=self.max_concurrency,
+            )
+        else:
+            self.hook.upload(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                filename=file.tmp_file.as_posix(),
+                gzip=self.gzip,
+                chunk_size=self.multipart_chunksize,
+            )
+        return destination_path
+
+    def rewrite_gcs_object(
+        self, source_location: GCSDataProvider, source_path: str, destination_path: str
+    ) -> str:
+        """
+        Copy an object between GCS locations server side using the rewrite API, the content is never downloaded
+        to the worker.
+
+        :param source_location: GCSDataProvider of the source dataset
+        :param source_path: GCS path of the source object
+        :param destination_path: GCS path of the destination object
+        """
+        source_bucket, source_object = _parse_gcs_url(gsurl=source_path)
+        destination_bucket, destination_object = _parse_gcs_url(gsurl=destination_path)
+        self.hook.rewrite(
+            source_bucket=source_bucket,
+            source_object=source_object,
+            destination_bucket=destination_bucket,
+            destination_object=destination_object,
         )
-        return dest_gcs_object
+        return destination_path
 
-    def download_file(self, file) -> TempFile:
-        """Download file and save to temporary path."""
-        _, _, file_name = file.rpartition("/")
+    def download_file(self, path: str) -> TempFile:
+        """
+        Download file and save to temporary path. Objects bigger than ``multipart_threshold`` of
+        ``transfer_config_args`` are downloaded as concurrent ranged reads when the installed
+        google-cloud-storage supports it.
+
+        :param path: GCS path of the object
+        """
+        bucket_name, object_name = _parse_gcs_url(gsurl=path)
+        _, _, file_name = object_name.rpartition("/")
         with NamedTemporaryFile(suffix=file_name, delete=False) as tmp_file:
-            self.hook.download(
-                bucket_name=self.bucket_name,
-                object_name=file,
-                filename=tmp_file.name,
+            pass
+        blob = self.hook.get_conn().bucket(bucket_name).get_blob(object_name)
+        if blob is None:
+            raise ValueError(f"{path} doesn't exits")
+        if self._use_chunked_transfer(blob.size):
+            download_chunks_concurrently(
+                blob,
+                tmp_file.name,
+                chunk_size=self.multipart_chunksize,
+                worker_type=THREAD,
+                max_workers=self.max_concurrency,
             )
-            return TempFile(tmp_file=Path(tmp_file.name), actual_filename=Path(file_name))
+        else:
+            blob.download_to_filename(tmp_file.name)
+        return TempFile(tmp_file=Path(tmp_file.name), actual_filename=Path(file_name))
+
+    def _use_chunked_transfer(self, size: int | None) -> bool:
+        """Check if an object has to be transferred in concurrent chunks"""
+        return (
+            CHUNKED_TRANSFER_SUPPORT
+            and self.max_concurrency > 1
+            and size is not None
+            and size > self.multipart_threshold
+        )
+
+    @property
+    def transfer_config_args(self) -> dict:
+        return dict(self.dataset.extra.get("transfer_config_args", {}))
+
+    @property
+    def multipart_threshold(self) -> int:
+        return int(self.transfer_config_args.get("multipart_threshold", DEFAULT_MULTIPART_THRESHOLD))
+
+    @property
+    def multipart_chunksize(self) -> int:
+        return int(self.transfer_config_args.get("multipart_chunksize", DEFAULT_MULTIPART_CHUNKSIZE))
+
+    @property
+    def max_concurrency(self) -> int:
+        return int(self.transfer_config_args.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
 
     @property
     def delegate_to(self) -> Any:
@@ -3,33 +3,47 @@ from __future__ import annotations
 import glob
 import os
 import pathlib
+import shutil
+from datetime import datetime, timezone
 from os.path import exists
+from typing import Iterator
 from urllib.parse import urlparse
 
 import pandas as pd
+import pyarrow as pa
 import smart_open
 from airflow.hooks.base import BaseHook
 
 from universal_transfer_operator.constants import FileLocation
 from universal_transfer_operator.data_providers.base import DataStream
 from universal_transfer_operator.data_providers.filesystem.base import BaseFilesystemProviders
+from universal_transfer_operator.datasets.file.base import FileMetadata
 
 
 class LocalDataProvider(BaseFilesystemProviders):
     """Handler Local file path operations"""
 
     location_type = FileLocation.LOCAL
+    NATIVE_PATHS = {
+        FileLocation.LOCAL: "copy_local_file",
+    }
 
-    @property
-    def paths(self) -> list[str]:
+    def iter_paths(self) -> Iterator[str]:
         """Resolve local filepath"""
         url = urlparse(self.dataset.path)
         path_object = pathlib.Path(url.path)
         if path_object.is_dir():
-            paths = [str(filepath) for filepath in path_object.rglob("*")]
-        else:
-            paths = glob.glob(url.path)
-        return paths
+            return (str(filepath) for filepath in path_object.rglob("*") if filepath.is_file())
+        return glob.iglob(url.path)
+
+    def iter_paths_with_metadata(self) -> Iterator[tuple[str, FileMetadata | None]]:
+        """Resolve local filepath, along with the size and modification time of the files"""
+        for path in self.iter_paths():
+            stat_result = os.stat(path)
+            yield path, FileMetadata(
+                size=stat_result.st_size,
+                last_modified=datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc),
+            )
 
     def validate_conn(self):
         """Override as conn_id is not always required for local location."""
@@ -70,16 +84,52 @@ class LocalDataProvider(BaseFilesystemProviders):
         path = self.dataset.path if path is None else path
         return exists(path)
 
-    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame) -> str:
+    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame | pa.Table) -> str:
         """Write the source data from remote object i/o buffer to the dataset using smart open"""
+        if isinstance(source_ref, (pd.DataFrame, pa.Table)):
+            return self.write_from_dataframe(source_ref)
         mode = "wb" if self.read_as_binary(self.dataset.path) else "w"
         with smart_open.open(self.dataset.path, mode=mode, transport_params=self.transport_params) as stream:
-            if isinstance(source_ref, DataStream):
-                stream.write(source_ref.remote_obj_buffer.read())
-            elif isinstance(source_ref, pd.DataFrame):
-                self.dataset.type.create_from_dataframe(stream=stream, df=source_ref)
+            source_ref.copy_to(stream)
         return self.dataset.path
 
+    def write_from_file(self, source_ref: DataStream, destination_file: str | None = None) -> str:
+        """Write the remote object i/o buffer to the dataset, creating the folder of the destination file if needed"""
+        destination_file = destination_file or self.get_destination_path(source_ref.actual_filename)
+        os.makedirs(os.path.dirname(destination_file) or ".", exist_ok=True)
+        return super().write_from_file(source_ref, destination_file=destination_file)
+
+    def copy_local_file(
+        self, source_location: LocalDataProvider, source_path: str, destination_path: str
+    ) -> str:
+        """
+        Copy a local file in the kernel, using ``copy_file_range`` when available and ``sendfile`` otherwise,
+        the content is never read in Python.
+
+        :param source_location: LocalDataProvider of the source dataset
+        :param source_path: Path of the source file
+        :param destination_path: Path of the destination file
+        """
+        os.makedirs(os.path.dirname(destination_path) or ".", exist_ok=True)
+        try:
+            self._copy_file_range(source_path, destination_path)
+        except (AttributeError, OSError):
+            # copy_file_range is only available on Linux with Python >= 3.8 and may not be supported across
+            # filesystems. shutil.copyfile uses sendfile (Linux) or fcopyfile (macOS) when available.
+            shutil.copyfile(source_path, destination_path)
+        return destination_path
+
+    @staticmethod
+    def _copy_file_range(source_path: str, destination_path: str) -> None:
+        """Copy a file using the copy_file_range system call"""
+        with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+            remaining = os.fstat(source.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(source.fileno(), destination.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+
     @property
     def hook(self) -> BaseHook:
         """Return an instance of the Airflow hook."""
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-import os
+import posixpath
+import stat
+from datetime import datetime, timezone
 from functools import cached_property
+from typing import Iterator
 from urllib.parse import ParseResult, urlparse, urlunparse
 
 import pandas as pd
+import pyarrow as pa
 import smart_open
 from airflow.providers.sftp.hooks.sftp import SFTPHook
+from paramiko import SFTPAttributes
 
 from universal_transfer_operator.constants import FileLocation, Location, TransferMode
 from universal_transfer_operator.data_providers.base import DataStream
 from universal_transfer_operator.data_providers.filesystem.base import BaseFilesystemProviders
-from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.file.base import File, FileMetadata
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
+from universal_transfer_operator.utils import get_connection
 
 
 class SFTPDataProvider(BaseFilesystemProviders):
@@ -55,8 +61,7 @@ class SFTPDataProvider(BaseFilesystemProviders):
         path = self.dataset.path if path is None else path
         return self.hook.path_exists(path.replace("sftp://", "/"))
 
-    @property
-    def paths(self) -> list[str]:
+    def iter_paths_with_metadata(self) -> Iterator[tuple[str, FileMetadata | None]]:
         """
         Resolve SFTP file paths with netloc of self.dataset.path as prefix. Paths are added if they start with prefix
 
@@ -67,22 +72,47 @@ class SFTPDataProvider(BaseFilesystemProviders):
             - sftp://upload/sample.ndjson
 
         If self.dataset.path is "sftp://upload/test" will return sftp://upload/test.csv and sftp://upload/test.json
+
+        The directories are walked in the background, yielding the paths of a directory as soon as it is listed.
         """
         url = urlparse(self.dataset.path)
         uri = self.get_uri()
-        full_paths = []
-        prefixes = self.hook.get_tree_map(url.netloc, prefix=url.netloc + url.path)
-        for keys in prefixes:
-            if len(keys) > 0:
-                full_paths.extend(keys)
-        # paths = ["/" + path for path in full_paths]
-        paths = [uri + "/" + path for path in full_paths]
-        return paths
+        pages = self._list_directories(url.netloc, prefix=url.netloc + url.path)
+        return ((uri + "/" + path, metadata) for path, metadata in self.iter_prefetched_pages(pages))
+
+    def _list_directories(self, path: str, prefix: str) -> Iterator[list[tuple[str, FileMetadata]]]:
+        """
+        Walk the directory tree under ``path`` and yield the files starting with ``prefix`` of each directory,
+        along with their metadata.
+
+        :param path: Directory to walk
+        :param prefix: Prefix of the files returned
+        """
+        conn = self.hook.get_conn()
+        directories = [path]
+        while directories:
+            directory = directories.pop()
+            files = []
+            for entry in conn.listdir_attr(directory):
+                entry_path = posixpath.join(directory, entry.filename)
+                if entry.st_mode is not None and stat.S_ISDIR(entry.st_mode):
+                    directories.append(entry_path)
+                elif entry_path.startswith(prefix):
+                    files.append((entry_path, self._get_metadata(entry)))
+            yield files
+
+    @staticmethod
+    def _get_metadata(entry: SFTPAttributes) -> FileMetadata:
+        """Get the file metadata from the attributes returned by the listing"""
+        last_modified = None
+        if entry.st_mtime is not None:
+            last_modified = datetime.fromtimestamp(entry.st_mtime, tz=timezone.utc)
+        return FileMetadata(size=entry.st_size, last_modified=last_modified)
 
     @property
     def transport_params(self) -> dict:
         """get SFTP credentials for storage"""
-        client = self.hook.get_connection(self.dataset.conn_id)
+        client = get_connection(self.dataset.conn_id)
         extra_options = client.extra_dejson
         if "key_file" in extra_options:
             key_file = extra_options.get("key_file")
@@ -92,7 +122,7 @@ class SFTPDataProvider(BaseFilesystemProviders):
         raise ValueError("SFTP credentials are not set in the connection.")
 
     def get_uri(self):
-        client = self.hook.get_connection(self.dataset.conn_id)
+        client = get_connection(self.dataset.conn_id)
         return client.get_uri()
 
     @staticmethod
@@ -119,37 +149,33 @@ class SFTPDataProvider(BaseFilesystemProviders):
 
         return str(urlunparse(final_url))
 
-    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame):
+    def write_using_smart_open(self, source_ref: DataStream | pd.DataFrame | pa.Table):
         """Write the source data from remote object i/o buffer to the dataset using smart open"""
         if isinstance(source_ref, DataStream):
             return self.write_from_file(source_ref=source_ref)
-        elif isinstance(source_ref, pd.DataFrame):
+        elif isinstance(source_ref, (pd.DataFrame, pa.Table)):
             return self.write_from_dataframe(source_ref=source_ref)
 
-    def write_from_file(self, source_ref: DataStream) -> str:
+    def write_from_file(self, source_ref: DataStream, destination_file: str | None = None) -> str:
         """Write the remote object i/o buffer to the dataset using smart open
         :param source_ref: DataStream object of source dataset
+        :param destination_file: Path of the file written. Default to the path given by ``get_destination_path``
         :return: File path that is the used for write pattern
         """
         mode = "wb" if self.read_as_binary(source_ref.actual_file.path) else "w"
-        destination_file = self.dataset.path
-        if self.dataset.is_pattern():
-            destination_file = os.path.join(self.dataset.path, os.path.basename(source_ref.actual_filename))
+        destination_file = destination_file or self.get_destination_path(source_ref.actual_filename)
         complete_url = self.get_complete_url(destination_file, source_ref.actual_file.path)
         with smart_open.open(complete_url, mode=mode, transport_params=self.transport_params) as stream:
-            stream.write(source_ref.remote_obj_buffer.read())
+            source_ref.copy_to(stream)
         return destination_file
 
-    def write_from_dataframe(self, source_ref: pd.DataFrame) -> str:
-        """Write the dataframe to the SFTP dataset using smart open
-        :param source_ref: DataStream object of source dataset
-        :return: File path that is the used for write pattern
+    def get_write_url(self, path: str) -> str:
         """
-        mode = "wb" if self.read_as_binary(self.dataset.path) else "w"
-        complete_url = self.get_complete_url(self.dataset.path, "")
-        with smart_open.open(complete_url, mode=mode, transport_params=self.transport_params) as stream:
-            self.dataset.type.create_from_dataframe(stream=stream, df=source_ref)
-        return self.dataset.path
+        Get the URL smart open writes a file of the dataset to, with the credentials of the connection.
+
+        :param path: Path of the file
+        """
+        return self.get_complete_url(path, "")
 
     @property
     def openlineage_dataset_namespace(self) -> str:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import base64
+import re
+from typing import Callable, Iterable, NamedTuple
+
+import attr
+
+from universal_transfer_operator.constants import FileLocation
+from universal_transfer_operator.datasets.file.base import FileMetadata
+
+# S3 ETags of objects not uploaded in multiple parts are the hexadecimal MD5 of their content
+S3_MD5_ETAG = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ListedFile(NamedTuple):
+    """A file of a listing, identified by its ``key`` when comparing the source and destination listings."""
+
+    key: str
+    path: str
+    metadata: FileMetadata | None
+
+
+@attr.define
+class SyncResult:
+    """
+    Outcome of the comparison of a source and destination listing.
+
+    :param to_copy: Paths of the source files missing or different in the destination
+    :param skipped: Paths of the source files already up to date in the destination
+    :param extra: Paths of the destination files which aren't in the source
+    """
+
+    to_copy: list[str] = attr.field(factory=list)
+    skipped: list[str] = attr.field(factory=list)
+    extra: list[str] = attr.field(factory=list)
+
+
+def diff_listings(
+    source_files: Iterable[ListedFile],
+    destination_files: Iterable[ListedFile],
+    is_up_to_date: Callable[[FileMetadata | None, FileMetadata | None], bool],
+) -> SyncResult:
+    """
+    Compare two listings sorted by key in a single pass, like a merge join.
+
+    :param source_files: Files of the source, sorted by key
+    :param destination_files: Files of the destination, sorted by key
+    :param is_up_to_date: Callable telling if the destination file is up to date given the source and destination
+        metadata
+    """
+    result = SyncResult()
+    source_iterator, destination_iterator = iter(source_files), iter(destination_files)
+    source, destination = next(source_iterator, None), next(destination_iterator, None)
+    while source is not None or destination is not None:
+        if destination is None or (source is not None and source.key < destination.key):
+            result.to_copy.append(source.path)  # type: ignore[union-attr]
+            source = next(source_iterator, None)
+        elif source is None or destination.key < source.key:
+            result.extra.append(destination.path)
+            destination = next(destination_iterator, None)
+        else:
+            if is_up_to_date(source.metadata, destination.metadata):
+                result.skipped.append(source.path)
+            else:
+                result.to_copy.append(source.path)
+            source, destination = next(source_iterator, None), next(destination_iterator, None)
+    return result
+
+
+def is_up_to_date(
+    source: FileMetadata | None,
+    destination: FileMetadata | None,
+    source_location_type: FileLocation,
+    destination_location_type: FileLocation,
+) -> bool:
+    """
+    Check if the destination file has the same content as the source file, based on the listing metadata.
+
+    Files of different sizes are different. Then the content checksums are compared when both locations provide
+    them, and otherwise the destination is up to date when it was modified after the source.
+
+    :param source: Metadata of the source file
+    :param destination: Metadata of the destination file
+    :param source_location_type: Location of the source file
+    :param destination_location_type: Location of the destination file
+    """
+    if source is None or destination is None:
+        return False
+    if source.size is not None and destination.size is not None and source.size != destination.size:
+        return False
+    source_md5 = content_md5(source, source_location_type)
+    destination_md5 = content_md5(destination, destination_location_type)
+    if source_md5 and destination_md5:
+        return source_md5 == destination_md5
+    if source.crc32c and destination.crc32c:
+        return source.crc32c == destination.crc32c
+    if source.last_modified and destination.last_modified:
+        return destination.last_modified >= source.last_modified
+    return source.size is not None and destination.size is not None
+
+
+def content_md5(metadata: FileMetadata, location_type: FileLocation) -> str | None:
+    """
+    Get the base64 encoded MD5 of a file content, if known. GCS lists it, on S3 it's the ETag of the objects
+    which weren't uploaded in multiple parts.
+
+    :param metadata: Metadata of the file
+    :param location_type: Location of the file
+    """
+    if metadata.md5:
+        return metadata.md5
+    if location_type == FileLocation.S3 and metadata.etag and S3_MD5_ETAG.match(metadata.etag):
+        return base64.b64encode(bytes.fromhex(metadata.etag)).decode()
+    return None
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
+import os
 import random
+import re
 import string
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, ClassVar
 
 import pandas as pd
+import pyarrow as pa
 from pandas import DataFrame, read_json
 
 from universal_transfer_operator import settings
@@ -16,6 +22,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Encoding of the dataframes stored in the Airflow metadata DB
+XCOM_DATAFRAME_FORMAT = "arrow-ipc"
+# Names of the files storing dataframes, named after the hash of their content or a random one
+DATAFRAME_DIGEST_PREFIX = "d"
+DATAFRAME_FILE_NAME = re.compile(r"[a-z][a-z0-9]{64}\.parquet")
+
 
 def convert_dataframe_to_file(df: pd.DataFrame) -> File:
     """
@@ -26,12 +38,14 @@ def convert_dataframe_to_file(df: pd.DataFrame) -> File:
     [universal_transfer_operator]
     dataframe_storage_conn_id=...
     dataframe_storage_url=///
+
+    The file is named after the hash of the dataframe content, so that identical dataframes, e.g. returned by the
+    retries of a task, are uploaded once. A file stored since more than half of ``xcom_storage_ttl`` is uploaded
+    again, so that it isn't deleted by ``cleanup_dataframe_storage`` while still referenced.
     :param df: Dataframe to convert to file
     :return: File object with reference to stored dataframe file
     """
-    unique_id = random.choice(string.ascii_lowercase) + "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(64)
-    )
+    from universal_transfer_operator.datasets.file.base import File
 
     if settings.DATAFRAME_STORAGE_CONN_ID is None:
         raise ValueError(
@@ -39,27 +53,117 @@ def convert_dataframe_to_file(df: pd.DataFrame) -> File:
             " `universal_transfer_operator.xcom_storage_conn_id`"
         )
 
+    digest = get_dataframe_digest(df)
+    if digest is None:
+        unique_id = random.choice(string.ascii_lowercase) + "".join(
+            random.choice(string.ascii_lowercase + string.digits) for _ in range(64)
+        )
+    else:
+        unique_id = DATAFRAME_DIGEST_PREFIX + digest
+
     file = File(
         path=settings.DATAFRAME_STORAGE_URL + "/" + unique_id + ".parquet",
         conn_id=settings.DATAFRAME_STORAGE_CONN_ID,
         filetype=FileType.PARQUET,
         is_dataframe=True,
     )
+    if digest is not None and is_stored_recently(file):
+        logger.info("Dataframe already stored in %s, skipping the upload", file.path)
+        return file
     file.create_from_dataframe(df)
     return file
 
 
+def get_dataframe_digest(df: pd.DataFrame) -> str | None:
+    """
+    Get the SHA-256 hash of the values, index, columns and dtypes of a dataframe. None when some values can't be
+    hashed, e.g. lists.
+
+    :param df: pandas dataframe
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        return None
+    digest = hashlib.sha256(row_hashes.to_numpy().tobytes())
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode())
+    digest.update(repr((df.index.names, str(df.index.dtype))).encode())
+    return digest.hexdigest()
+
+
+def is_stored_recently(file: File) -> bool:
+    """
+    Check if a file exists and was written less than half of ``xcom_storage_ttl`` ago, so that it is kept for
+    at least the other half.
+
+    :param file: File storing a dataframe
+    """
+    file_name = os.path.basename(file.path)
+    for path, metadata in file.location.iter_paths_with_metadata():
+        if os.path.basename(path) != file_name:
+            continue
+        if metadata is None or metadata.last_modified is None:
+            return True
+        age = datetime.now(timezone.utc) - metadata.last_modified
+        return bool(age < timedelta(seconds=settings.DATAFRAME_STORAGE_TTL / 2))
+    return False
+
+
+def cleanup_dataframe_storage(ttl: int | None = None) -> list[str]:
+    """
+    Delete the dataframes stored in ``xcom_storage_url`` since more than ``ttl`` seconds, e.g. from a maintenance
+    DAG. The other files of the location are kept.
+
+    :param ttl: Time in seconds the dataframes are kept. Default to ``xcom_storage_ttl``
+    :return: Paths of the files deleted
+    """
+    from universal_transfer_operator.datasets.file.base import File
+
+    if settings.DATAFRAME_STORAGE_CONN_ID is None:
+        raise ValueError(
+            "Missing conn_id. Please specify it in airflow's config"
+            " `universal_transfer_operator.xcom_storage_conn_id`"
+        )
+
+    ttl = settings.DATAFRAME_STORAGE_TTL if ttl is None else ttl
+    expiry = datetime.now(timezone.utc) - timedelta(seconds=ttl)
+    location = File(
+        path=settings.DATAFRAME_STORAGE_URL.rstrip("/") + "/", conn_id=settings.DATAFRAME_STORAGE_CONN_ID
+    ).location
+    expired = [
+        path
+        for path, metadata in location.iter_paths_with_metadata()
+        if DATAFRAME_FILE_NAME.fullmatch(os.path.basename(path))
+        and metadata is not None
+        and metadata.last_modified is not None
+        and metadata.last_modified < expiry
+    ]
+    if expired:
+        logger.info("Deleting %s dataframes stored before %s", len(expired), expiry)
+        location.delete_files(expired)
+    return expired
+
+
 class PandasDataframe(DataFrame):
     """Pandas-compatible dataframe class that can be serialized and deserialized into XCom by Airflow 2.5"""
 
-    version: ClassVar[int] = 1
+    version: ClassVar[int] = 2
 
     def serialize(self):
         # Store in the metadata DB if Dataframe < 100 kb
-        df_size = self.memory_usage(deep=True).sum()
-        if df_size < (settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024):
+        max_size = settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024
+        # The shallow memory usage is a lower bound of the size which is cheap to get, the deep memory usage of
+        # the object columns is only measured for the dataframes which can be small enough
+        df_size = self.memory_usage(deep=False).sum()
+        if df_size < max_size:
+            df_size = self.memory_usage(deep=True).sum()
+        if df_size < max_size:
             logger.info("Dataframe size: %s bytes. Storing it in Airflow's metadata DB", df_size)
-            return {"data": self.to_json()}
+            table = dataframe_to_arrow(self)
+            if table is None:
+                logger.info("Serializing the dataframe as json")
+                return {"data": self.to_json()}
+            return {"data": encode_arrow_table(table), "format": XCOM_DATAFRAME_FORMAT}
         else:
             logger.info(
                 "Dataframe size: %s bytes. Storing it in Remote Storage (conn_id: %s | URL: %s)",
@@ -71,14 +175,20 @@ class PandasDataframe(DataFrame):
 
     @staticmethod
     def deserialize(data: dict, version: int):
-        if version > 1:
+        if version > PandasDataframe.version:
             raise TypeError(f"version > {PandasDataframe.version}")
         if isinstance(data, dict) and data.get("class", "") == "File":
+            from universal_transfer_operator.datasets.file.base import File
+
             file = File.from_json(data)
             if file.is_dataframe:
+                if settings.XCOM_LAZY_DATAFRAMES:
+                    return LazyPandasDataframe(file)
                 logger.info("Retrieving file from %s using %s conn_id ", file.path, file.conn_id)
                 return file.export_to_dataframe()
             return file
+        if data.get("format") == XCOM_DATAFRAME_FORMAT:
+            return PandasDataframe.from_pandas_df(decode_arrow_table(data["data"]).to_pandas())
         return PandasDataframe.from_pandas_df(read_json(data["data"]))
 
     @classmethod
@@ -88,6 +198,122 @@ class PandasDataframe(DataFrame):
         return cls(df)
 
 
+class LazyPandasDataframe:
+    """
+    Dataframe stored in the Object Store, downloaded when it is first accessed. The attributes and methods of the
+    dataframe are available on the proxy, ``load`` reads only some of its columns and returning the proxy from a
+    task passes on the reference to the file without downloading it.
+
+    :param file: File storing the dataframe
+    """
+
+    version: ClassVar[int] = PandasDataframe.version
+
+    def __init__(self, file: File):
+        self.file = file
+        self._df: pd.DataFrame | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the whole dataframe was downloaded"""
+        return self._df is not None
+
+    def load(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """
+        Get the dataframe, downloading it on first call. Only the columns requested are read from the file, unless
+        the whole dataframe was already downloaded.
+
+        :param columns: Columns to be read. Default None, the whole dataframe is downloaded and kept
+        """
+        if columns is None or self._df is not None:
+            if self._df is None:
+                logger.info("Retrieving file from %s using %s conn_id ", self.file.path, self.file.conn_id)
+                self._df = self.file.export_to_dataframe()
+            return self._df if columns is None else self._df[columns]
+        logger.info(
+            "Retrieving columns %s from %s using %s conn_id ", columns, self.file.path, self.file.conn_id
+        )
+        return self.file.export_to_dataframe(columns=columns)
+
+    def serialize(self):
+        return self.file.to_json()
+
+    @staticmethod
+    def deserialize(data: dict, version: int):
+        return PandasDataframe.deserialize(data, version)
+
+    def __getattr__(self, name: str):
+        # Only called for the attributes which aren't attributes of the proxy
+        if name in ("file", "_df") or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __contains__(self, key) -> bool:
+        return key in self.load()
+
+    def __array__(self, dtype=None):
+        return self.load().__array__(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyPandasDataframe):
+            other = other.load()
+        return self.load() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if self._df is not None:
+            return repr(self._df)
+        return f'{self.__class__.__name__}(file="{self.file.path}")'
+
+
+def dataframe_to_arrow(df: pd.DataFrame) -> pa.Table | None:
+    """
+    Convert a dataframe to an Arrow table keeping its index and the pandas dtypes of its columns. None when
+    pyarrow can't convert it, e.g. for a column mixing strings and numbers.
+
+    :param df: pandas dataframe
+    """
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as error:
+        logger.info("Dataframe can't be converted to an Arrow table: %s", error)
+        return None
+
+
+def encode_arrow_table(table: pa.Table) -> str:
+    """
+    Encode an Arrow table in the Arrow IPC stream format, compressed with zstd, as base64 text for XCom.
+
+    :param table: Arrow table
+    """
+    compression = "zstd" if pa.Codec.is_available("zstd") else None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(
+        sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+    ) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+
+
+def decode_arrow_table(data: str) -> pa.Table:
+    """
+    Decode an Arrow table encoded by ``encode_arrow_table``.
+
+    :param data: base64 text of the Arrow IPC stream
+    """
+    return pa.ipc.open_stream(base64.b64decode(data)).read_all()
+
+
 def convert_columns_names_capitalization(
     df: pd.DataFrame, columns_names_capitalization: ColumnCapitalization
 ):
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import io
+import json
 import pathlib
-from typing import cast
+from datetime import datetime
+from typing import Iterator, cast
 
 import pandas as pd
+import pyarrow as pa
 import smart_open
 from attr import define, field
 
@@ -14,6 +17,25 @@ from universal_transfer_operator.datasets.file.types import create_file_type
 from universal_transfer_operator.datasets.file.types.base import FileTypes
 
 
+@define
+class FileMetadata:
+    """
+    Metadata of a file as returned by the listing of its location, saving a call per file to fetch them again.
+
+    :param size: Size in bytes
+    :param etag: Entity tag of the object (S3, GCS)
+    :param md5: MD5 hash of the object content, base64 encoded (GCS)
+    :param crc32c: CRC32C checksum of the object content, base64 encoded (GCS)
+    :param last_modified: Time of the last modification
+    """
+
+    size: int | None = None
+    etag: str | None = None
+    md5: str | None = None
+    crc32c: str | None = None
+    last_modified: datetime | None = None
+
+
 @define
 class File(Dataset):
     """
@@ -24,6 +46,7 @@ class File(Dataset):
     :param filetype: constant to provide an explicit file type
     :param normalize_config: parameters in dict format of pandas json_normalize() function.
     :param is_bytes: is bytes
+    :param metadata: metadata of the file returned by the listing of its location, if known
     """
 
     path: str = field(default="")
@@ -34,13 +57,27 @@ class File(Dataset):
     uri: str = field(init=False)
     extra: dict = field(init=True, factory=dict)
     is_dataframe: bool = False
+    metadata: FileMetadata | None = None
+    # File type memoised with the attributes it was created from, see ``type``
+    _type: tuple[tuple, FileTypes] | None = field(default=None, init=False, eq=False, repr=False)
 
     @property
     def location(self):
+        """Data provider of the file location, created once per transfer for a given file."""
         from universal_transfer_operator.data_providers import create_dataprovider
         from universal_transfer_operator.data_providers.filesystem.base import BaseFilesystemProviders
-
-        return cast(BaseFilesystemProviders, create_dataprovider(dataset=self))
+        from universal_transfer_operator.utils import get_cached
+
+        # The data providers read their settings from ``extra``, e.g. the ACL and encryption arguments of S3
+        key = (
+            "file_location",
+            self.path,
+            self.conn_id,
+            self.filetype,
+            repr(self.normalize_config),
+            json.dumps(self.extra, sort_keys=True, default=repr),
+        )
+        return cast(BaseFilesystemProviders, get_cached(key, lambda: create_dataprovider(dataset=self)))
 
     @property
     def size(self) -> int:
@@ -49,16 +86,22 @@ class File(Dataset):
 
         :return: File size in bytes
         """
+        if self.metadata is not None and self.metadata.size is not None:
+            return self.metadata.size
         size: int = self.location.size
         return size
 
     @property
     def type(self) -> FileTypes:  # noqa: A003
-        return create_file_type(
-            path=self.path,
-            filetype=self.filetype,
-            normalize_config=self.normalize_config,
-        )
+        key = (self.path, self.filetype, self.normalize_config)
+        if self._type is None or self._type[0] != key:
+            file_type = create_file_type(
+                path=self.path,
+                filetype=self.filetype,
+                normalize_config=self.normalize_config,
+            )
+            self._type = (key, file_type)
+        return self._type[1]
 
     def is_binary(self) -> bool:
         """
@@ -67,7 +110,7 @@ class File(Dataset):
         :return: True or False
         """
         read_as_non_binary = {FileTypeConstant.CSV, FileTypeConstant.JSON, FileTypeConstant.NDJSON}
-        if self.type in read_as_non_binary:
+        if self.type.name in read_as_non_binary:
             return False
         return True
 
@@ -97,6 +140,26 @@ class File(Dataset):
         with smart_open.open(self.path, mode=mode, transport_params=self.location.transport_params) as stream:
             return self.type.export_to_dataframe(stream, **kwargs)
 
+    def export_to_arrow(self, **kwargs) -> pa.Table:
+        """
+        Read file from all supported location and convert them into an Arrow table, parsed by pyarrow for the file
+        types it supports.
+        """
+        mode = "rb" if self.is_binary() else "r"
+        with smart_open.open(self.path, mode=mode, transport_params=self.location.transport_params) as stream:
+            return self.type.export_to_arrow(stream, **kwargs)
+
+    def iter_dataframes(self, chunk_rows: int, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Read file from all supported location in dataframes of up to ``chunk_rows`` rows, for the file types which
+        can be parsed incrementally, or a single dataframe.
+
+        :param chunk_rows: Maximum number of rows of each dataframe
+        """
+        mode = "rb" if self.is_binary() else "r"
+        with smart_open.open(self.path, mode=mode, transport_params=self.location.transport_params) as stream:
+            yield from self.type.iter_dataframes(stream, chunk_rows=chunk_rows, **kwargs)
+
     def _convert_remote_file_to_byte_stream(self) -> io.IOBase:
         """
         Read file from all supported location and convert them into a buffer that can be streamed into other data
@@ -126,6 +189,9 @@ class File(Dataset):
 
     def exists(self) -> bool:
         """Check if the file exists or not"""
+        if self.metadata is not None:
+            # The file was returned by the listing of its location
+            return True
         file_exists: bool = self.location.exists()
         return file_exists
 
@@ -147,6 +213,16 @@ class File(Dataset):
     def __hash__(self) -> int:
         return hash((self.path, self.conn_id, self.filetype))
 
+    def to_json(self):
+        return {
+            "class": "File",
+            "conn_id": self.conn_id,
+            "path": self.path,
+            "filetype": self.filetype.value if self.filetype else None,
+            "normalize_config": self.normalize_config,
+            "is_dataframe": self.is_dataframe,
+        }
+
     @classmethod
     def from_json(cls, serialized_object: dict):
         filetype = (
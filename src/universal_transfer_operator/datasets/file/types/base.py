@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import codecs
 import io
 from abc import ABC, abstractmethod
+from typing import IO, Iterator, cast
 
 import pandas as pd
+import pyarrow as pa
 
 
 class FileTypes(ABC):
@@ -20,6 +23,30 @@ class FileTypes(ABC):
         """
         raise NotImplementedError
 
+    def iter_dataframes(self, stream, chunk_rows: int, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Read file from one of the supported locations in dataframes of up to ``chunk_rows`` rows, so that only one of
+        them is in memory at a time. File types which can't be parsed incrementally are read in a single dataframe.
+
+        :param stream: file stream object
+        :param chunk_rows: Maximum number of rows of each dataframe
+        """
+        yield self.export_to_dataframe(stream, **kwargs)
+
+    def export_to_arrow(self, stream, columns_names_capitalization="original", **kwargs) -> pa.Table:
+        """
+        Read file from one of the supported locations and return an Arrow table. File types pyarrow can't parse are
+        read in a pandas dataframe first.
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting table
+        """
+        df = self.export_to_dataframe(
+            stream, columns_names_capitalization=columns_names_capitalization, **kwargs
+        )
+        return pa.Table.from_pandas(df, preserve_index=False)
+
     @abstractmethod
     def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:
         """Write file to one of the supported locations
@@ -28,6 +55,24 @@ class FileTypes(ABC):
         """
         raise NotImplementedError
 
+    def create_from_arrow(self, table: pa.Table, stream) -> None:
+        """
+        Write an Arrow table to a file of one of the supported locations. File types pyarrow can't write are
+        written from a pandas dataframe.
+
+        :param table: Arrow table
+        :param stream: file stream object
+        """
+        self.create_from_dataframe(df=table.to_pandas(), stream=stream)
+
+    def create_dataframe_writer(self, stream) -> DataframeWriter:
+        """
+        Get a writer adding dataframes to a single file, e.g. the chunks of a table read in several dataframes.
+
+        :param stream: file stream object
+        """
+        return DataframeWriter(file_type=self, stream=stream)
+
     @property
     @abstractmethod
     def name(self):
@@ -46,3 +91,80 @@ class FileTypes(ABC):
 
     def __hash__(self):
         return hash(self.name)
+
+
+class DataframeWriter:
+    """
+    Write several dataframes to a file stream, one after the other, so that only one of them is in memory at a time.
+    File types whose content can't simply be concatenated override ``write_chunk`` and ``close``.
+
+    :param file_type: Type of the file written
+    :param stream: file stream object
+    """
+
+    # Whether ``write_chunk`` writes Arrow tables as they are, otherwise they are converted to pandas dataframes
+    writes_arrow: bool = True
+
+    def __init__(self, file_type: FileTypes, stream):
+        self.file_type = file_type
+        self.stream = stream
+        self.chunks_written = 0
+
+    def write(self, df: pd.DataFrame | pa.Table) -> None:
+        """
+        Append a dataframe to the file.
+
+        :param df: pandas dataframe or Arrow table
+        """
+        if isinstance(df, pa.Table) and not self.writes_arrow:
+            df = df.to_pandas()
+        self.write_chunk(df)
+        self.chunks_written += 1
+
+    def write_chunk(self, df: pd.DataFrame | pa.Table) -> None:
+        """
+        Write a dataframe after the ones already written.
+
+        :param df: pandas dataframe or Arrow table
+        """
+        if self.chunks_written:
+            raise ValueError(f"{self.file_type.name} files can't be written in several dataframes")
+        if isinstance(df, pa.Table):
+            self.file_type.create_from_arrow(table=df, stream=self.stream)
+        else:
+            self.file_type.create_from_dataframe(df=df, stream=self.stream)
+
+    def close(self) -> None:  # skipcq: PTC-W0049
+        """Complete the file after the last dataframe, the stream itself is closed by the caller"""
+
+
+def as_binary_stream(stream) -> IO[bytes]:
+    """
+    Get the UTF-8 encoded content of a file stream opened in text mode, as pyarrow only reads bytes. The binary
+    buffer of text streams is read directly when it is UTF-8 encoded, other text streams are read in memory.
+
+    :param stream: Text or binary file stream object
+    """
+    if not isinstance(stream, io.TextIOBase):
+        return cast(IO[bytes], stream)
+    buffer = getattr(stream, "buffer", None)
+    encoding = getattr(stream, "encoding", None)
+    if buffer is not None and encoding and codecs.lookup(encoding).name == "utf-8":
+        return cast(IO[bytes], buffer)
+    return io.BytesIO(stream.read().encode("utf-8"))
+
+
+def convert_arrow_columns_names_capitalization(
+    table: pa.Table, columns_names_capitalization="original"
+) -> pa.Table:
+    """
+    Convert the names of the columns of an Arrow table to lowercase or uppercase.
+
+    :param table: Arrow table
+    :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+    """
+    if columns_names_capitalization == "lower":
+        return table.rename_columns([name.lower() for name in table.column_names])
+    if columns_names_capitalization == "upper":
+        return table.rename_columns([name.upper() for name in table.column_names])
+    return table
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import io
+from typing import Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from universal_transfer_operator.constants import FileType as FileTypeConstants
 from universal_transfer_operator.datasets.dataframe.pandas import (
     PandasDataframe,
     convert_columns_names_capitalization,
 )
-from universal_transfer_operator.datasets.file.types.base import FileTypes
+from universal_transfer_operator.datasets.file.types.base import (
+    DataframeWriter,
+    FileTypes,
+    as_binary_stream,
+    convert_arrow_columns_names_capitalization,
+)
 
 
 class CSVFileTypes(FileTypes):
@@ -32,6 +40,40 @@ class CSVFileTypes(FileTypes):
         )
         return PandasDataframe.from_pandas_df(df)
 
+    def export_to_arrow(self, stream, columns_names_capitalization="original", **kwargs) -> pa.Table:
+        """
+        Read csv file from one of the supported locations with the multithreaded csv reader of pyarrow and return
+        an Arrow table. Files read with pandas options are read in a pandas dataframe first.
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting table
+        """
+        if kwargs:
+            return super().export_to_arrow(
+                stream, columns_names_capitalization=columns_names_capitalization, **kwargs
+            )
+        table = pa_csv.read_csv(as_binary_stream(stream))
+        return convert_arrow_columns_names_capitalization(table, columns_names_capitalization)
+
+    def iter_dataframes(
+        self, stream, chunk_rows: int, columns_names_capitalization="original", **kwargs
+    ) -> Iterator[pd.DataFrame]:  # skipcq PYL-R0201
+        """
+        Read csv file from one of the supported locations in dataframes of up to ``chunk_rows`` rows.
+
+        :param stream: file stream object
+        :param chunk_rows: Maximum number of rows of each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframes
+        """
+        with pd.read_csv(stream, chunksize=chunk_rows, **kwargs) as reader:
+            for df in reader:
+                df = convert_columns_names_capitalization(
+                    df=df, columns_names_capitalization=columns_names_capitalization
+                )
+                yield PandasDataframe.from_pandas_df(df)
+
     # We need skipcq because it's a method overloading so we don't want to make it a static method
     def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
         """
@@ -42,6 +84,28 @@ class CSVFileTypes(FileTypes):
         """
         df.to_csv(stream, index=False)
 
+    def create_dataframe_writer(self, stream) -> DataframeWriter:
+        """
+        Get a writer appending dataframes to a single csv file, the header is only written once.
+
+        :param stream: file stream object
+        """
+        return CSVDataframeWriter(file_type=self, stream=stream)
+
     @property
     def name(self):
         return FileTypeConstants.CSV
+
+
+class CSVDataframeWriter(DataframeWriter):
+    """Append the rows of dataframes to a csv file"""
+
+    writes_arrow = False
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Write the rows of a dataframe after the ones already written.
+
+        :param df: pandas dataframe
+        """
+        df.to_csv(self.stream, index=False, header=self.chunks_written == 0)
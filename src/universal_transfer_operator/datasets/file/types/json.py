@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import io
+import json
+import re
+from typing import IO, Iterator, cast
 
 import pandas as pd
 
@@ -9,7 +12,12 @@ from universal_transfer_operator.datasets.dataframe.pandas import (
     PandasDataframe,
     convert_columns_names_capitalization,
 )
-from universal_transfer_operator.datasets.file.types.base import FileTypes
+from universal_transfer_operator.datasets.file.types.base import DataframeWriter, FileTypes
+
+# Number of characters of the blocks json files are read in
+JSON_READ_BLOCK_SIZE = 1024 * 1024
+# Characters which can follow an element of a json array
+_ELEMENT_DELIMITER = re.compile(r"[\s,\]]")
 
 
 class JSONFileTypes(FileTypes):
@@ -20,6 +28,7 @@ class JSONFileTypes(FileTypes):
         self,
         stream: io.TextIOWrapper,
         columns_names_capitalization="original",
+        nrows: int | None = None,
         **kwargs,
     ) -> pd.DataFrame:  # skipcq PYL-R0201
         """
@@ -28,16 +37,37 @@ class JSONFileTypes(FileTypes):
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param nrows: Number of records of the top-level array to be read, the rest of the file isn't read.
+            Default None, the whole file is read
         """
-        kwargs_copy = dict(kwargs)
-        # Pandas `read_json` does not support the `nrows` parameter unless we're using NDJSON
-        kwargs_copy.pop("nrows", None)
-        df = pd.read_json(stream, **kwargs_copy)
+        if nrows is None:
+            df = pd.read_json(stream, **kwargs)
+        else:
+            df = pd.read_json(io.StringIO(next(iter_json_array_chunks(stream, nrows, nrows))), **kwargs)
         df = convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
         return PandasDataframe.from_pandas_df(df)
 
+    def iter_dataframes(
+        self, stream, chunk_rows: int, columns_names_capitalization="original", **kwargs
+    ) -> Iterator[pd.DataFrame]:  # skipcq PYL-R0201
+        """
+        Read json file from one of the supported locations in dataframes of up to ``chunk_rows`` records of its
+        top-level array. Other json documents are read in a single dataframe.
+
+        :param stream: file stream object
+        :param chunk_rows: Maximum number of rows of each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframes
+        """
+        for chunk in iter_json_array_chunks(stream, chunk_rows):
+            df = pd.read_json(io.StringIO(chunk), **kwargs)
+            df = convert_columns_names_capitalization(
+                df=df, columns_names_capitalization=columns_names_capitalization
+            )
+            yield PandasDataframe.from_pandas_df(df)
+
     # We need skipcq because it's a method overloading so we don't want to make it a static method
     def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
         """
@@ -48,6 +78,143 @@ class JSONFileTypes(FileTypes):
         """
         df.to_json(stream, orient="records")
 
+    def create_dataframe_writer(self, stream) -> DataframeWriter:
+        """
+        Get a writer appending dataframes to the records array of a single json file.
+
+        :param stream: file stream object
+        """
+        return JSONDataframeWriter(file_type=self, stream=stream)
+
     @property
     def name(self):
         return FileTypeConstants.JSON
+
+
+class JSONDataframeWriter(DataframeWriter):
+    """Append the rows of dataframes to the records array of a json file"""
+
+    writes_arrow = False
+
+    def __init__(self, file_type: FileTypes, stream):
+        super().__init__(file_type=file_type, stream=stream)
+        self.records_written = False
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Write the rows of a dataframe after the ones already written.
+
+        :param df: pandas dataframe
+        """
+        # Records of the chunk without the enclosing brackets of the array
+        records = df.to_json(orient="records")[1:-1]
+        if not records:
+            return
+        self.stream.write("," if self.records_written else "[")
+        self.stream.write(records)
+        self.records_written = True
+
+    def close(self) -> None:
+        """Close the records array"""
+        self.stream.write("]" if self.records_written else "[]")
+
+
+def iter_json_array_chunks(stream, chunk_rows: int, nrows: int | None = None) -> Iterator[str]:
+    """
+    Read the top-level array of a json document incrementally and yield json arrays of up to ``chunk_rows`` of its
+    elements, reading the stream block by block. A document which isn't an array is yielded as a whole.
+
+    :param stream: File stream object, opened in text or binary mode
+    :param chunk_rows: Maximum number of elements of each array
+    :param nrows: Number of elements to be read. Default None, all the elements are read
+    """
+    reader = _JSONArrayReader(stream)
+    if not reader.skip_to("["):
+        yield reader.remaining()
+        return
+
+    elements: list[str] = []
+    chunks_count = 0
+    row_count = 0
+    for element in reader.elements():
+        elements.append(element)
+        row_count += 1
+        if len(elements) == chunk_rows or row_count == nrows:
+            yield "[" + ",".join(elements) + "]"
+            chunks_count += 1
+            elements = []
+        if row_count == nrows:
+            return
+    if elements or not chunks_count:
+        yield "[" + ",".join(elements) + "]"
+
+
+class _JSONArrayReader:
+    """Read the elements of the top-level array of a json document, keeping a single block of it in memory"""
+
+    def __init__(self, stream: IO[str] | IO[bytes], block_size: int = JSON_READ_BLOCK_SIZE):
+        self.stream: IO[str]
+        if isinstance(stream, io.TextIOBase):
+            self.stream = stream
+        else:
+            # Files opened in binary mode are decoded
+            self.stream = io.TextIOWrapper(cast(IO[bytes], stream), encoding="utf-8")
+        self.block_size = block_size
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read the next block of the stream, dropping the part of the buffer already read"""
+        block = self.stream.read(self.block_size) if not self.eof else ""
+        self.eof = not block
+        self.buffer = self.buffer[self.position :] + block
+        self.position = 0
+        return not self.eof
+
+    def _peek(self) -> str:
+        """Get the next character which isn't a whitespace, without consuming it. Empty at the end of the stream"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer) or not self._fill():
+                return self.buffer[self.position : self.position + 1]
+
+    def skip_to(self, character: str) -> bool:
+        """Consume the next character which isn't a whitespace if it is ``character``"""
+        if self._peek() != character:
+            return False
+        self.position += 1
+        return True
+
+    def remaining(self) -> str:
+        """Get the rest of the stream"""
+        return self.buffer[self.position :] + self.stream.read()
+
+    def elements(self) -> Iterator[str]:
+        """Yield the json text of each element of the array, up to the closing bracket"""
+        while not self.skip_to("]"):
+            if not self._peek():
+                raise ValueError("Unexpected end of the json array")
+            self.skip_to(",")
+            # Skip the whitespaces before the element
+            self._peek()
+            yield self._read_element()
+
+    def _read_element(self) -> str:
+        """Read the json text of the next element, reading further blocks until it is complete"""
+        while True:
+            try:
+                _, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next block, e.g. ``12.`` of ``12.5``, in
+            # which case it isn't followed by a delimiter yet
+            if not _ELEMENT_DELIMITER.match(self.buffer, end) and self._fill():
+                continue
+            element = self.buffer[self.position : end]
+            self.position = end
+            return element
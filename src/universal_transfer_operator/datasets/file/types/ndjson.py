@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import io
+import itertools
 import json
+import logging
+from typing import IO
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pa_json
 
 from universal_transfer_operator.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
 from universal_transfer_operator.datasets.dataframe.pandas import (
     PandasDataframe,
     convert_columns_names_capitalization,
 )
-from universal_transfer_operator.datasets.file.types.base import FileTypes
+from universal_transfer_operator.datasets.file.types.base import (
+    DataframeWriter,
+    FileTypes,
+    as_binary_stream,
+    convert_arrow_columns_names_capitalization,
+)
 
 
 class NDJsonFileTypes(FileTypes):
@@ -30,6 +40,30 @@ class NDJsonFileTypes(FileTypes):
         )
         return PandasDataframe.from_pandas_df(df)
 
+    def export_to_arrow(self, stream, columns_names_capitalization="original", **kwargs) -> pa.Table:
+        """
+        Read ndjson file from one of the supported locations and return an Arrow table. Files normalized with a
+        ``normalize_config``, or which pyarrow can't parse, are read in a pandas dataframe first.
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting table
+        """
+        if self.normalize_config:
+            return super().export_to_arrow(
+                stream, columns_names_capitalization=columns_names_capitalization, **kwargs
+            )
+        data = read_ndjson_bytes(stream, kwargs.get("nrows"))
+        try:
+            table = read_ndjson_table(data)
+        except pa.ArrowInvalid:
+            return super().export_to_arrow(
+                io.StringIO(data.to_pybytes().decode("utf-8")),
+                columns_names_capitalization=columns_names_capitalization,
+                **kwargs,
+            )
+        return convert_arrow_columns_names_capitalization(table, columns_names_capitalization)
+
     # We need skipcq because it's a method overloading so we don't want to make it a static method
     def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
         """
@@ -40,6 +74,14 @@ class NDJsonFileTypes(FileTypes):
         """
         df.to_json(stream, orient="records", lines=True)
 
+    def create_dataframe_writer(self, stream) -> DataframeWriter:
+        """
+        Get a writer appending dataframes to a single ndjson file.
+
+        :param stream: file stream object
+        """
+        return NDJsonDataframeWriter(file_type=self, stream=stream)
+
     @property
     def name(self):
         return FileTypeConstants.NDJSON
@@ -49,10 +91,25 @@ class NDJsonFileTypes(FileTypes):
         """
         Flatten the nested ndjson/json.
 
+        Without ``normalize_config``, the file is parsed by the multithreaded ndjson reader of pyarrow and the
+        nested objects are flattened in columns named after their path, e.g. ``a.b``, like pandas
+        ``json_normalize()`` does. Otherwise, or when pyarrow can't parse the file, the rows are parsed one by one
+        and normalized by ``json_normalize()``.
+
         :param normalize_config: parameters in dict format of pandas json_normalize() function.
             https://pandas.pydata.org/docs/reference/api/pandas.json_normalize.html
         :param stream: io.TextIOWrapper object for the file
         """
+        rows_stream: IO[str] = stream
+        if not normalize_config:
+            data = read_ndjson_bytes(stream, kwargs.get("nrows"))
+            try:
+                return read_ndjson_with_pyarrow(data)
+            except pa.ArrowInvalid as error:
+                # e.g. a field having values of different types, which pandas keeps as objects
+                logging.info("Parsing the ndjson file with pandas, it can't be parsed by pyarrow: %s", error)
+            rows_stream = io.StringIO(data.to_pybytes().decode("utf-8"))
+
         normalize_config = normalize_config or {}
         nrows = kwargs.get("nrows", float("inf"))
         chunksize = kwargs.get("chunksize", DEFAULT_CHUNK_SIZE)
@@ -62,7 +119,7 @@ class NDJsonFileTypes(FileTypes):
         extra_rows = []
 
         while nrows and row_count < nrows:
-            extra_rows.extend(stream.readlines(chunksize))
+            extra_rows.extend(rows_stream.readlines(chunksize))
             rows = extra_rows
             if len(rows) == 0:
                 break
@@ -83,3 +140,81 @@ class NDJsonFileTypes(FileTypes):
         # in a list and then concatenating in single call. This brought down the cost from 351.79550790786743
         # to 2.3778765201568604.
         return pd.concat(result_df)
+
+
+class NDJsonDataframeWriter(DataframeWriter):
+    """Append the rows of dataframes to a ndjson file"""
+
+    writes_arrow = False
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Write the rows of a dataframe after the ones already written.
+
+        :param df: pandas dataframe
+        """
+        lines = df.to_json(orient="records", lines=True)
+        # Older pandas versions don't end the last line with a new line
+        if lines and not lines.endswith("\n"):
+            lines += "\n"
+        self.stream.write(lines)
+
+
+def read_ndjson_bytes(stream, nrows: int | None = None) -> pa.Buffer:
+    """
+    Read the content of a ndjson file, or of its first ``nrows`` lines, as UTF-8 encoded bytes.
+
+    :param stream: Text or binary file stream object
+    :param nrows: Number of lines to be read. Default None, the whole file is read
+    """
+    if nrows is not None:
+        content = "".join(
+            line if isinstance(line, str) else line.decode("utf-8")
+            for line in itertools.islice(stream, nrows)
+        )
+        return pa.py_buffer(content.encode("utf-8"))
+    return pa.py_buffer(as_binary_stream(stream).read())
+
+
+def read_ndjson_table(data: pa.Buffer) -> pa.Table:
+    """
+    Parse ndjson content with pyarrow and flatten its nested objects in columns named after their path.
+
+    The strings pyarrow infers as timestamps are kept as strings, as they are by pandas ``json_normalize()``.
+
+    :param data: UTF-8 encoded ndjson content
+    """
+    table = pa_json.read_json(pa.BufferReader(data))
+    schema = pa.schema([field.with_type(_replace_timestamps(field.type)) for field in table.schema])
+    if not schema.equals(table.schema):
+        parse_options = pa_json.ParseOptions(explicit_schema=schema)
+        table = pa_json.read_json(pa.BufferReader(data), parse_options=parse_options)
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table
+
+
+def read_ndjson_with_pyarrow(data: pa.Buffer) -> pd.DataFrame:
+    """
+    Parse ndjson content with pyarrow in a pandas dataframe, see ``read_ndjson_table``.
+
+    :param data: UTF-8 encoded ndjson content
+    """
+    table = read_ndjson_table(data)
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type):
+            # pandas json_normalize() keeps the arrays as lists
+            df[field.name] = [None if value is None else value.tolist() for value in df[field.name]]
+    return df
+
+
+def _replace_timestamps(data_type: pa.DataType) -> pa.DataType:
+    """Replace the timestamps in a pyarrow type, including the nested ones, by strings"""
+    if pa.types.is_timestamp(data_type):
+        return pa.string()
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(_replace_timestamps(field.type)) for field in data_type])
+    if pa.types.is_list(data_type):
+        return pa.list_(data_type.value_field.with_type(_replace_timestamps(data_type.value_type)))
+    return data_type
@@ -1,52 +1,212 @@
 from __future__ import annotations
 
 import io
+import operator
+import shutil
+import tempfile
+from typing import IO, Any, Callable, Iterator, List, Tuple, cast
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from universal_transfer_operator.constants import FileType as FileTypeConstants
 from universal_transfer_operator.datasets.dataframe.pandas import (
     PandasDataframe,
     convert_columns_names_capitalization,
 )
-from universal_transfer_operator.datasets.file.types.base import FileTypes
+from universal_transfer_operator.datasets.file.types.base import (
+    DataframeWriter,
+    FileTypes,
+    convert_arrow_columns_names_capitalization,
+)
+from universal_transfer_operator.settings import STREAM_COPY_BLOCK_SIZE, STREAM_SPILL_TO_DISK_THRESHOLD
+
+# Number of rows of the dataframes a whole parquet file is read in before they are concatenated
+DEFAULT_BATCH_ROWS = 65536
+
+
+# Filters of the rows read from parquet files, as (column, operator, value) tuples which all have to match
+ParquetFilters = List[Tuple[str, str, Any]]
+
+FILTER_OPERATORS: dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, values: series.isin(values),
+    "not in": lambda series, values: ~series.isin(values),
+}
 
 
 class ParquetFileTypes(FileTypes):
     """Concrete implementation to handle Parquet file type"""
 
-    def export_to_dataframe(self, stream, columns_names_capitalization="original", **kwargs):
+    def export_to_dataframe(
+        self,
+        stream,
+        columns_names_capitalization="original",
+        columns: list[str] | None = None,
+        filters: ParquetFilters | None = None,
+        nrows: int | None = None,
+        **kwargs,
+    ):
         """
         Read parquet file from one of the supported locations and return dataframe.
 
+        Only the footer and the row groups which may have rows matching ``filters``, according to their statistics,
+        are read. With ``nrows``, e.g. to autodetect the schema of a table, the reading stops at the row group
+        holding the last row needed.
+
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param columns: Columns to be read. Default None, all the columns are read
+        :param filters: Filters of the rows to be read as (column, operator, value) tuples, e.g.
+            ``[("year", ">=", 2020)]``, all of them having to match. The operators are ``=``, ``!=``, ``<``, ``<=``,
+            ``>``, ``>=``, ``in`` and ``not in``
+        :param nrows: Maximum number of rows to be read. Default None, all the rows are read
+        """
+        dataframes: list[pd.DataFrame] = []
+        row_count = 0
+        for df in self.iter_dataframes(
+            stream,
+            chunk_rows=nrows or DEFAULT_BATCH_ROWS,
+            columns_names_capitalization=columns_names_capitalization,
+            columns=columns,
+            filters=filters,
+            **kwargs,
+        ):
+            if nrows is not None:
+                df = df.iloc[: nrows - row_count]
+            dataframes.append(df)
+            row_count += len(df)
+            if nrows is not None and row_count >= nrows:
+                break
+        df = dataframes[0] if len(dataframes) == 1 else pd.concat(dataframes, ignore_index=True)
+        return PandasDataframe.from_pandas_df(df)
+
+    def export_to_arrow(
+        self,
+        stream,
+        columns_names_capitalization="original",
+        columns: list[str] | None = None,
+        **kwargs,
+    ) -> pa.Table:
+        """
+        Read parquet file from one of the supported locations and return an Arrow table, without converting it to
+        a pandas dataframe. Files read with ``filters`` or ``nrows`` are read in a pandas dataframe first.
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting table
+        :param columns: Columns to be read. Default None, all the columns are read
         """
-        kwargs_copy = dict(kwargs)
-        # Pandas `read_parquet` does not support the `nrows` parameter
-        kwargs_copy.pop("nrows", None)
+        if kwargs:
+            return super().export_to_arrow(
+                stream, columns_names_capitalization=columns_names_capitalization, columns=columns, **kwargs
+            )
+        table = pq.ParquetFile(self._get_random_access_stream(stream)).read(columns=columns)
+        return convert_arrow_columns_names_capitalization(table, columns_names_capitalization)
 
-        byte_io_buffer = self._convert_remote_file_to_byte_stream(stream)
+    def iter_dataframes(
+        self,
+        stream,
+        chunk_rows: int,
+        columns_names_capitalization="original",
+        columns: list[str] | None = None,
+        filters: ParquetFilters | None = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read parquet file from one of the supported locations in dataframes of up to ``chunk_rows`` rows, one row
+        group after the other. The row groups which can't have rows matching ``filters`` are skipped.
+
+        :param stream: file stream object
+        :param chunk_rows: Maximum number of rows of each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframes
+        :param columns: Columns to be read. Default None, all the columns are read
+        :param filters: Filters of the rows to be read, see ``export_to_dataframe``
+        :param kwargs: Arguments of ``pyarrow.parquet.ParquetFile.iter_batches``, e.g. ``use_threads``
+        """
+        filters = filters or []
+        for column, operator_name, _ in filters:
+            if operator_name not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported operator {operator_name} in the filter of the column {column}")
+
+        parquet_file = pq.ParquetFile(self._get_random_access_stream(stream))
+        metadata = parquet_file.metadata
+        row_groups = [
+            index
+            for index in range(metadata.num_row_groups)
+            if row_group_may_match(metadata.row_group(index), filters)
+        ]
+        # The columns filtered on are read too, and dropped once the rows are filtered
+        read_columns = columns
+        if columns is not None:
+            read_columns = list(dict.fromkeys(columns + [column for column, _, _ in filters]))
+        schema = parquet_file.schema_arrow
+        if read_columns is not None:
+            schema = pa.schema([schema.field(column) for column in read_columns])
+
+        empty = True
+        for batch in parquet_file.iter_batches(
+            batch_size=chunk_rows, row_groups=row_groups, columns=read_columns, **kwargs
+        ):
+            df = filter_dataframe(batch.to_pandas(), filters)
+            if df.empty:
+                continue
+            empty = False
+            yield self._select_columns(df, columns, columns_names_capitalization)
+        if empty:
+            # A file without any row matching still has columns
+            yield self._select_columns(
+                schema.empty_table().to_pandas(), columns, columns_names_capitalization
+            )
 
-        df = pd.read_parquet(byte_io_buffer, **kwargs_copy)
+    @staticmethod
+    def _select_columns(
+        df: pd.DataFrame, columns: list[str] | None, columns_names_capitalization
+    ) -> pd.DataFrame:
+        """Keep the columns which were requested, converting their names to the required case"""
+        if columns is not None:
+            df = df[columns]
         df = convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
         return PandasDataframe.from_pandas_df(df)
 
+    @classmethod
+    def _get_random_access_stream(cls, stream) -> IO[bytes]:
+        """
+        Get a stream pyarrow can seek in to read the footer and the row groups of a parquet file. The streams of
+        local, S3, GCS and SFTP files are seekable, only the parts needed being fetched with ranged requests. Other
+        streams are buffered first.
+        """
+        seekable = getattr(stream, "seekable", None)
+        if seekable is not None and seekable():
+            return cast(IO[bytes], stream)
+        return cls._convert_remote_file_to_byte_stream(stream)
+
     @staticmethod
-    def _convert_remote_file_to_byte_stream(stream) -> io.IOBase:
+    def _convert_remote_file_to_byte_stream(stream) -> IO[bytes]:
         """
         Convert file stream into a buffer that can be streamed into other data
         structures.
         Due to noted issues with using parquet files with smart_open+pandas (like
-        https://github.com/RaRe-Technologies/smart_open/issues/524), we create a BytesIO buffer
-        before exporting to a dataframe. We've found a sizable speed improvement with this optimization
+        https://github.com/RaRe-Technologies/smart_open/issues/524), we create a seekable buffer
+        before exporting to a dataframe. We've found a sizable speed improvement with this optimization.
+        The buffer is kept in memory up to STREAM_SPILL_TO_DISK_THRESHOLD bytes and spilled to disk beyond that.
         Returns: an io object that can be streamed into a dataframe (or other object)
         """
-        remote_obj_buffer = io.BytesIO()
-        remote_obj_buffer.write(stream.read())
+        remote_obj_buffer = tempfile.SpooledTemporaryFile(  # skipcq: PTC-W6004
+            max_size=STREAM_SPILL_TO_DISK_THRESHOLD, mode="w+b"
+        )
+        shutil.copyfileobj(stream, remote_obj_buffer, STREAM_COPY_BLOCK_SIZE)
         remote_obj_buffer.seek(0)
         return remote_obj_buffer
 
@@ -60,6 +220,112 @@ class ParquetFileTypes(FileTypes):
         """
         df.to_parquet(stream)
 
+    def create_from_arrow(self, table: pa.Table, stream) -> None:  # skipcq PYL-R0201
+        """
+        Write an Arrow table to a parquet file of one of the supported locations.
+
+        :param table: Arrow table
+        :param stream: file stream object
+        """
+        pq.write_table(table, stream)
+
+    def create_dataframe_writer(self, stream) -> DataframeWriter:
+        """
+        Get a writer adding each dataframe as a row group of a single parquet file.
+
+        :param stream: file stream object
+        """
+        return ParquetDataframeWriter(file_type=self, stream=stream)
+
     @property
     def name(self):
         return FileTypeConstants.PARQUET
+
+
+class ParquetDataframeWriter(DataframeWriter):
+    """Write dataframes as the row groups of a parquet file, the schema is the one of the first dataframe"""
+
+    def __init__(self, file_type: FileTypes, stream):
+        super().__init__(file_type=file_type, stream=stream)
+        self.writer: pq.ParquetWriter | None = None
+
+    def write_chunk(self, df: pd.DataFrame | pa.Table) -> None:
+        """
+        Write a dataframe as a new row group.
+
+        :param df: pandas dataframe or Arrow table
+        """
+        schema = self.writer.schema if self.writer else None
+        if isinstance(df, pa.Table):
+            table = df.cast(schema) if schema is not None and not df.schema.equals(schema) else df
+        else:
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.stream, table.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        """Write the footer of the file"""
+        if self.writer is not None:
+            self.writer.close()
+
+
+def row_group_may_match(row_group: pq.RowGroupMetaData, filters: ParquetFilters) -> bool:
+    """
+    Check if a row group may have rows matching the filters, according to the minimum and maximum values of its
+    columns. Row groups without statistics for a column are always read.
+
+    :param row_group: Metadata of the row group
+    :param filters: Filters of the rows to be read, see ``ParquetFileTypes.export_to_dataframe``
+    """
+    statistics_by_column = {}
+    for index in range(row_group.num_columns):
+        column = row_group.column(index)
+        statistics_by_column[column.path_in_schema] = column.statistics
+    for column_name, operator_name, value in filters:
+        statistics = statistics_by_column.get(column_name)
+        if statistics is None or not statistics.has_min_max:
+            continue
+        try:
+            if not range_may_match(statistics.min, statistics.max, operator_name, value):
+                return False
+        except TypeError:
+            # The value can't be compared with the statistics, the rows are filtered once read
+            continue
+    return True
+
+
+def range_may_match(minimum: Any, maximum: Any, operator_name: str, value: Any) -> bool:
+    """
+    Check if some values between ``minimum`` and ``maximum`` may match a filter.
+
+    :param minimum: Lowest value
+    :param maximum: Highest value
+    :param operator_name: Operator of the filter
+    :param value: Value of the filter
+    """
+    if operator_name in ("=", "=="):
+        return bool(minimum <= value <= maximum)
+    if operator_name == "in":
+        return any(minimum <= item <= maximum for item in value)
+    if operator_name in ("<", "<="):
+        return bool(FILTER_OPERATORS[operator_name](minimum, value))
+    if operator_name in (">", ">="):
+        return bool(FILTER_OPERATORS[operator_name](maximum, value))
+    # Values different from the filter can't be ruled out from the range
+    return True
+
+
+def filter_dataframe(df: pd.DataFrame, filters: ParquetFilters) -> pd.DataFrame:
+    """
+    Keep the rows of the dataframe matching all the filters.
+
+    :param df: pandas dataframe
+    :param filters: Filters of the rows, see ``ParquetFileTypes.export_to_dataframe``
+    """
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, operator_name, value in filters:
+        mask &= FILTER_OPERATORS[operator_name](df[column], value)
+    return df[mask].reset_index(drop=True)
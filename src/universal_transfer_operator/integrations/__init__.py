@@ -3,11 +3,9 @@ from __future__ import annotations
 import importlib
 from typing import Type, cast
 
-from airflow.hooks.base import BaseHook
-
 from universal_transfer_operator.constants import IngestorSupported
 from universal_transfer_operator.integrations.base import TransferIntegration, TransferIntegrationOptions
-from universal_transfer_operator.utils import get_class_name
+from universal_transfer_operator.utils import get_class_name, get_connection
 
 CUSTOM_INGESTION_TYPE_TO_MODULE_PATH = {
     "fivetran": "universal_transfer_operator.integrations.fivetran.fivetran"
@@ -30,7 +28,7 @@ def get_ingestor_class(conn_id: str) -> type[TransferIntegration]:
 
     :param transfer_params: kwargs to be used by methods involved in transfer using FiveTran.
     """
-    thirdparty_conn_type = BaseHook.get_connection(conn_id).conn_type
+    thirdparty_conn_type = get_connection(conn_id).conn_type
     if thirdparty_conn_type not in {item.value for item in IngestorSupported}:
         raise ValueError("Ingestion platform not yet supported.")
 
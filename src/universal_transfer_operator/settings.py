@@ -20,6 +20,14 @@ DATAFRAME_STORAGE_URL = conf.get(SECTION_KEY, "xcom_storage_url", fallback=tempf
 # DATAFRAME_STORAGE_CONN_ID & DATAFRAME_STORAGE_URL above
 MAX_DATAFRAME_MEMORY_FOR_XCOM_DB = conf.getint(SECTION_KEY, "max_dataframe_mem_for_xcom_db", fallback=100)
 
+# Time in seconds - Dataframes stored in the Object Store are deleted by `cleanup_dataframe_storage` once older
+# than that. Identical dataframes stored since less than half of it are reused instead of being uploaded again.
+DATAFRAME_STORAGE_TTL = conf.getint(SECTION_KEY, "xcom_storage_ttl", fallback=7 * 24 * 60 * 60)
+
+# Dataframes stored in the Object Store are only downloaded when a task first accesses them. Opt-in, since the
+# proxy pulled isn't a pandas dataframe
+XCOM_LAZY_DATAFRAMES = conf.getboolean(SECTION_KEY, "xcom_lazy_dataframes", fallback=False)
+
 ENABLE_XCOM_PICKLING = conf.getboolean("core", "enable_xcom_pickling")
 IS_BASE_XCOM_BACKEND = conf.get("core", "xcom_backend") == "airflow.models.xcom.BaseXCom"
 
@@ -45,6 +53,23 @@ LOAD_TABLE_AUTODETECT_ROWS_COUNT = conf.getint(
     section=SECTION_KEY, key="load_table_autodetect_rows_count", fallback=1000
 )
 
+# Size is in bytes - Size of the blocks used to copy a file stream from the source to the destination
+STREAM_COPY_BLOCK_SIZE = conf.getint(SECTION_KEY, "stream_copy_block_size", fallback=8 * 1024 * 1024)
+
+# Size is in bytes - Max memory used to buffer a file stream which needs random access (e.g. parquet).
+# Bigger files are spilled to a temporary file on disk.
+STREAM_SPILL_TO_DISK_THRESHOLD = conf.getint(
+    SECTION_KEY, "stream_spill_to_disk_threshold", fallback=64 * 1024 * 1024
+)
+
+# Number of pages of a file listing (S3, GCS, SFTP directories) fetched in the background ahead of the transfer
+LISTING_PREFETCH_PAGES = conf.getint(SECTION_KEY, "listing_prefetch_pages", fallback=2)
+
+# Connection pool of the SQLAlchemy engines, shared by the data providers of a database connection during a transfer
+SQL_POOL_SIZE = conf.getint(SECTION_KEY, "sql_pool_size", fallback=5)
+# Check that pooled connections are still alive before using them
+SQL_POOL_PRE_PING = conf.getboolean(SECTION_KEY, "sql_pool_pre_ping", fallback=True)
+
 
 # Fivetran AWS VPC Account ID. Read more at https://fivetran.com/docs/files/amazon-s3/setup-guide#createaniamrole
 FIVETRAN_AWS_VPC_ACCOUNT_ID = conf.getint(
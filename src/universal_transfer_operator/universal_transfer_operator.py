@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+import time
+from typing import Any, Callable
 
 from airflow.models import BaseOperator
 from airflow.utils.context import Context
 
 from universal_transfer_operator.constants import TransferMode
 from universal_transfer_operator.data_providers import create_dataprovider, get_dataprovider_options_class
+from universal_transfer_operator.data_providers.base import DataProviders
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
 from universal_transfer_operator.integrations import (
@@ -15,6 +18,7 @@ from universal_transfer_operator.integrations import (
     get_transfer_integration,
 )
 from universal_transfer_operator.integrations.base import TransferIntegrationOptions
+from universal_transfer_operator.utils import imap_bounded, transfer_cache
 
 
 class UniversalTransferOperator(BaseOperator):
@@ -48,12 +52,18 @@ class UniversalTransferOperator(BaseOperator):
         super().__init__(**kwargs)
 
     def execute(self, context: Context) -> Any:  # skipcq: PYL-W0613
-        self._populate_transfer_params()
+        # Airflow connections, hooks and engines are shared by the data providers for the duration of the transfer
+        with transfer_cache():
+            self._populate_transfer_params()
 
-        if self.transfer_mode == TransferMode.THIRDPARTY:
-            transfer_integration = get_transfer_integration(self.transfer_params)
-            return transfer_integration.transfer_job(self.source_dataset, self.destination_dataset)
+            if self.transfer_mode == TransferMode.THIRDPARTY:
+                transfer_integration = get_transfer_integration(self.transfer_params)
+                return transfer_integration.transfer_job(self.source_dataset, self.destination_dataset)
+
+            return self._transfer()
 
+    def _transfer(self) -> Any:
+        """Transfer the source dataset to the destination dataset using their data providers."""
         source_dataprovider = create_dataprovider(
             dataset=self.source_dataset,
             transfer_params=self.transfer_params,
@@ -75,10 +85,60 @@ class UniversalTransferOperator(BaseOperator):
                 f" or {TransferMode.THIRDPARTY}"
             )
 
-        destination_references = []
-        for source_data in source_dataprovider.read():
-            destination_references.append(destination_dataprovider.write(source_data))
-        return destination_references
+        if (
+            self.transfer_params.sync
+            and isinstance(self.source_dataset, File)
+            and isinstance(self.destination_dataset, File)
+        ):
+            return destination_dataprovider.sync(source_dataprovider)  # type: ignore[attr-defined]
+
+        with destination_dataprovider:
+            if self.transfer_params.pipelined or self._file_concurrency > 1:
+                return self._transfer_pipelined(source_dataprovider, destination_dataprovider)
+
+            destination_references = []
+            for source_data in source_dataprovider.read():
+                destination_references.append(destination_dataprovider.write(source_data))
+            return destination_references
+
+    def _transfer_pipelined(
+        self, source_dataprovider: DataProviders, destination_dataprovider: DataProviders
+    ) -> list[Any]:
+        """
+        Read from the source while the previously read items are being written to the destination.
+
+        Items are written by ``transfer_params.writer_workers`` threads, or ``transfer_params.concurrency`` if
+        greater and the destination is a file, and at most ``transfer_params.max_inflight`` items are held in
+        memory. The destination references are returned in the order the items were read.
+        """
+        max_workers = max(self.transfer_params.writer_workers, self._file_concurrency)
+        return list(
+            imap_bounded(
+                self._timed_write(destination_dataprovider),
+                source_dataprovider.read(),
+                max_workers=max_workers,
+                max_inflight=max(self.transfer_params.max_inflight, max_workers),
+            )
+        )
+
+    @property
+    def _file_concurrency(self) -> int:
+        """Number of files written in parallel, tables are always written by a single writer"""
+        if isinstance(self.destination_dataset, File):
+            return int(self.transfer_params.concurrency)
+        return 1
+
+    @staticmethod
+    def _timed_write(destination_dataprovider: DataProviders) -> Callable[[Any], Any]:
+        """Wrap ``destination_dataprovider.write`` to log the time spent writing each item."""
+
+        def write(source_data: Any) -> Any:
+            start = time.monotonic()
+            destination_reference = destination_dataprovider.write(source_data)
+            logging.info("Wrote %s in %.2f seconds", destination_reference, time.monotonic() - start)
+            return destination_reference
+
+        return write
 
     def _populate_transfer_params(self):
         """
@@ -1,18 +1,71 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterable, Iterator, TypeVar
 
 import attr
 from airflow.hooks.base import BaseHook
+from airflow.models.connection import Connection
+from sqlalchemy.engine.base import Engine
 
 from universal_transfer_operator.constants import LoadExistStrategy
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
 
+T = TypeVar("T")
+
 
 @attr.define
 class TransferParameters:
+    """
+    Transfer parameters shared by all the transfers.
+
+    :param if_exists: Overwrite table if exists. Default 'replace'
+    :param pipelined: Overlap reading of the next item from the source with writing of the current item to the
+        destination. Default False
+    :param writer_workers: Number of threads writing to the destination when ``pipelined`` is set. Default 1
+    :param max_inflight: Maximum number of items read from the source and not yet written to the destination
+        when ``pipelined`` is set. Bounds the memory used by the transfer. Default 2
+    :param concurrency: Number of files transferred in parallel when the source is a file pattern or prefix.
+        Default 1
+    :param sync: Only transfer the files of the source which are missing or different in the destination, when
+        both are files. Default False
+    :param sync_delete: Delete the destination files which aren't in the source when ``sync`` is set. Default False
+    :param chunk_size: Number of rows of the dataframes a table is read in, using a server side cursor. The chunks
+        are appended one by one to the destination. Default None, the whole table is read in a single dataframe.
+        Also the number of rows of the chunks CSV, JSON and parquet files are parsed in when loaded to a table,
+        default 1000000
+    :param partition_column: Numeric or date column a table is split on to be read by concurrent queries, each on
+        its own connection. Default None, the table is read by a single query
+    :param partitions: Number of ranges of ``partition_column`` read concurrently. Default 4
+    :param partition_bounds: Lower and upper values of ``partition_column`` the ranges are computed from. The
+        first and last ranges are unbounded, so rows outside of them are still read. Default None, the minimum
+        and maximum values of the column are queried
+    :param file_per_partition: Write each partition of the source table to its own file, suffixed with the
+        partition number, when the destination is a file. Default False
+    :param unload_max_file_size: Maximum size in bytes of the files written by a native unload of a table to a
+        folder, e.g. by Snowflake ``COPY INTO @stage``. Default None, the default of the database
+    """
+
     if_exists: LoadExistStrategy = attr.field(default="replace")
+    pipelined: bool = attr.field(default=False)
+    writer_workers: int = attr.field(default=1)
+    max_inflight: int = attr.field(default=2)
+    concurrency: int = attr.field(default=1)
+    sync: bool = attr.field(default=False)
+    sync_delete: bool = attr.field(default=False)
+    chunk_size: int | None = attr.field(default=None)
+    partition_column: str | None = attr.field(default=None)
+    partitions: int = attr.field(default=4)
+    partition_bounds: tuple[Any, Any] | None = attr.field(default=None)
+    file_per_partition: bool = attr.field(default=False)
+    unload_max_file_size: int | None = attr.field(default=None)
 
 
 def check_if_connection_exists(conn_id: str) -> bool:
@@ -24,7 +77,7 @@ def check_if_connection_exists(conn_id: str) -> bool:
     :return bool: If the connection exists, return True
     """
     try:
-        BaseHook.get_connection(conn_id)
+        get_connection(conn_id)
     except ValueError:
         return False
     return True
@@ -34,7 +87,75 @@ def get_dataset_connection_type(dataset: Table | File) -> Any:
     """
     Given dataset fetch the connection type based on airflow connection
     """
-    return BaseHook.get_connection(dataset.conn_id).conn_type
+    return get_connection(dataset.conn_id).conn_type
+
+
+# Objects memoised until the end of the current transfer, None outside of a transfer
+_transfer_cache: dict[Hashable, Any] | None = None
+_transfer_cache_lock = threading.Lock()
+
+
+@contextmanager
+def transfer_cache() -> Iterator[None]:
+    """
+    Memoise the Airflow connections, and the other objects got through ``get_cached`` like hooks and SQLAlchemy
+    engines, until the end of the block, e.g. of the ``execute`` of an operator. Nested blocks share the cache of
+    the outermost one. The connection pools of the cached engines are disposed of at the end of the block.
+    """
+    global _transfer_cache  # skipcq: PYL-W0603
+    with _transfer_cache_lock:
+        outermost = _transfer_cache is None
+        if outermost:
+            _transfer_cache = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            with _transfer_cache_lock:
+                cached = list(_transfer_cache.values()) if _transfer_cache else []
+                _transfer_cache = None
+            for value in cached:
+                _dispose(value)
+
+
+def get_cached(key: Hashable, create: Callable[[], T]) -> T:
+    """
+    Get the object memoised for ``key`` in the current transfer, creating it on first use. Outside of a transfer,
+    see ``transfer_cache``, the object is created on every call.
+
+    :param key: Key of the object, e.g. the kind of object and the connection id
+    :param create: Callable creating the object
+    """
+    with _transfer_cache_lock:
+        cache = _transfer_cache
+        if cache is not None and key in cache:
+            return cache[key]  # type: ignore[no-any-return]
+    # Created without holding the lock, since creating an object can get other ones from the cache
+    value = create()
+    if cache is None:
+        return value
+    with _transfer_cache_lock:
+        cached = cache.setdefault(key, value)
+    if cached is not value:
+        # Another thread created the object first
+        _dispose(value)
+    return cached  # type: ignore[no-any-return]
+
+
+def _dispose(value: Any) -> None:
+    """Close the connection pool of a SQLAlchemy engine removed from the cache"""
+    if isinstance(value, Engine):
+        logging.debug("Disposing of the connection pool of %s", value)
+        value.dispose()
+
+
+def get_connection(conn_id: str) -> Connection:
+    """
+    Get the Airflow connection, fetching it from the metadata database or secrets backend once per transfer.
+
+    :param conn_id: Airflow connection ID
+    """
+    return get_cached(("connection", conn_id), functools.partial(BaseHook.get_connection, conn_id))
 
 
 def get_class_name(module_ref: Any, suffix: str = "Location") -> str:
@@ -62,3 +183,128 @@ def get_class_name(module_ref: Any, suffix: str = "Location") -> str:
     raise ValueError(
         "No expected class name found, please note that the class names should an expected formats."
     )
+
+
+def imap_bounded(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    max_workers: int = 1,
+    max_inflight: int | None = None,
+) -> Iterator[Any]:
+    """
+    Apply ``func`` to every item of ``iterable`` in a pool of threads and yield the results in input order.
+
+    Items are pulled from ``iterable`` in the calling thread, so producing the item N+1 overlaps with ``func``
+    running on the item N. No more than ``max_inflight`` items are submitted and not yet yielded at any time.
+    If ``func`` raises, the work not yet started is cancelled and the exception of the earliest failing item is
+    raised. If ``iterable`` raises, the items submitted before are drained first, so errors are always raised
+    in input order.
+
+    :param func: Callable applied to each item
+    :param iterable: Items to be processed
+    :param max_workers: Number of threads running ``func``
+    :param max_inflight: Maximum number of items submitted and not yet yielded. Default to ``max_workers``
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    max_inflight = max(max_inflight or max_workers, 1)
+
+    inflight: deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        iterator = iter(iterable)
+        while True:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            except Exception:
+                # Raise the errors of the items read before the failing one first
+                while inflight:
+                    inflight.popleft().result()
+                raise
+            inflight.append(executor.submit(func, item))
+            if len(inflight) >= max_inflight:
+                yield inflight.popleft().result()
+        while inflight:
+            yield inflight.popleft().result()
+    finally:
+        for future in inflight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def prefetch(iterable: Iterable[Any], max_prefetch: int = 1) -> Iterator[Any]:
+    """
+    Iterate over ``iterable`` in a background thread and yield its items, keeping up to ``max_prefetch`` items
+    ready ahead of the consumer. Useful to overlap paginated API calls with the processing of the previous page.
+    Errors raised by ``iterable`` are re-raised to the consumer, after the items produced before them.
+
+    :param iterable: Items to be prefetched
+    :param max_prefetch: Maximum number of items produced and not yet consumed
+    """
+    yield from interleave([iterable], max_workers=1, max_prefetch=max_prefetch)
+
+
+def interleave(iterables: Iterable[Iterable[Any]], max_workers: int, max_prefetch: int = 1) -> Iterator[Any]:
+    """
+    Iterate over each of ``iterables`` in a pool of threads and yield their items as they are produced, e.g. to
+    read several partitions of a table concurrently. Up to ``max_prefetch`` items are kept ready ahead of the
+    consumer. The first error raised by one of ``iterables`` stops the others and is re-raised to the consumer.
+
+    :param iterables: Iterables to be consumed concurrently
+    :param max_workers: Number of threads consuming ``iterables``
+    :param max_prefetch: Maximum number of items produced and not yet consumed
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    if max_prefetch < 1:
+        raise ValueError("max_prefetch must be greater than 0")
+
+    items: queue.Queue = queue.Queue(maxsize=max_prefetch)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+    producers = [executor.submit(_produce, iterable, items, stop) for iterable in iterables]
+    try:
+        remaining = len(producers)
+        while remaining:
+            item, error = items.get()
+            if item is not _PREFETCH_DONE:
+                yield item
+            elif error is not None:
+                raise error
+            else:
+                remaining -= 1
+    finally:
+        stop.set()
+        for producer in producers:
+            producer.cancel()
+        executor.shutdown(wait=True)
+
+
+_PREFETCH_DONE = object()
+
+
+def _produce(iterable: Iterable[Any], items: queue.Queue, stop: threading.Event) -> None:
+    """Put the items of ``iterable`` in the ``items`` queue, followed by ``_PREFETCH_DONE`` and the error if any"""
+    try:
+        for item in iterable:
+            if not _put_unless_stopped(items, (item, None), stop):
+                return
+    except Exception as error:  # skipcq: PYL-W0703
+        _put_unless_stopped(items, (_PREFETCH_DONE, error), stop)
+        return
+    _put_unless_stopped(items, (_PREFETCH_DONE, None), stop)
+
+
+def _put_unless_stopped(
+    items: queue.Queue, entry: tuple[Any, Exception | None], stop: threading.Event
+) -> bool:
+    """Put ``entry`` in the queue, giving up when the consumer stopped iterating instead of blocking forever"""
+    while not stop.is_set():
+        try:
+            items.put(entry, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
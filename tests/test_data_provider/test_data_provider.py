@@ -1,8 +1,11 @@
+import io
+from unittest import mock
+
 import pytest
 
 from universal_transfer_operator.constants import TransferMode
 from universal_transfer_operator.data_providers import create_dataprovider, get_dataprovider_options_class
-from universal_transfer_operator.data_providers.base import DataProviders
+from universal_transfer_operator.data_providers.base import DataProviders, DataStream
 from universal_transfer_operator.data_providers.database.snowflake import (
     SnowflakeDataProvider,
     SnowflakeOptions,
@@ -101,3 +104,42 @@ def test_openlineage_dataset_uri():
 
     test = Test(dataset=File("/tmp/test.csv"), transfer_mode=TransferMode.NONNATIVE)
     assert test.openlineage_dataset_uri == "http://localhost:9900/rest/v1/get_user"
+
+
+def test_data_stream_copy_to_in_blocks():
+    """
+    Test that DataStream copies the content in blocks of the given size and closes the stream it opened
+    """
+    source = io.BytesIO(b"0123456789")
+    source.read = mock.MagicMock(wraps=source.read)
+    data_stream = DataStream(
+        actual_filename="sample.bin", actual_file=File("/tmp/sample.bin"), opener=lambda: source
+    )
+    destination = io.BytesIO()
+
+    data_stream.copy_to(destination, block_size=4)
+
+    assert destination.getvalue() == b"0123456789"
+    assert all(call == mock.call(4) for call in source.read.call_args_list)
+    assert source.closed
+
+
+def test_data_stream_as_seekable_spills_to_disk():
+    """
+    Test that DataStream content bigger than max_size is spilled to disk for consumers that need to seek
+    """
+
+    class NonSeekableStream(io.BytesIO):
+        def seekable(self):
+            return False
+
+    data_stream = DataStream(
+        actual_filename="sample.parquet",
+        actual_file=File("/tmp/sample.parquet"),
+        opener=lambda: NonSeekableStream(b"0123456789"),
+    )
+    seekable = data_stream.as_seekable(max_size=4)
+
+    assert seekable.seekable()
+    assert seekable._rolled
+    assert seekable.read() == b"0123456789"
@@ -0,0 +1,56 @@
+"""Tests specific to the Bigquery Database implementation."""
+from unittest import mock
+
+import pytest
+from universal_transfer_operator.constants import FileType, TransferMode
+from universal_transfer_operator.data_providers.database.google.bigquery import BigqueryDataProvider
+from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.table import Metadata, Table
+
+
+@pytest.mark.parametrize(
+    "path,destination_uri,expected_files",
+    [
+        (
+            "gs://bucket/folder/",
+            "gs://bucket/folder/some_table_*.parquet",
+            [
+                "gs://bucket/folder/some_table_000000000000.parquet",
+                "gs://bucket/folder/some_table_000000000001.parquet",
+            ],
+        ),
+        (
+            "gs://bucket/folder/export.parquet",
+            "gs://bucket/folder/export.parquet",
+            ["gs://bucket/folder/export.parquet"],
+        ),
+    ],
+    ids=["prefix", "file"],
+)
+@mock.patch.object(BigqueryDataProvider, "hook", new_callable=mock.PropertyMock)
+def test_export_table_to_file_natively(hook, path, destination_uri, expected_files):
+    """Test that tables are exported to GCS by an extract job, sharded when the file is a prefix"""
+    hook.return_value.project_id = "project"
+    hook.return_value.insert_job.return_value.destination_uri_file_counts = [len(expected_files)]
+    dp = BigqueryDataProvider(
+        dataset=Table(name="some_table", metadata=Metadata(schema="dataset")),
+        transfer_mode=TransferMode.NATIVE,
+    )
+
+    files = dp.export_table_to_file_natively(
+        source_table=dp.dataset,
+        target_file=File(path=path, conn_id="google_cloud_default", filetype=FileType.PARQUET),
+    )
+
+    hook.return_value.insert_job.assert_called_once_with(
+        configuration={
+            "jobType": "EXTRACT",
+            "extract": {
+                "sourceTable": {"projectId": "project", "datasetId": "dataset", "tableId": "some_table"},
+                "destinationUris": [destination_uri],
+                "destinationFormat": "PARQUET",
+            },
+            "labels": {"source_table": "some_table"},
+        }
+    )
+    assert files == expected_files
@@ -1,11 +1,19 @@
 """Tests specific to the Snowflake Database implementation."""
 import pathlib
+from unittest import mock
 
+import pandas as pd
 import pytest
 
-from universal_transfer_operator.constants import TransferMode
-from universal_transfer_operator.data_providers.database.snowflake import SnowflakeDataProvider
-from universal_transfer_operator.datasets.table import Table
+from universal_transfer_operator.constants import FileType, TransferMode
+from universal_transfer_operator.data_providers.database.snowflake import (
+    SnowflakeDataProvider,
+    SnowflakeOptions,
+    SnowflakeStage,
+)
+from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.table import Metadata, Table
+from universal_transfer_operator.integrations.base import TransferIntegrationOptions
 
 DEFAULT_CONN_ID = "snowflake_default"
 CUSTOM_CONN_ID = "snowflake_conn"
@@ -31,3 +39,165 @@ def test_use_quotes(cols_eval):
     """
     dp = SnowflakeDataProvider(dataset=Table(name="some_table"), transfer_mode=TransferMode.NONNATIVE)
     assert dp.use_quotes(cols_eval["cols"]) == cols_eval["expected_result"]
+
+
+@pytest.mark.parametrize(
+    "path,filetype,expected_statement",
+    [
+        (
+            "s3://bucket/folder/",
+            FileType.PARQUET,
+            "COPY INTO @DB.SCHEMA.stage_test/ FROM DB.SCHEMA.some_table FILE_FORMAT = (TYPE = PARQUET) "
+            "OVERWRITE = TRUE DETAILED_OUTPUT = TRUE HEADER = TRUE MAX_FILE_SIZE = 104857600",
+        ),
+        (
+            "s3://bucket/folder/export.csv",
+            None,
+            "COPY INTO @DB.SCHEMA.stage_test/export.csv FROM DB.SCHEMA.some_table "
+            "FILE_FORMAT = (TYPE = CSV COMPRESSION = NONE) OVERWRITE = TRUE DETAILED_OUTPUT = TRUE HEADER = TRUE "
+            "SINGLE = TRUE MAX_FILE_SIZE = 5368709120",
+        ),
+        (
+            "s3://bucket/folder/",
+            FileType.NDJSON,
+            "COPY INTO @DB.SCHEMA.stage_test/ FROM (SELECT OBJECT_CONSTRUCT(*) FROM DB.SCHEMA.some_table) "
+            "FILE_FORMAT = (TYPE = JSON COMPRESSION = NONE) OVERWRITE = TRUE DETAILED_OUTPUT = TRUE "
+            "MAX_FILE_SIZE = 104857600",
+        ),
+    ],
+    ids=["parquet_prefix", "csv_file", "ndjson_prefix"],
+)
+@mock.patch.object(SnowflakeDataProvider, "drop_stage")
+@mock.patch.object(SnowflakeDataProvider, "create_stage")
+@mock.patch.object(SnowflakeDataProvider, "hook", new_callable=mock.PropertyMock)
+def test_export_table_to_file_natively(hook, create_stage, drop_stage, path, filetype, expected_statement):
+    """Test that tables are unloaded to the stage of the folder of the file, returning the files written"""
+    create_stage.return_value = SnowflakeStage(
+        name="stage_test", metadata=Metadata(database="DB", schema="SCHEMA")
+    )
+    hook.return_value.run.return_value = [
+        ("data_0_0_0.snappy.parquet", 10, 2),
+        ("data_0_1_0.snappy.parquet", 10, 2),
+    ]
+    dp = SnowflakeDataProvider(
+        dataset=Table(name="some_table", metadata=Metadata(database="DB", schema="SCHEMA")),
+        transfer_mode=TransferMode.NATIVE,
+        transfer_params=TransferIntegrationOptions(unload_max_file_size=100 * 1024 * 1024),
+    )
+
+    files = dp.export_table_to_file_natively(
+        source_table=dp.dataset, target_file=File(path=path, conn_id="aws_default", filetype=filetype)
+    )
+
+    assert hook.return_value.run.call_args.args[0] == expected_statement
+    drop_stage.assert_called_once_with(create_stage.return_value)
+    assert files == [
+        "s3://bucket/folder/data_0_0_0.snappy.parquet",
+        "s3://bucket/folder/data_0_1_0.snappy.parquet",
+    ]
+
+
+@mock.patch("universal_transfer_operator.data_providers.database.snowflake.iter_file_path_pattern")
+@mock.patch.object(File, "location", new_callable=mock.PropertyMock)
+@mock.patch.object(SnowflakeDataProvider, "drop_stage")
+@mock.patch.object(SnowflakeDataProvider, "create_stage")
+@mock.patch.object(SnowflakeDataProvider, "hook", new_callable=mock.PropertyMock)
+def test_load_files_of_pattern_in_batches(hook, create_stage, drop_stage, location, iter_file_path_pattern):
+    """Test that the files of a pattern are loaded by batches of 1000 files, each batch validated first, through a
+    stage created once per transfer"""
+    create_stage.return_value = SnowflakeStage(
+        name="stage_test", metadata=Metadata(database="DB", schema="SCHEMA")
+    )
+    location.return_value.snowflake_stage_path = "s3://bucket/folder/"
+    iter_file_path_pattern.side_effect = lambda **kwargs: (
+        File(path=f"s3://bucket/folder/{i}.csv") for i in range(1001)
+    )
+    hook.return_value.run.return_value = [("s3://bucket/folder/0.csv", "LOADED")]
+    dp = SnowflakeDataProvider(
+        dataset=Table(name="some_table", metadata=Metadata(database="DB", schema="SCHEMA")),
+        transfer_mode=TransferMode.NATIVE,
+        transfer_params=SnowflakeOptions(storage_integration="integration", validation_mode="RETURN_ERRORS"),
+    )
+    source_file = File(path="s3://bucket/folder/", conn_id="aws_default", filetype=FileType.CSV)
+
+    with dp:
+        for _ in range(2):
+            dp.load_file_to_table_natively(source_file=source_file, target_table=dp.dataset)
+        drop_stage.assert_not_called()
+
+    create_stage.assert_called_once()
+    drop_stage.assert_called_once_with(create_stage.return_value)
+    statements = [call.args[0] for call in hook.return_value.run.call_args_list[:4]]
+    first_batch = ", ".join(f"'{i}.csv'" for i in range(1000))
+    assert statements == [
+        f"COPY INTO DB.SCHEMA.some_table FROM @DB.SCHEMA.stage_test FILES = ({first_batch}) "
+        "VALIDATION_MODE='RETURN_ERRORS'",
+        f"COPY INTO DB.SCHEMA.some_table FROM @DB.SCHEMA.stage_test FILES = ({first_batch})",
+        "COPY INTO DB.SCHEMA.some_table FROM @DB.SCHEMA.stage_test FILES = ('1000.csv') "
+        "VALIDATION_MODE='RETURN_ERRORS'",
+        "COPY INTO DB.SCHEMA.some_table FROM @DB.SCHEMA.stage_test FILES = ('1000.csv')",
+    ]
+
+
+@mock.patch.object(SnowflakeStage, "_create_unique_name", return_value="stage_test")
+@mock.patch.object(SnowflakeDataProvider, "run_sql")
+@mock.patch.object(SnowflakeDataProvider, "drop_table")
+@mock.patch.object(SnowflakeDataProvider, "hook", new_callable=mock.PropertyMock)
+def test_load_dataframe_through_internal_stage(hook, drop_table, run_sql, _create_unique_name):
+    """Test that the table is created from the Arrow schema of the dataframe, and that the dataframe is loaded from
+    parquet files uploaded in parallel to a temporary internal stage by a single COPY INTO"""
+    connection = hook.return_value.get_conn.return_value
+    connection.database, connection.schema = "DB", "SCHEMA"
+    cursor = connection.cursor.return_value
+    cursor.fetchall.return_value = [{"file": "part_00000.parquet", "status": "LOADED"}]
+    dp = SnowflakeDataProvider(
+        dataset=Table(name="some_table", metadata=Metadata(database="DB", schema="SCHEMA")),
+        transfer_mode=TransferMode.NONNATIVE,
+        transfer_params=SnowflakeOptions(put_workers=2),
+    )
+    df = pd.DataFrame(
+        {"id": [1, 2, 3], "Name": ["a", "b", "c"], "created": pd.date_range("2023-01-01", periods=3)}
+    )
+
+    dp.load_pandas_dataframe_to_table(df, dp.dataset, if_exists="replace")
+
+    drop_table.assert_called_once_with(dp.dataset)
+    run_sql.assert_called_once_with(
+        'CREATE TABLE IF NOT EXISTS DB.SCHEMA.some_table ("id" NUMBER(38, 0), "Name" VARCHAR, '
+        '"created" TIMESTAMP_NTZ)'
+    )
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert statements[0] == (
+        "CREATE TEMPORARY STAGE DB.SCHEMA.stage_test FILE_FORMAT=(TYPE=PARQUET, BINARY_AS_TEXT=FALSE)"
+    )
+    put_statements = sorted(statements[1:3])
+    assert [statement.split("'")[0] for statement in put_statements] == ["PUT ", "PUT "]
+    assert [pathlib.Path(statement.split("'")[1]).name for statement in put_statements] == [
+        "part_00000.parquet",
+        "part_00001.parquet",
+    ]
+    assert statements[3:] == [
+        'COPY INTO DB.SCHEMA.some_table ("id", "Name", "created") '
+        'FROM (SELECT $1:"id", $1:"Name", $1:"created" FROM @DB.SCHEMA.stage_test)'
+    ]
+    connection.close.assert_called_once()
+
+
+@mock.patch.object(SnowflakeDataProvider, "bulk_load_arrow_table")
+@mock.patch.object(SnowflakeDataProvider, "create_table")
+@mock.patch.object(SnowflakeDataProvider, "drop_table")
+@mock.patch.object(SnowflakeDataProvider, "create_schema_if_needed")
+def test_load_dataframe_to_table_replaces_the_table_once(
+    create_schema_if_needed, drop_table, create_table, bulk_load_arrow_table
+):
+    """Test that the table replaced by a dataframe is dropped and created once"""
+    table = Table(name="some_table", metadata=Metadata(database="DB", schema="SCHEMA"))
+    dp = SnowflakeDataProvider(dataset=table, transfer_mode=TransferMode.NONNATIVE)
+    df = pd.DataFrame({"id": [1, 2]})
+
+    assert dp.load_dataframe_to_table(df, table, if_exists="replace") == "DB.SCHEMA.some_table"
+
+    create_schema_if_needed.assert_called_once_with("SCHEMA")
+    drop_table.assert_called_once_with(table)
+    create_table.assert_called_once_with(table, dataframe=df)
+    bulk_load_arrow_table.assert_called_once()
@@ -1,13 +1,17 @@
 import pathlib
+from unittest import mock
 
 import pandas as pd
 import pytest
 import sqlalchemy
 from airflow.hooks.base import BaseHook
-
 from universal_transfer_operator.constants import TransferMode
 from universal_transfer_operator.data_providers.database.sqlite import SqliteDataProvider
+from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
+from universal_transfer_operator.integrations.base import TransferIntegrationOptions
+from universal_transfer_operator.settings import SQL_POOL_SIZE
+from universal_transfer_operator.utils import transfer_cache
 
 CWD = pathlib.Path(__file__).parent
 
@@ -162,3 +166,195 @@ def test_load_pandas_dataframe_to_table(dataset_table_fixture):
     assert len(rows) == 2
     assert rows[0] == (1,)
     assert rows[1] == (2,)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_read_table_in_chunks(dataset_table_fixture):
+    """Test that a table is read in dataframes of chunk_size rows and written back chunk by chunk"""
+    database, table = dataset_table_fixture
+    database.load_pandas_dataframe_to_table(pd.DataFrame(data={"id": [1, 2, 3, 4, 5]}), table)
+    database.transfer_params = TransferIntegrationOptions(chunk_size=2)
+
+    chunks = list(database.read())
+    assert [chunk["id"].tolist() for chunk in chunks] == [[1, 2], [3, 4], [5]]
+
+    with database:
+        for chunk in chunks:
+            database.write(chunk)
+    assert database.row_count(table) == 5
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+@pytest.mark.parametrize("partition_bounds", [None, (3, 6)], ids=["discovered_bounds", "given_bounds"])
+def test_read_table_in_partitions(dataset_table_fixture, partition_bounds):
+    """Test that a table is read by concurrent range queries, every row being read exactly once"""
+    database, table = dataset_table_fixture
+    database.load_pandas_dataframe_to_table(pd.DataFrame(data={"id": [1, 2, 3, 4, 5, 6, 7, 8, None]}), table)
+    database.transfer_params = TransferIntegrationOptions(
+        partition_column="id", partitions=3, partition_bounds=partition_bounds, chunk_size=2
+    )
+
+    dataframes = list(database.read())
+
+    assert {df.attrs["partition"] for df in dataframes} == {0, 1, 2}
+    rows = pd.concat(dataframes)["id"]
+    assert rows.isna().sum() == 1
+    assert sorted(rows.dropna().tolist()) == [1, 2, 3, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.integration
+def test_sqlalchemy_engine_is_shared_until_the_end_of_the_transfer():
+    """Test that the data providers of a connection share their engine until the end of the transfer"""
+    first = SqliteDataProvider(
+        dataset=Table("first", conn_id=DEFAULT_CONN_ID), transfer_mode=TransferMode.NONNATIVE
+    )
+    second = SqliteDataProvider(
+        dataset=Table("second", conn_id=DEFAULT_CONN_ID), transfer_mode=TransferMode.NONNATIVE
+    )
+
+    with mock.patch.object(sqlalchemy.engine.base.Engine, "dispose") as mock_dispose:
+        with transfer_cache():
+            engine = first.sqlalchemy_engine
+            assert second.sqlalchemy_engine is engine
+            assert second.hook is first.hook
+            assert engine.pool.size() == SQL_POOL_SIZE
+            mock_dispose.assert_not_called()
+        mock_dispose.assert_called_once()
+    assert first.sqlalchemy_engine is not engine
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_csv_file_in_chunks(dataset_table_fixture):
+    """Test that a csv file is loaded to a table one chunk of rows at a time"""
+    database, table = dataset_table_fixture
+    csv_file = File(path=str(CWD / "../../data/sample.csv"))
+
+    with mock.patch.object(
+        database, "load_pandas_dataframe_to_table", wraps=database.load_pandas_dataframe_to_table
+    ) as load_dataframe:
+        database.load_file_to_table_using_pandas(input_file=csv_file, output_table=table, chunk_size=2)
+
+    assert [len(call.args[0]) for call in load_dataframe.call_args_list] == [2, 1]
+    assert [call.kwargs["if_exists"] for call in load_dataframe.call_args_list] == ["replace", "append"]
+    assert database.row_count(table) == 3
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_pandas_dataframe_to_table_in_bulk(dataset_table_fixture):
+    """Test that dataframes are inserted in a single transaction, creating the indexes of an empty table after the
+    rows and restoring the settings of the connection, with the journal mode of the database file unchanged"""
+    database, table = dataset_table_fixture
+    database.run_sql(f"CREATE TABLE {table.name} (id INTEGER, created TIMESTAMP)")
+    database.run_sql(f"CREATE INDEX {table.name}_id ON {table.name} (id)")
+    journal_mode = database.run_sql("PRAGMA journal_mode", handler=lambda x: x.fetchall())
+
+    dataframe = pd.DataFrame({"id": [1, None], "created": pd.to_datetime(["2023-01-02 10:00:00", None])})
+    database.load_pandas_dataframe_to_table(dataframe, table, if_exists="append", chunk_size=1)
+
+    rows = database.run_sql(f"SELECT * FROM {table.name}", handler=lambda x: x.fetchall())
+    assert rows == [(1, "2023-01-02 10:00:00.000000"), (None, None)]
+    indexes = database.run_sql(
+        f"SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = '{table.name}'",
+        handler=lambda x: x.fetchall(),
+    )
+    assert indexes == [(f"{table.name}_id",)]
+    assert database.run_sql("PRAGMA journal_mode", handler=lambda x: x.fetchall()) == journal_mode
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+            "transfer_mode": TransferMode.NATIVE,
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_local_csv_file_natively(dataset_table_fixture):
+    """Test that local csv files are loaded without being parsed by pandas"""
+    database, table = dataset_table_fixture
+    csv_file = File(path=str(CWD / "../../data/sample.csv"))
+    assert database.is_native_path_available(source_dataset=csv_file)
+
+    with mock.patch.object(File, "iter_dataframes") as iter_dataframes:
+        database.load_file_to_table(input_file=csv_file, output_table=table)
+
+    iter_dataframes.assert_not_called()
+    rows = database.run_sql(f"SELECT * FROM {table.name} ORDER BY id", handler=lambda x: x.fetchall())
+    assert rows == [(1, "First"), (2, "Second"), (3, "Third with unicode पांचाल")]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "dataset_table_fixture",
+    [
+        {
+            "dataset": "SqliteDataProvider",
+        },
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_transfer_table_of_same_connection_natively(dataset_table_fixture):
+    """Test that a table is transferred to a table of the same connection inside the database, created from the
+    source table when replaced and appended to otherwise"""
+    database, table = dataset_table_fixture
+    database.load_pandas_dataframe_to_table(pd.DataFrame(data={"id": [1, 2]}), table)
+    source = SqliteDataProvider(dataset=table, transfer_mode=TransferMode.NATIVE)
+    destination_table = Table(name=f"{table.name}_copy", conn_id=table.conn_id)
+    destination = SqliteDataProvider(dataset=destination_table, transfer_mode=TransferMode.NATIVE)
+    assert destination.is_native_path_available(source_dataset=table)
+
+    try:
+        with mock.patch.object(pd, "read_sql") as read_sql:
+            for if_exists in ["replace", "append"]:
+                destination.if_exists = if_exists
+                for source_ref in source.read():
+                    assert destination.write(source_ref) == destination_table.name
+        read_sql.assert_not_called()
+        assert database.row_count(destination_table) == 4
+    finally:
+        database.drop_table(destination_table)
@@ -1,5 +1,11 @@
+import os
+from unittest import mock
+
+import pytest
+
 from universal_transfer_operator.constants import TransferMode
 from universal_transfer_operator.data_providers.filesystem.aws.s3 import S3DataProvider
+from universal_transfer_operator.data_providers.filesystem.google.cloud.gcs import GCSDataProvider
 from universal_transfer_operator.datasets.file.base import File
 
 
@@ -9,3 +15,95 @@ def test_transfer_config_args():
     dataset = File(path="s3://tmp/test.csv")
     provider = S3DataProvider(dataset=dataset, transfer_mode=TransferMode.NONNATIVE)
     assert provider.transfer_config_args == {}
+
+
+@mock.patch("universal_transfer_operator.data_providers.filesystem.aws.s3.S3Hook")
+def test_copy_s3_object_is_server_side(mock_hook):
+    """Test that S3 to S3 native transfers use a managed server side copy"""
+    mock_hook.return_value.parse_s3_url.side_effect = lambda path: tuple(path[len("s3://") :].split("/", 1))
+    source = S3DataProvider(dataset=File(path="s3://source/folder/"), transfer_mode=TransferMode.NATIVE)
+    destination = S3DataProvider(
+        dataset=File(path="s3://destination/folder/"), transfer_mode=TransferMode.NATIVE
+    )
+
+    destination_path = destination.copy_s3_object(
+        source_location=source,
+        source_path="s3://source/folder/sample.csv",
+        destination_path=destination.get_destination_path("s3://source/folder/sample.csv"),
+    )
+
+    assert destination_path == "s3://destination/folder/sample.csv"
+    _, kwargs = mock_hook.return_value.conn.copy.call_args
+    assert kwargs["CopySource"] == {"Bucket": "source", "Key": "folder/sample.csv"}
+    assert kwargs["Bucket"] == "destination"
+    assert kwargs["Key"] == "folder/sample.csv"
+
+
+@mock.patch("universal_transfer_operator.data_providers.filesystem.google.cloud.gcs.GCSHook")
+@mock.patch("universal_transfer_operator.data_providers.filesystem.aws.s3.S3Hook")
+def test_transfer_from_gcs_cleans_up_temp_file(mock_s3_hook, mock_gcs_hook):
+    """Test that GCS to S3 native transfers remove the temporary file once it is uploaded"""
+    mock_s3_hook.return_value.parse_s3_url.side_effect = lambda path: tuple(
+        path[len("s3://") :].split("/", 1)
+    )
+    blob = mock_gcs_hook.return_value.get_conn.return_value.bucket.return_value.get_blob.return_value
+    blob.size = 10
+    source = GCSDataProvider(dataset=File(path="gs://source/folder/"), transfer_mode=TransferMode.NATIVE)
+    destination = S3DataProvider(
+        dataset=File(path="s3://destination/folder/", extra={"transfer_config_args": {"max_concurrency": 4}}),
+        transfer_mode=TransferMode.NATIVE,
+    )
+
+    destination_path = destination.transfer_using_hook(
+        source_location=source,
+        source_path="gs://source/folder/sample.csv",
+        destination_path=destination.get_destination_path("gs://source/folder/sample.csv"),
+    )
+
+    assert destination_path == "s3://destination/folder/sample.csv"
+    (tmp_file,), _ = blob.download_to_filename.call_args
+    _, kwargs = mock_s3_hook.return_value.conn.upload_file.call_args
+    assert kwargs["Filename"] == tmp_file
+    assert kwargs["Key"] == "folder/sample.csv"
+    assert kwargs["Config"].max_request_concurrency == 4
+    assert not os.path.exists(tmp_file)
+
+
+@mock.patch("universal_transfer_operator.data_providers.filesystem.aws.s3.S3Hook")
+def test_iter_paths_yields_listing_pages_in_order(mock_hook):
+    """Test that paths are yielded page by page, in the listing order"""
+    mock_hook.return_value.parse_s3_url.return_value = ("bucket", "folder/")
+    paginator = mock_hook.return_value.conn.get_paginator.return_value
+    paginator.paginate.return_value = iter(
+        [
+            {"Contents": [{"Key": "folder/1.csv"}, {"Key": "folder/2.csv"}]},
+            {"Contents": [{"Key": "folder/3.csv"}]},
+            {},
+        ]
+    )
+    provider = S3DataProvider(dataset=File(path="s3://bucket/folder/"), transfer_mode=TransferMode.NONNATIVE)
+
+    assert list(provider.iter_paths()) == [
+        "s3://bucket/folder/1.csv",
+        "s3://bucket/folder/2.csv",
+        "s3://bucket/folder/3.csv",
+    ]
+    paginator.paginate.assert_called_once_with(Bucket="bucket", Prefix="folder/")
+
+
+@mock.patch("universal_transfer_operator.data_providers.filesystem.aws.s3.S3Hook")
+def test_iter_paths_raises_listing_errors(mock_hook):
+    """Test that an error while listing a page is raised after the paths of the previous pages"""
+
+    def pages(**kwargs):
+        yield {"Contents": [{"Key": "folder/1.csv"}]}
+        raise ValueError("listing failed")
+
+    mock_hook.return_value.parse_s3_url.return_value = ("bucket", "folder/")
+    mock_hook.return_value.conn.get_paginator.return_value.paginate.side_effect = pages
+    provider = S3DataProvider(dataset=File(path="s3://bucket/folder/"), transfer_mode=TransferMode.NONNATIVE)
+
+    paths = provider.iter_paths()
+    assert next(paths) == "s3://bucket/folder/1.csv"
+    with pytest.raises(ValueError, match="listing failed"):
+        next(paths)
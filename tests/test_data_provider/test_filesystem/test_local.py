@@ -1,13 +1,19 @@
+import io
 import os
 import pathlib
 import shutil
 import uuid
+from unittest import mock
 
+import pandas as pd
 import pytest
-
-from universal_transfer_operator.constants import TransferMode
+from universal_transfer_operator.constants import FileType, TransferMode
+from universal_transfer_operator.data_providers.base import DataStream
+from universal_transfer_operator.data_providers.filesystem import resolve_file_path_pattern
 from universal_transfer_operator.data_providers.filesystem.local import LocalDataProvider
 from universal_transfer_operator.datasets.file.base import File
+from universal_transfer_operator.datasets.file.types.json import _JSONArrayReader
+from universal_transfer_operator.integrations.base import TransferIntegrationOptions
 
 CWD = pathlib.Path(__file__).parent
 DATA_DIR = str(CWD) + "/../../data/"
@@ -57,7 +63,244 @@ def test_get_paths_with_local_dir(local_dir):  # skipcq: PYL-W0612
     assert sorted(location.paths) == [LOCAL_DIR_FILE_1, LOCAL_DIR_FILE_2]
 
 
+def test_resolved_files_carry_listing_metadata(local_dir):  # skipcq: PYL-W0612
+    """Test that the files resolved from a folder know their size without another call to the location"""
+    files = resolve_file_path_pattern(File(path=LOCAL_DIR))
+    with mock.patch.object(File, "location", new_callable=mock.PropertyMock) as location:
+        assert sorted((file.path, file.size, file.exists()) for file in files) == [
+            (LOCAL_DIR_FILE_1, 11, True),
+            (LOCAL_DIR_FILE_2, 11, True),
+        ]
+    location.assert_not_called()
+
+
 def test_file_pattern():
     """Test if the file path is a pattern(eg. s3://bucket/folder or /folder/sample_* etc."""
     for file_obj, response in LOCAL_FILE_PATTERN_WITH_RESPONSE:
         assert File(path=file_obj).is_pattern() is response
+
+
+def test_read_opens_files_lazily(local_dir):  # skipcq: PYL-W0612
+    """Test that files of a folder are only opened when their stream is consumed"""
+    dataset = File(path=LOCAL_DIR)
+    location = LocalDataProvider(dataset=dataset, transfer_mode=TransferMode.NONNATIVE)
+    with mock.patch.object(
+        location, "_open_remote_file", wraps=location._open_remote_file
+    ) as open_remote_file:
+        data_streams = list(location.read())
+        open_remote_file.assert_not_called()
+        assert [data_stream.remote_obj_buffer.read() for data_stream in data_streams] == [b"Test String"] * 2
+        assert open_remote_file.call_count == 2
+
+
+def test_native_copy_between_local_folders(local_dir):  # skipcq: PYL-W0612
+    """Test that local to local native transfers copy all the files of the source folder"""
+    destination_dir = f"/tmp/{uuid.uuid4()}/"
+    source_dataset = File(path=LOCAL_DIR)
+    location = LocalDataProvider(dataset=File(path=destination_dir), transfer_mode=TransferMode.NATIVE)
+    assert location.is_native_path_available(source_dataset=source_dataset)
+
+    try:
+        destination_paths = location.write(
+            DataStream(
+                actual_file=source_dataset, actual_filename=pathlib.Path(""), remote_obj_buffer=io.BytesIO()
+            )
+        )
+        assert sorted(destination_paths) == [
+            os.path.join(destination_dir, "file_1.txt"),
+            os.path.join(destination_dir, "file_2.txt"),
+        ]
+        for destination_path in destination_paths:
+            with open(destination_path) as destination_file:
+                assert destination_file.read() == "Test String"
+    finally:
+        shutil.rmtree(destination_dir, ignore_errors=True)
+
+
+def test_sync_between_local_folders(local_dir):  # skipcq: PYL-W0612
+    """Test that sync only copies the new files and deletes the files which aren't in the source"""
+    destination_dir = f"/tmp/{uuid.uuid4()}/"
+    os.mkdir(destination_dir)
+    shutil.copyfile(LOCAL_DIR_FILE_1, os.path.join(destination_dir, "file_1.txt"))
+    with open(os.path.join(destination_dir, "extra.txt"), "w") as extra_file:
+        extra_file.write("Extra")
+    source = LocalDataProvider(dataset=File(path=LOCAL_DIR), transfer_mode=TransferMode.NATIVE)
+    location = LocalDataProvider(
+        dataset=File(path=destination_dir),
+        transfer_mode=TransferMode.NATIVE,
+        transfer_params=TransferIntegrationOptions(sync=True, sync_delete=True),
+    )
+
+    try:
+        assert location.sync(source) == {"copied": 1, "skipped": 1, "deleted": 1}
+        assert sorted(os.listdir(destination_dir)) == ["file_1.txt", "file_2.txt"]
+        assert location.sync(source) == {"copied": 0, "skipped": 2, "deleted": 0}
+    finally:
+        shutil.rmtree(destination_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("transfer_mode", [TransferMode.NATIVE, TransferMode.NONNATIVE])
+def test_sync_keeps_the_relative_paths_of_files(tmp_path, transfer_mode):
+    """Test that files of different folders with the same name are synced to their own path, so that the sync
+    converges"""
+    for folder in ["a", "b"]:
+        (tmp_path / "source" / folder).mkdir(parents=True)
+        (tmp_path / "source" / folder / "x.txt").write_text(folder)
+    source = LocalDataProvider(dataset=File(path=str(tmp_path / "source")), transfer_mode=transfer_mode)
+    location = LocalDataProvider(
+        dataset=File(path=str(tmp_path / "destination")),
+        transfer_mode=transfer_mode,
+        transfer_params=TransferIntegrationOptions(sync=True),
+    )
+
+    assert location.sync(source) == {"copied": 2, "skipped": 0, "deleted": 0}
+    assert (tmp_path / "destination" / "a" / "x.txt").read_text() == "a"
+    assert (tmp_path / "destination" / "b" / "x.txt").read_text() == "b"
+    assert location.sync(source) == {"copied": 0, "skipped": 2, "deleted": 0}
+
+
+@pytest.mark.parametrize("filetype", ["csv", "json", "ndjson", "parquet"])
+def test_write_dataframe_chunks_to_a_single_file(tmp_path, filetype):
+    """Test that the dataframes written during a transfer are appended to the same file"""
+    path = str(tmp_path / f"table.{filetype}")
+    location = LocalDataProvider(dataset=File(path=path), transfer_mode=TransferMode.NONNATIVE)
+
+    with location:
+        for chunk in [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3]})]:
+            assert location.write(chunk) == path
+
+    mode = "rb" if filetype == "parquet" else "r"
+    with open(path, mode) as stream:
+        assert File(path=path).type.export_to_dataframe(stream)["id"].tolist() == [1, 2, 3]
+
+
+def test_write_dataframe_partitions_to_a_file_each(tmp_path):
+    """Test that the partitions of a table are written to their own file with file_per_partition"""
+    path = str(tmp_path / "table.csv")
+    location = LocalDataProvider(
+        dataset=File(path=path),
+        transfer_mode=TransferMode.NONNATIVE,
+        transfer_params=TransferIntegrationOptions(file_per_partition=True),
+    )
+    partitions = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3]}), pd.DataFrame({"id": [4]})]
+    for partition, df in zip([0, 1, 0], partitions):
+        df.attrs["partition"] = partition
+
+    with location:
+        written = [location.write(df) for df in partitions]
+
+    first_file, second_file = str(tmp_path / "table-part-00000.csv"), str(tmp_path / "table-part-00001.csv")
+    assert written == [first_file, second_file, first_file]
+    assert pd.read_csv(tmp_path / "table-part-00000.csv")["id"].tolist() == [1, 2, 4]
+    assert pd.read_csv(tmp_path / "table-part-00001.csv")["id"].tolist() == [3]
+
+
+def test_read_parquet_file_row_groups_matching_filters(tmp_path):
+    """Test that only the columns and row groups of a parquet file needed by the filters are read"""
+    path = str(tmp_path / "table.parquet")
+    location = LocalDataProvider(dataset=File(path=path), transfer_mode=TransferMode.NONNATIVE)
+    with location:
+        for start in range(0, 30, 10):
+            location.write(
+                pd.DataFrame({"id": range(start, start + 10), "name": [str(i) for i in range(10)]})
+            )
+
+    with mock.patch("pyarrow.parquet.ParquetFile.iter_batches", autospec=True) as iter_batches:
+        iter_batches.side_effect = lambda *args, **kwargs: iter([])
+        File(path=path).export_to_dataframe(filters=[("id", ">=", 12), ("id", "<", 15)])
+    assert iter_batches.call_args.kwargs["row_groups"] == [1]
+
+    df = File(path=path).export_to_dataframe(columns=["name"], filters=[("id", "in", [12, 25])])
+    assert df.to_dict("list") == {"name": ["2", "5"]}
+    assert len(File(path=path).export_to_dataframe(nrows=12)) == 12
+
+
+def test_read_nested_ndjson_file_like_json_normalize(tmp_path):
+    """Test that ndjson files parsed by pyarrow are flattened like pandas json_normalize does"""
+    path = tmp_path / "nested.ndjson"
+    path.write_text(
+        '{"id": 1, "created": "2023-01-01", "address": {"city": "Paris", "geo": {"lat": 1.5}}, "tags": ["a"]}\n'
+        '{"id": 2, "address": {"city": "Lyon"}}\n'
+    )
+
+    df = File(path=str(path)).export_to_dataframe()
+
+    expected = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "created": ["2023-01-01", None],
+            "address.city": ["Paris", "Lyon"],
+            "address.geo.lat": [1.5, None],
+            "tags": [["a"], None],
+        }
+    )
+    pd.testing.assert_frame_equal(pd.DataFrame(df), expected)
+
+
+def test_read_json_array_incrementally(tmp_path):
+    """Test that the records of a json array are read in chunks and only up to nrows when sampling it"""
+    path = tmp_path / "records.json"
+    path.write_text('[{"id": 1}, {"id": 2},\n {"id": 3}, {"id": 4}, {"id": 5}]')
+    file = File(path=str(path))
+
+    assert [df["id"].tolist() for df in file.iter_dataframes(chunk_rows=2)] == [[1, 2], [3, 4], [5]]
+    # The records after the sampled ones aren't parsed
+    path.write_text('[{"id": 1}, {"id": 2}, {"id": ')
+    assert file.export_to_dataframe(nrows=2)["id"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("mode", ["r", "rb"])
+def test_read_json_array_with_a_number_split_between_blocks(mode):
+    """Test that a number cut by the end of a block, like ``12.`` of ``12.5``, is read from the next block"""
+    document = "[1,   12.5, 3]"
+    stream = io.StringIO(document) if mode == "r" else io.BytesIO(document.encode())
+    # The first block ends after the decimal point
+    reader = _JSONArrayReader(stream, block_size=9)
+    assert reader.skip_to("[")
+    assert list(reader.elements()) == ["1", "12.5", "3"]
+
+
+def test_convert_csv_file_to_parquet(tmp_path):
+    """Test that a file written to a dataset of another file type is converted through an Arrow table"""
+    source = tmp_path / "sample.csv"
+    source.write_text("id,name\n1,a\n2,b\n")
+    path = str(tmp_path / "sample.parquet")
+    location = LocalDataProvider(dataset=File(path=path), transfer_mode=TransferMode.NONNATIVE)
+
+    with mock.patch("pandas.read_csv") as read_csv:
+        written = location.write(
+            DataStream(
+                opener=lambda: open(source), actual_filename=source, actual_file=File(path=str(source))
+            )
+        )
+
+    read_csv.assert_not_called()
+    assert written == path
+    assert pd.read_parquet(path).to_dict("list") == {"id": [1, 2], "name": ["a", "b"]}
+
+
+def test_converted_files_are_closed_once_written(tmp_path):
+    """Test that the files converted to their own destination file aren't kept open until the end of the transfer"""
+    sources = []
+    for name in ["first", "second"]:
+        source = tmp_path / f"{name}.csv"
+        source.write_text("id\n1\n")
+        sources.append(source)
+    destination = tmp_path / "destination"
+    destination.mkdir()
+    location = LocalDataProvider(
+        dataset=File(path=f"{destination}/", filetype=FileType.PARQUET), transfer_mode=TransferMode.NONNATIVE
+    )
+
+    with location:
+        for source in sources:
+            written = location.write(
+                DataStream(
+                    opener=lambda source=source: open(source),
+                    actual_filename=source,
+                    actual_file=File(path=str(source)),
+                )
+            )
+            assert written == str(destination / f"{source.stem}.parquet")
+            assert pd.read_parquet(written)["id"].tolist() == [1]
+        assert not location._dataframe_files
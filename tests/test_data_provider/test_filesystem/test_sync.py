@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+from universal_transfer_operator.constants import FileLocation
+from universal_transfer_operator.data_providers.filesystem.sync import (
+    ListedFile,
+    diff_listings,
+    is_up_to_date,
+)
+from universal_transfer_operator.datasets.file.base import FileMetadata
+
+NOW = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def test_diff_listings():
+    """Test that sorted listings are split into files to copy, files up to date and extra destination files"""
+    source = [
+        ListedFile(key="a.csv", path="s3://source/a.csv", metadata=FileMetadata(size=1)),
+        ListedFile(key="b.csv", path="s3://source/b.csv", metadata=FileMetadata(size=2)),
+        ListedFile(key="d.csv", path="s3://source/d.csv", metadata=FileMetadata(size=4)),
+    ]
+    destination = [
+        ListedFile(key="b.csv", path="gs://destination/b.csv", metadata=FileMetadata(size=2)),
+        ListedFile(key="c.csv", path="gs://destination/c.csv", metadata=FileMetadata(size=3)),
+        ListedFile(key="d.csv", path="gs://destination/d.csv", metadata=FileMetadata(size=5)),
+    ]
+
+    result = diff_listings(
+        source, destination, is_up_to_date=lambda source, destination: source.size == destination.size
+    )
+
+    assert result.to_copy == ["s3://source/a.csv", "s3://source/d.csv"]
+    assert result.skipped == ["s3://source/b.csv"]
+    assert result.extra == ["gs://destination/c.csv"]
+
+
+def test_is_up_to_date_compares_s3_etag_with_gcs_md5():
+    """Test that the MD5 ETag of S3 objects is compared with the MD5 hash of GCS objects"""
+    s3_file = FileMetadata(size=11, etag="b10a8db164e0754105b7a99be72e3fe5", last_modified=NOW)
+    same_gcs_file = FileMetadata(
+        size=11, md5="sQqNsWTgdUEFt6mb5y4/5Q==", last_modified=NOW - timedelta(days=1)
+    )
+    changed_gcs_file = FileMetadata(size=11, md5="XrY7u+Ae7tCTyyK7j1rNww==", last_modified=NOW)
+
+    assert is_up_to_date(s3_file, same_gcs_file, FileLocation.S3, FileLocation.GS)
+    assert not is_up_to_date(s3_file, changed_gcs_file, FileLocation.S3, FileLocation.GS)
+
+
+def test_is_up_to_date_falls_back_to_modification_time():
+    """Test that files without checksums are up to date when the destination is more recent"""
+    source = FileMetadata(size=11, last_modified=NOW)
+
+    assert is_up_to_date(source, FileMetadata(size=11, last_modified=NOW), FileLocation.SFTP, FileLocation.S3)
+    assert not is_up_to_date(
+        source,
+        FileMetadata(size=11, last_modified=NOW - timedelta(seconds=1)),
+        FileLocation.SFTP,
+        FileLocation.S3,
+    )
+    assert not is_up_to_date(
+        source, FileMetadata(size=12, last_modified=NOW), FileLocation.SFTP, FileLocation.S3
+    )
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pandas as pd
+import pytest
+from universal_transfer_operator import settings
+from universal_transfer_operator.datasets.dataframe.pandas import (
+    LazyPandasDataframe,
+    PandasDataframe,
+    cleanup_dataframe_storage,
+    convert_dataframe_to_file,
+)
+from universal_transfer_operator.datasets.file.base import File, FileMetadata
+
+
+def test_dataframe_serialized_in_db_keeps_dtypes():
+    """Test that the dataframes stored in the metadata DB are deserialized with the same dtypes and index"""
+    df = PandasDataframe(
+        {
+            "id": pd.array([1, None], dtype="Int64"),
+            "created": pd.to_datetime(["2023-01-01", "2023-01-02"]).tz_localize("UTC"),
+            "name": ["a", None],
+        },
+        index=[10, 20],
+    )
+
+    serialized = df.serialize()
+
+    assert serialized["format"] == "arrow-ipc"
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(PandasDataframe.deserialize(serialized, PandasDataframe.version)), pd.DataFrame(df)
+    )
+
+
+def test_dataframe_serialized_in_db_as_json():
+    """Test that the dataframes serialized as json, by previous versions or when pyarrow can't convert them, are
+    deserialized"""
+    df = PandasDataframe({"value": [1, "a"]})
+
+    serialized = df.serialize()
+
+    assert "format" not in serialized
+    assert PandasDataframe.deserialize(serialized, 1)["value"].tolist() == [1, "a"]
+
+
+@mock.patch("universal_transfer_operator.datasets.dataframe.pandas.convert_dataframe_to_file")
+@mock.patch("universal_transfer_operator.datasets.dataframe.pandas.dataframe_to_arrow")
+def test_dataframe_stored_in_object_store_isnt_converted_to_arrow(
+    dataframe_to_arrow, convert_dataframe_to_file
+):
+    """Test that the dataframes too large for the metadata DB aren't converted to an Arrow table to be measured"""
+    df = PandasDataframe({"id": range(settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024)})
+
+    assert df.serialize() == convert_dataframe_to_file.return_value.to_json.return_value
+    dataframe_to_arrow.assert_not_called()
+
+
+@mock.patch.object(settings, "DATAFRAME_STORAGE_TTL", 3600)
+@mock.patch.object(settings, "DATAFRAME_STORAGE_URL", "s3://bucket/xcom")
+@mock.patch.object(settings, "DATAFRAME_STORAGE_CONN_ID", "aws_default")
+@mock.patch.object(File, "create_from_dataframe")
+@mock.patch.object(File, "location", new_callable=mock.PropertyMock)
+def test_identical_dataframes_are_stored_once(location, create_from_dataframe):
+    """Test that the dataframes stored in the object store are named after their content and uploaded once, until
+    half of their time to live is elapsed"""
+    location.return_value.iter_paths_with_metadata.return_value = iter([])
+    file = convert_dataframe_to_file(pd.DataFrame({"id": [1, 2]}))
+    assert create_from_dataframe.call_count == 1
+
+    now = datetime.now(timezone.utc)
+    for age, uploads in [(timedelta(minutes=10), 1), (timedelta(minutes=40), 2)]:
+        location.return_value.iter_paths_with_metadata.return_value = iter(
+            [(file.path, FileMetadata(last_modified=now - age))]
+        )
+        assert convert_dataframe_to_file(pd.DataFrame({"id": [1, 2]})).path == file.path
+        assert create_from_dataframe.call_count == uploads
+    assert convert_dataframe_to_file(pd.DataFrame({"id": [1, 3]})).path != file.path
+
+
+@mock.patch.object(settings, "XCOM_LAZY_DATAFRAMES", True)
+@mock.patch.object(File, "export_to_dataframe")
+def test_dataframe_stored_in_object_store_is_loaded_on_access(export_to_dataframe):
+    """Test that the dataframes stored in the object store are only downloaded when accessed, and that some of their
+    columns can be read without downloading the whole dataframe"""
+    export_to_dataframe.return_value = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    file = File(path="s3://bucket/xcom/dataframe.parquet", conn_id="aws_default", is_dataframe=True)
+
+    df = PandasDataframe.deserialize(file.to_json(), PandasDataframe.version)
+
+    assert isinstance(df, LazyPandasDataframe)
+    assert df.serialize() == file.to_json()
+    df.load(columns=["id"])
+    export_to_dataframe.assert_called_once_with(columns=["id"])
+    assert not df.is_loaded
+
+    assert df.shape == (2, 2)
+    assert df["name"].tolist() == ["a", "b"]
+    assert export_to_dataframe.call_count == 2
+
+
+@mock.patch.object(settings, "DATAFRAME_STORAGE_CONN_ID", None)
+def test_cleanup_dataframe_storage_requires_a_conn_id():
+    """Test that the dataframe storage isn't cleaned up without the connection of the storage"""
+    with pytest.raises(ValueError, match="Missing conn_id"):
+        cleanup_dataframe_storage()
+
+
+@mock.patch.object(File, "export_to_dataframe")
+def test_dataframe_stored_in_object_store_is_downloaded_when_pulled(export_to_dataframe):
+    """Test that the dataframes stored in the object store are downloaded when pulled, unless lazy dataframes are
+    enabled"""
+    export_to_dataframe.return_value = pd.DataFrame({"id": [1, 2]})
+    file = File(path="s3://bucket/xcom/dataframe.parquet", conn_id="aws_default", is_dataframe=True)
+
+    df = PandasDataframe.deserialize(file.to_json(), PandasDataframe.version)
+
+    assert isinstance(df, pd.DataFrame)
+    assert (df + 1)["id"].tolist() == [2, 3]
@@ -1,9 +1,16 @@
+import time
+from unittest import mock
+
+import pytest
+
 from universal_transfer_operator.constants import FileType, TransferMode
 from universal_transfer_operator.data_providers.database.snowflake import SnowflakeOptions
 from universal_transfer_operator.datasets.file.base import File
 from universal_transfer_operator.datasets.table import Table
+from universal_transfer_operator.integrations.base import TransferIntegrationOptions
 from universal_transfer_operator.integrations.fivetran.fivetran import FivetranOptions
 from universal_transfer_operator.universal_transfer_operator import UniversalTransferOperator
+from universal_transfer_operator.utils import get_cached, get_connection, transfer_cache
 
 
 def test_option_class_loading_for_dict_to_fivetran_options_class():
@@ -38,3 +45,85 @@ def test_option_class_loading_for_dict_to_snowflake_options_class():
     )
     uto._populate_transfer_params()
     assert isinstance(uto.transfer_params, SnowflakeOptions)
+
+
+@mock.patch("universal_transfer_operator.universal_transfer_operator.create_dataprovider")
+def test_pipelined_transfer_keeps_read_order(mock_create_dataprovider):
+    """
+    Test that pipelined transfers return the destination references in the order the items were read,
+    even when the writes complete out of order
+    """
+    source, destination = mock.MagicMock(), mock.MagicMock()
+    source.read.return_value = iter([3, 1, 2])
+    destination.write.side_effect = lambda item: time.sleep(item / 100) or f"written_{item}"
+    mock_create_dataprovider.side_effect = [source, destination]
+
+    uto = UniversalTransferOperator(
+        task_id="pipelined_transfer",
+        source_dataset=File(path="/tmp/source/"),
+        destination_dataset=File(path="/tmp/destination/"),
+        transfer_params=TransferIntegrationOptions(pipelined=True, writer_workers=3, max_inflight=3),
+    )
+    assert uto.execute(context={}) == ["written_3", "written_1", "written_2"]
+
+
+@mock.patch("universal_transfer_operator.universal_transfer_operator.create_dataprovider")
+def test_pipelined_transfer_raises_first_failing_write(mock_create_dataprovider):
+    """
+    Test that pipelined transfers raise the error of the earliest failing item and stop reading the source
+    """
+    read_items = []
+
+    def read():
+        for item in range(10):
+            read_items.append(item)
+            yield item
+
+    def write(item):
+        if item in (1, 2):
+            raise ValueError(f"failed to write {item}")
+        return item
+
+    source, destination = mock.MagicMock(), mock.MagicMock()
+    source.read.side_effect = read
+    destination.write.side_effect = write
+    mock_create_dataprovider.side_effect = [source, destination]
+
+    uto = UniversalTransferOperator(
+        task_id="pipelined_transfer",
+        source_dataset=File(path="/tmp/source/"),
+        destination_dataset=File(path="/tmp/destination/"),
+        transfer_params=TransferIntegrationOptions(pipelined=True, max_inflight=2),
+    )
+    with pytest.raises(ValueError, match="failed to write 1"):
+        uto.execute(context={})
+    assert len(read_items) < 10
+
+
+@mock.patch("universal_transfer_operator.utils.BaseHook.get_connection")
+def test_connections_are_fetched_once_per_transfer(mock_get_connection):
+    """Test that the Airflow connections are memoised until the end of the transfer only"""
+    with transfer_cache():
+        assert get_connection("conn_id") is get_connection("conn_id")
+        get_connection("other_conn_id")
+    assert mock_get_connection.call_count == 2
+
+    get_connection("conn_id")
+    assert mock_get_connection.call_count == 3
+
+
+def test_cached_objects_can_be_created_from_other_cached_objects():
+    """Test that an object is created without holding the cache, e.g. an engine created from the cached hook"""
+    with transfer_cache():
+        hook = get_cached("hook", object)
+        engine = get_cached("engine", lambda: (get_cached("hook", object), object()))
+        assert engine[0] is hook
+        assert get_cached("engine", object) is engine
+
+
+def test_file_locations_are_memoised_per_extra():
+    """Test that files which only differ in their extra arguments don't share their data provider"""
+    with transfer_cache():
+        location = File(path="/tmp/sample.csv", extra={"a": 1, "b": 2}).location
+        assert File(path="/tmp/sample.csv", extra={"b": 2, "a": 1}).location is location
+        assert File(path="/tmp/sample.csv", extra={"a": 2}).location is not location